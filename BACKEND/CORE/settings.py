@@ -57,12 +57,14 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "api.profiling.QueryProfilingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "authorization.middleware.UserProfileMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -134,6 +136,76 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "tabh-default",
+    },
+    # Rendered anonymous list responses (see api/response_cache.py). LocMem
+    # evicts the least recently used entries past MAX_ENTRIES; use
+    # FileBasedCache, or DatabaseCache on a separate SQLite database, to
+    # share entries between worker processes.
+    "responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "tabh-responses",
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": 2000, "CULL_FREQUENCY": 10},
+    },
+}
+
+# Cache alias for anonymous GETs of the job, event, news feed and gallery
+# image lists; None disables it. Saves and deletes invalidate entries through
+# per-model generation counters (api/signals.py). Gallery view counts in
+# cached pages lag by up to the alias TIMEOUT.
+RESPONSE_CACHE = "responses"
+
+# Totals of limit/offset pages (api/counting.py): exact up to this many rows,
+# the database's estimate above it (responses then say "count_exact": false).
+# Counts are cached per filter until the model changes, or for the timeout.
+COUNT_EXACT_THRESHOLD = 1000
+COUNT_CACHE_TIMEOUT = 300
+
+# Gallery view counts are buffered in each process (cms/view_counts.py) and
+# written back in one UPDATE at most this often
+GALLERY_VIEW_COUNT_FLUSH_INTERVAL = 60  # seconds
+
+# Full-text search backend (see cms/search.py): "auto" picks SQLite FTS5 or
+# Postgres tsvector from the database vendor; anything else falls back to
+# icontains scans.
+SEARCH_BACKEND = "auto"
+
+# Per-request query/latency profiling (see api/profiling.py). Timings go to
+# the Server-Timing header, per-view histograms to /api/v1/profiling/ and
+# requests over the query threshold are logged as warnings.
+REQUEST_PROFILING = DEBUG
+REQUEST_PROFILING_QUERY_THRESHOLD = 50
+
+# Slow side effects of a request (emails, image processing) are queued in the
+# database and run by `manage.py run_worker` (see api/task_queue.py). Failed
+# tasks are retried with exponential backoff from the base delay. Queueing
+# needs a running worker: without BACKGROUND_TASK_WORKER=1 in the environment,
+# tasks run inline when the request's transaction commits.
+BACKGROUND_TASKS_EAGER = not os.environ.get("BACKGROUND_TASK_WORKER")
+BACKGROUND_TASK_RETRY_DELAY = 30  # seconds
+
+EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+DEFAULT_FROM_EMAIL = "alumni@vipstc.edu.in"
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "api.profiling": {"handlers": ["console"], "level": "WARNING"},
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -158,8 +230,13 @@ REST_FRAMEWORK = {
     # or allow read-only access for unauthenticated users.
 
       'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authorization.authentication.RoleClaimsJWTAuthentication',
     ),
+    "DEFAULT_PARSER_CLASSES": [
+        "api.uploads.BoundedJSONParser",
+        "rest_framework.parsers.FormParser",
+        "api.uploads.BoundedMultiPartParser",
+    ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
         # 'rest_framework_simplejwt.authentication.JWTAuthentication',
@@ -187,6 +264,26 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Uploads are stored once per distinct content, named by SHA-256 (see
+# cms/storage.py); run `manage.py gc_media` periodically to drop blobs that
+# no row references any more.
+STORAGES = {
+    "default": {"BACKEND": "cms.storage.ContentAddressedStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+# Multipart uploads are streamed to temporary files in 64 KB chunks and
+# rejected once a file passes UPLOAD_MAX_SIZE (see api/uploads.py), so memory
+# per upload stays at one chunk. Base64 images in JSON are decoded in memory
+# and therefore capped lower; JSON_BODY_MAX_SIZE bounds the whole body.
+FILE_UPLOAD_HANDLERS = [
+    "api.uploads.UploadSizeLimitHandler",
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
+UPLOAD_MAX_SIZE = 10 * 1024 * 1024
+BASE64_UPLOAD_MAX_SIZE = 5 * 1024 * 1024
+JSON_BODY_MAX_SIZE = 20 * 1024 * 1024
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
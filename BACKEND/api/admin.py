@@ -1,3 +1,16 @@
 from django.contrib import admin
+from django.utils import timezone
 
-# Register your models here.
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ['id', 'name', 'status', 'attempts', 'max_attempts', 'run_after', 'finished_at']
+    list_filter = ['status', 'name']
+    readonly_fields = ['created_at', 'finished_at', 'locked_by', 'locked_until', 'last_error']
+    actions = ['retry']
+
+    def retry(self, request, queryset):
+        queryset.update(status=Task.QUEUED, attempts=0, locked_until=None, run_after=timezone.now())
+    retry.short_description = "Retry selected tasks"
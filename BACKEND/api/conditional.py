@@ -0,0 +1,127 @@
+import functools
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.exceptions import APIException
+
+
+def collection_state(queryset, field):
+    """``(last modified, row count)`` of a queryset, in one aggregate query."""
+    state = queryset.order_by().aggregate(last_modified=Max(field), count=Count("pk"))
+    return state["last_modified"], state["count"]
+
+
+class CollectionVersion:
+    """
+    Validators for a list response: a strong ETag hashing ``key``, which must
+    change whenever the response body does, and an optional Last-Modified.
+
+    ``Last-Modified`` cannot see deletions, so clients should send
+    ``If-None-Match``; it takes precedence when both are present.
+    """
+
+    def __init__(self, key, last_modified=None):
+        if isinstance(key, str):
+            key = key.encode()
+        self.etag = f'"{hashlib.sha256(key).hexdigest()[:32]}"'
+        self.last_modified = last_modified
+
+    @classmethod
+    def from_states(cls, request, states):
+        """
+        Version of a response built from collections, given as
+        :func:`collection_state` results. The key is the absolute URL
+        (filters, ordering and pagination are all in the query string) and
+        the negotiated ``Accept`` with every collection's last modification
+        time and row count: edits move the time and deletions the count.
+        """
+        last_modified = max((modified for modified, _ in states if modified), default=None)
+        accept = request.META.get("HTTP_ACCEPT", "")
+        return cls(f"{request.build_absolute_uri()}|{accept}|{states!r}", last_modified)
+
+    def not_modified(self, request):
+        """A 304 response if the client's copy is current, otherwise ``None``."""
+        response = get_conditional_response(
+            request,
+            etag=self.etag,
+            last_modified=int(self.last_modified.timestamp()) if self.last_modified else None,
+        )
+        return self.add_headers(response) if response is not None else None
+
+    def add_headers(self, response):
+        response["ETag"] = self.etag
+        if self.last_modified:
+            response["Last-Modified"] = http_date(self.last_modified.timestamp())
+        # Let clients and proxies keep the body, but revalidate on every poll
+        response["Cache-Control"] = "no-cache"
+        return response
+
+
+class _NotModified(APIException):
+    status_code = 304
+
+    def __init__(self, response):
+        self.response = response
+
+
+class ConditionalListMixin:
+    """
+    Answers ``If-None-Match``/``If-Modified-Since`` on the ``list`` action
+    with a 304 before the page is queried or serialized, and adds ``ETag``
+    and ``Last-Modified`` to full responses.
+
+    The version is ``MAX(version_field)`` and ``COUNT`` over the view's
+    unfiltered queryset, one aggregate the index on ``version_field``
+    serves. Any save or delete in the table moves it, and filters are told
+    apart by the URL alone, so validating never runs a search or a filter.
+
+    ``version_field`` names the model's modification timestamp.
+    """
+
+    version_field = "updated_at"
+
+    def get_collection_states(self):
+        return [collection_state(self.get_queryset(), self.version_field)]
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.collection_version = None
+        if self.action == "list" and request.method in ("GET", "HEAD"):
+            self.collection_version = CollectionVersion.from_states(request, self.get_collection_states())
+            response = self.collection_version.not_modified(request)
+            if response is not None:
+                raise _NotModified(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        version = getattr(self, "collection_version", None)
+        if version is not None and response.status_code == 200:
+            version.add_headers(response)
+        return response
+
+
+def conditional_collection(get_states):
+    """
+    Function view counterpart of :class:`ConditionalListMixin`; apply below
+    ``@api_view``. ``get_states(request)`` returns the collection states.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            version = CollectionVersion.from_states(request, get_states(request))
+            response = version.not_modified(request)
+            if response is not None:
+                return response
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200:
+                version.add_headers(response)
+            return response
+        return wrapper
+    return decorator
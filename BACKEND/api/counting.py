@@ -0,0 +1,128 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import replace_query_param
+
+COUNT_CACHE_KEY = "count:{label}:{generation}:{signature}"
+# Bumped by api/signals.py on every save or delete of the model
+COUNT_GENERATION_KEY = "count:generation:{label}"
+
+
+def _generation(label):
+    return cache.get_or_set(COUNT_GENERATION_KEY.format(label=label), time.time_ns, None)
+
+
+def bump_count_generation(label):
+    """Retire every cached count over the model ``label``."""
+    try:
+        cache.incr(COUNT_GENERATION_KEY.format(label=label))
+    except ValueError:
+        # No generation stored yet, so nothing has been counted under one either
+        pass
+
+
+def filter_signature(queryset):
+    """Hash of the count query's SQL and parameters: equal filters, equal key."""
+    sql, params = queryset.order_by().query.sql_with_params()
+    return hashlib.sha256(f"{queryset.db}|{sql}|{params!r}".encode()).hexdigest()
+
+
+def estimate_count(queryset):
+    """
+    Row estimate from the database's statistics, or ``None`` without any:
+    the planner's estimate on Postgres, and the ``ANALYZE`` row count of
+    unfiltered tables on SQLite.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor == "postgresql":
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    if connection.vendor == "sqlite" and not queryset.query.has_filters():
+        with connection.cursor() as cursor:
+            # The table only exists once ANALYZE has run
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                return None
+            cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s", [queryset.model._meta.db_table])
+            row = cursor.fetchone()
+        # The first figure of every entry is the table's row count
+        return int(row[0].split()[0]) if row else None
+    return None
+
+
+def count_queryset(queryset):
+    """
+    Count ``queryset`` as cheaply as the result allows. Returns
+    ``(count, exact)``:
+
+    * up to ``COUNT_EXACT_THRESHOLD`` rows the count is exact, and costs a
+      ``COUNT(*)`` over at most that many rows;
+    * above it, the database's estimate is used where it has one (never
+      below the threshold, since that many rows were seen);
+    * otherwise the full ``COUNT(*)`` runs.
+
+    Results are cached per filter signature until the model is saved or
+    deleted, or ``COUNT_CACHE_TIMEOUT`` passes for writes that bypass signals.
+    """
+    label = queryset.model._meta.label_lower
+    key = COUNT_CACHE_KEY.format(
+        label=label, generation=_generation(label), signature=filter_signature(queryset),
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    threshold = getattr(settings, "COUNT_EXACT_THRESHOLD", 1000)
+    count = queryset.order_by()[: threshold + 1].count()
+    exact = True
+    if count > threshold:
+        estimate = estimate_count(queryset)
+        if estimate is not None:
+            count, exact = max(estimate, count), False
+        else:
+            count = queryset.count()
+
+    result = (count, exact)
+    cache.set(key, result, getattr(settings, "COUNT_CACHE_TIMEOUT", 300))
+    return result
+
+
+class CountingLimitOffsetPagination(LimitOffsetPagination):
+    """
+    ``LimitOffsetPagination`` whose total comes from :func:`count_queryset`.
+    Responses add ``count_exact``. With an estimated count, ``next`` is
+    offered whenever the page is full instead of being derived from it.
+    """
+
+    def get_count(self, queryset):
+        self.count, self.count_exact = count_queryset(queryset)
+        return self.count
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_exact = True
+        self.page = super().paginate_queryset(queryset, request, view)
+        return self.page
+
+    def get_next_link(self):
+        if self.count_exact or self.limit is None:
+            return super().get_next_link()
+        if len(self.page) < self.limit:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data["count_exact"] = self.count_exact
+        return response
@@ -0,0 +1,32 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from api.task_queue import Worker
+
+
+class Command(BaseCommand):
+    help = 'Run queued background tasks (registration emails, avatar shrinking, gallery image variants)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=4, help='Tasks run in parallel by this worker')
+        parser.add_argument(
+            '--visibility-timeout', type=int, default=300,
+            help='Seconds before a task claimed by a worker that died is run again',
+        )
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='Seconds to sleep when idle')
+        parser.add_argument('--once', action='store_true', help='Exit once no task is due')
+
+    def handle(self, *args, **options):
+        worker = Worker(
+            concurrency=options['concurrency'],
+            visibility_timeout=options['visibility_timeout'],
+            poll_interval=options['poll_interval'],
+        )
+        # Finish the running batch on Ctrl-C or SIGTERM, then exit
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: worker.stop())
+
+        self.stdout.write(f'🔧 Worker {worker.worker_id} running {options["concurrency"]} tasks at a time')
+        processed = worker.run(once=options['once'])
+        self.stdout.write(self.style.SUCCESS(f'✅ Ran {processed} tasks'))
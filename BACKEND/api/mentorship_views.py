@@ -20,7 +20,7 @@ def mentor_profiles(request):
     POST: Create mentor profile (apply to become mentor)
     """
     if request.method == 'GET':
-        mentors = MentorProfile.objects.filter(is_approved=True, is_active=True)
+        mentors = MentorProfile.objects.filter(is_approved=True, is_active=True).select_related('user')
         
         # Filter by expertise if provided
         expertise = request.GET.get('expertise')
@@ -115,7 +115,7 @@ def mentorship_requests(request):
         serializer = MentorshipRequestSerializer(data=request.data)
         if serializer.is_valid():
             # Check if mentor exists and is approved
-            mentor_id = request.data.get('mentor_id')
+            mentor_id = serializer.validated_data['mentor_id']
             try:
                 mentor_profile = MentorProfile.objects.get(user_id=mentor_id, is_approved=True)
                 if not mentor_profile.can_accept_more_mentees():
@@ -128,15 +128,26 @@ def mentorship_requests(request):
                     {'error': 'Mentor not found or not approved'}, 
                     status=status.HTTP_400_BAD_REQUEST
                 )
-            
-            # For testing without authentication, use a default user
-            if hasattr(request.user, 'id') and request.user.id:
-                serializer.save(mentee=request.user)
-            else:
-                # Use first available user for testing (replace with actual logic)
-                from django.contrib.auth.models import User
-                test_user = User.objects.first()
-                serializer.save(mentee=test_user)
+
+            with MentorProfile.capacity_guard():
+                # Only accepted requests use capacity; a request created as
+                # accepted takes its slot atomically, like an accept below
+                if not MentorProfile.record_status_change(
+                    mentor_id, None, serializer.validated_data.get('status', 'pending')
+                ):
+                    return Response(
+                        {'error': 'Mentor has reached maximum capacity'}, 
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                
+                # For testing without authentication, use a default user
+                if hasattr(request.user, 'id') and request.user.id:
+                    serializer.save(mentee=request.user)
+                else:
+                    # Use first available user for testing (replace with actual logic)
+                    from django.contrib.auth.models import User
+                    test_user = User.objects.first()
+                    serializer.save(mentee=test_user)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -161,19 +172,40 @@ def mentorship_request_detail(request, pk):
         return Response(serializer.data)
     
     elif request.method == 'PUT':
-        serializer = MentorshipRequestSerializer(mentorship_request, data=request.data, partial=True)
-        if serializer.is_valid():
-            # Handle status changes
-            new_status = request.data.get('status')
-            if new_status and new_status != mentorship_request.status:
-                if new_status == 'accepted':
-                    mentorship_request.responded_at = timezone.now()
-                    mentorship_request.started_at = timezone.now()
-                elif new_status == 'rejected':
-                    mentorship_request.responded_at = timezone.now()
-                elif new_status == 'completed':
-                    mentorship_request.completed_at = timezone.now()
-            
-            serializer.save()
-            return Response(serializer.data)
+        with MentorProfile.capacity_guard():
+            # Re-read under a row lock so concurrent updates of the same request
+            # cannot both count the same transition
+            mentorship_request = MentorshipRequest.objects.select_for_update().get(pk=pk)
+            old_status = mentorship_request.status
+
+            serializer = MentorshipRequestSerializer(mentorship_request, data=request.data, partial=True)
+            if serializer.is_valid():
+                # The counters follow the request's mentor, so it is fixed once sent
+                if serializer.validated_data.get('mentor_id', mentorship_request.mentor_id) != mentorship_request.mentor_id:
+                    return Response(
+                        {'error': 'The mentor of a request cannot be changed'}, 
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                if not MentorProfile.record_status_change(
+                    mentorship_request.mentor_id, old_status,
+                    serializer.validated_data.get('status', old_status),
+                ):
+                    return Response(
+                        {'error': 'Mentor has reached maximum capacity'}, 
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
+                # Handle status changes
+                new_status = request.data.get('status')
+                if new_status and new_status != mentorship_request.status:
+                    if new_status == 'accepted':
+                        mentorship_request.responded_at = timezone.now()
+                        mentorship_request.started_at = timezone.now()
+                    elif new_status == 'rejected':
+                        mentorship_request.responded_at = timezone.now()
+                    elif new_status == 'completed':
+                        mentorship_request.completed_at = timezone.now()
+                
+                serializer.save()
+                return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,221 @@
+import base64
+import datetime
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from .counting import CountingLimitOffsetPagination
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a fixed ordering tuple.
+
+    The cursor holds the ordering values of the last row of the previous page,
+    so every page is a single indexed range query with no COUNT(*) and no
+    OFFSET. The ordering must be total (end it with ``id``). NULLs sort
+    after every value in both directions.
+
+    Requests without a cursor get the first page of ``page_size`` rows.
+    Pages carry no ``count``, since only the page is read.
+    """
+
+    page_size = 24
+    max_page_size = 100
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, ordering):
+        self.ordering = list(ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+
+        self.nullable = self.nullable_fields(queryset.model)
+        queryset = queryset.order_by(*self.order_by_expressions())
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self.seek_filter(position))
+
+        # Fetch one extra row to learn whether there is a next page
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def nullable_fields(self, model):
+        nullable = set()
+        for term in self.ordering:
+            field = term.lstrip("-")
+            try:
+                if model._meta.get_field(field).null:
+                    nullable.add(field)
+            except FieldDoesNotExist:
+                # "pk" or an annotation
+                pass
+        return nullable
+
+    def order_by_expressions(self):
+        expressions = []
+        for term in self.ordering:
+            field = term.lstrip("-")
+            if field not in self.nullable:
+                expressions.append(term)
+            elif term.startswith("-"):
+                expressions.append(F(field).desc(nulls_last=True))
+            else:
+                expressions.append(F(field).asc(nulls_last=True))
+        return expressions
+
+    def seek_filter(self, position):
+        """
+        Build ``(a, b, c) < (x, y, z)`` in the direction of each ordering field
+        as ``a < x OR (a = x AND b < y) OR (a = x AND b = y AND c < z)``.
+        On nullable fields, rows past a value include the NULLs, and rows past
+        a NULL can only tie with it.
+        """
+        condition = Q()
+        equal = Q()
+        for term, value in zip(self.ordering, position):
+            field = term.lstrip("-")
+            lookup = "lt" if term.startswith("-") else "gt"
+            if value is None:
+                equal &= Q(**{f"{field}__isnull": True})
+                continue
+            after = Q(**{f"{field}__{lookup}": value})
+            if field in self.nullable:
+                after |= Q(**{f"{field}__isnull": True})
+            condition |= equal & after
+            equal &= Q(**{field: value})
+        return condition
+
+    def get_position(self, instance):
+        return [self._encode_value(getattr(instance, term.lstrip("-"))) for term in self.ordering]
+
+    @staticmethod
+    def _encode_value(value):
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            return value.isoformat()
+        if isinstance(value, (int, float, str)) or value is None:
+            return value
+        return str(value)
+
+    def encode_cursor(self, position):
+        payload = json.dumps(position, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii")
+
+    def decode_cursor(self, request, model):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            return [self._decode_value(model, term, value) for term, value in zip(self.ordering, position)]
+        except (TypeError, ValueError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def _decode_value(model, term, value):
+        """Check a cursor value against its ordering field, as the seek filter will use it."""
+        if value is None:
+            return None
+        if not isinstance(value, (int, float, str)) or isinstance(value, bool):
+            raise TypeError(f"Unexpected cursor value {value!r}")
+        field = term.lstrip("-")
+        try:
+            model_field = model._meta.pk if field == "pk" else model._meta.get_field(field)
+        except FieldDoesNotExist:
+            # An annotation: numbers only, such as the gallery's counts
+            if isinstance(value, str):
+                raise ValueError(f"Unexpected cursor value {value!r}")
+            return value
+        return model_field.to_python(value)
+
+    def get_next_cursor(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]))
+
+    def get_next_link(self):
+        cursor = self.get_next_cursor()
+        if cursor is None:
+            return None
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "status": status.HTTP_200_OK,
+            "next": self.get_next_link(),
+            "next_cursor": self.get_next_cursor(),
+            "results": data,
+        })
+
+
+class ViewSetKeysetPagination(KeysetPagination):
+    """
+    ``KeysetPagination`` for viewsets. The ordering is read from the filtered
+    queryset, so the view's ``ordering`` and ``?ordering=`` apply, and ``id``
+    is appended as the tiebreaker. ``limit`` sets the page size.
+
+    Every request gets a cursor page unless it passes ``offset``. Those
+    requests, and orderings a seek cannot express (random, related fields,
+    expressions), get limit/offset pages with a total count (see
+    :class:`~api.counting.CountingLimitOffsetPagination`), of ``page_size``
+    rows when no ``limit`` is given.
+    """
+
+    page_size_query_param = "limit"
+    offset_query_param = "offset"
+
+    def __init__(self, ordering=()):
+        super().__init__(ordering)
+        self.offset_paginator = None
+
+    @staticmethod
+    def keyset_ordering(queryset):
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        if not all(isinstance(term, str) and term != "?" and "__" not in term for term in ordering):
+            return None
+        if not {term.lstrip("-") for term in ordering} & {"id", "pk"}:
+            descending = not ordering or ordering[0].startswith("-")
+            ordering.append("-id" if descending else "id")
+        return ordering
+
+    def wants_cursor_page(self, request):
+        return self.offset_query_param not in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = self.keyset_ordering(queryset)
+        if ordering is None or not self.wants_cursor_page(request):
+            self.offset_paginator = CountingLimitOffsetPagination()
+            self.offset_paginator.default_limit = self.page_size
+            self.offset_paginator.max_limit = self.max_page_size
+            return self.offset_paginator.paginate_queryset(queryset, request, view)
+        self.ordering = ordering
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.offset_paginator is not None:
+            return self.offset_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
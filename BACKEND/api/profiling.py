@@ -0,0 +1,178 @@
+import bisect
+import contextvars
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+QUERY_BUCKETS = [1, 2, 5, 10, 20, 50, 100, 200]
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
+_current = contextvars.ContextVar("request_profile", default=None)
+
+
+class RequestProfile:
+    """Timings collected while handling one request."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_ms = 0.0
+        self.serializer_ms = 0.0
+        self.serializer_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper hook: time every query on the connection
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_ms += (time.perf_counter() - started) * 1000
+            self.queries += 1
+
+
+def _timed_representation(to_representation):
+    def wrapper(self, *args, **kwargs):
+        profile = _current.get()
+        if profile is None:
+            return to_representation(self, *args, **kwargs)
+        # Only the outermost serializer is timed; nested ones are part of it
+        profile.serializer_depth += 1
+        started = time.perf_counter()
+        try:
+            return to_representation(self, *args, **kwargs)
+        finally:
+            profile.serializer_depth -= 1
+            if profile.serializer_depth == 0:
+                profile.serializer_ms += (time.perf_counter() - started) * 1000
+
+    wrapper.__wrapped__ = to_representation
+    return wrapper
+
+
+def install_serializer_timing():
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        if not hasattr(cls.to_representation, "__wrapped__"):
+            cls.to_representation = _timed_representation(cls.to_representation)
+
+
+class ProfileRegistry:
+    """Per-view histograms of query counts and latency, kept in process memory."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def record(self, view, queries, total_ms, db_ms, response_bytes):
+        with self._lock:
+            stats = self._views.get(view)
+            if stats is None:
+                stats = self._views[view] = {
+                    "requests": 0,
+                    "queries": 0,
+                    "max_queries": 0,
+                    "total_ms": 0.0,
+                    "db_ms": 0.0,
+                    "bytes": 0,
+                    "query_histogram": [0] * (len(QUERY_BUCKETS) + 1),
+                    "latency_histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                }
+            stats["requests"] += 1
+            stats["queries"] += queries
+            stats["max_queries"] = max(stats["max_queries"], queries)
+            stats["total_ms"] += total_ms
+            stats["db_ms"] += db_ms
+            stats["bytes"] += response_bytes
+            stats["query_histogram"][bisect.bisect_left(QUERY_BUCKETS, queries)] += 1
+            stats["latency_histogram"][bisect.bisect_left(LATENCY_BUCKETS_MS, total_ms)] += 1
+
+    def snapshot(self):
+        """Aggregates per view, with histogram buckets labelled by upper bound."""
+        with self._lock:
+            views = {view: dict(stats) for view, stats in self._views.items()}
+        for stats in views.values():
+            requests = stats["requests"]
+            stats["mean_queries"] = round(stats.pop("queries") / requests, 2)
+            stats["mean_ms"] = round(stats.pop("total_ms") / requests, 2)
+            stats["mean_db_ms"] = round(stats.pop("db_ms") / requests, 2)
+            stats["mean_bytes"] = round(stats.pop("bytes") / requests)
+            stats["query_histogram"] = self._label(QUERY_BUCKETS, stats["query_histogram"])
+            stats["latency_histogram"] = self._label(LATENCY_BUCKETS_MS, stats["latency_histogram"])
+        return views
+
+    @staticmethod
+    def _label(bounds, counts):
+        labels = [f"<={bound}" for bound in bounds] + [f">{bounds[-1]}"]
+        return dict(zip(labels, counts))
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+registry = ProfileRegistry()
+
+
+class QueryProfilingMiddleware:
+    """
+    Measures query count, DB time, serializer time and response size for
+    every request, reports them in a ``Server-Timing`` header and adds them
+    to the per-view aggregates served by ``/api/v1/profiling/``.
+
+    Requests running more than ``REQUEST_PROFILING_QUERY_THRESHOLD`` queries
+    are logged as warnings on the ``api.profiling`` logger, which is where
+    N+1 regressions show up. Enabled by ``REQUEST_PROFILING`` (defaults to
+    ``DEBUG``); the middleware removes itself when it is off.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_PROFILING", settings.DEBUG):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.query_threshold = getattr(settings, "REQUEST_PROFILING_QUERY_THRESHOLD", 50)
+        install_serializer_timing()
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        token = _current.set(profile)
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(profile):
+                # DRF responses are rendered inside get_response, so JSON
+                # encoding is part of the total
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total_ms = (time.perf_counter() - started) * 1000
+
+        response_bytes = 0 if response.streaming else len(response.content)
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={profile.db_ms:.2f};desc="{profile.queries} queries"',
+            f"serialize;dur={profile.serializer_ms:.2f}",
+            f"total;dur={total_ms:.2f}",
+        ])
+
+        view = self.view_name(request)
+        registry.record(view, profile.queries, total_ms, profile.db_ms, response_bytes)
+        if profile.queries > self.query_threshold:
+            logger.warning(
+                "%s ran %d queries (threshold %d) in %.1f ms, %.1f ms in the database",
+                view, profile.queries, self.query_threshold, total_ms, profile.db_ms,
+            )
+        else:
+            logger.debug(
+                "%s ran %d queries in %.1f ms, %d bytes",
+                view, profile.queries, total_ms, response_bytes,
+            )
+        return response
+
+    @staticmethod
+    def view_name(request):
+        match = getattr(request, "resolver_match", None)
+        route = match.route if match else request.path_info
+        return f"{request.method} /{route}"
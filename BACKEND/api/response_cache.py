@@ -0,0 +1,180 @@
+import functools
+import hashlib
+import threading
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+RESPONSE_CACHE_KEY = "response:{view}:{generations}:{query}"
+GENERATION_KEY = "response:generation:{label}"
+# Headers replayed on a hit; the conditional ones let hits answer with 304s
+CACHED_HEADERS = ["Content-Type", "ETag", "Last-Modified", "Cache-Control", "Vary", "Allow"]
+
+
+class ResponseCacheStats:
+    """Hit/miss counters per view, kept in process memory."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def record(self, view, outcome):
+        with self._lock:
+            stats = self._views.setdefault(view, {"hits": 0, "misses": 0, "stores": 0})
+            stats[outcome] += 1
+
+    def snapshot(self):
+        with self._lock:
+            views = {view: dict(stats) for view, stats in self._views.items()}
+        for stats in views.values():
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else None
+        return views
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+stats = ResponseCacheStats()
+
+
+def get_cache():
+    alias = getattr(settings, "RESPONSE_CACHE", None)
+    return caches[alias] if alias else None
+
+
+def _generation(cache, label):
+    # Start from the clock, so an evicted generation never comes back to a
+    # value that older entries were cached under
+    return cache.get_or_set(GENERATION_KEY.format(label=label), time.time_ns, None)
+
+
+def bump_generation(label):
+    """Retire every cached response built from the model ``label``."""
+    cache = get_cache()
+    if cache is None:
+        return
+    try:
+        cache.incr(GENERATION_KEY.format(label=label))
+    except ValueError:
+        # No generation stored yet, so nothing has been cached under one either
+        pass
+
+
+def normalized_query(request):
+    """The query string with parameters sorted and empty values dropped."""
+    params = sorted(
+        (key, value) for key in request.GET for value in request.GET.getlist(key) if value != ""
+    )
+    return urlencode(params)
+
+
+def cache_key(cache, request, view, models):
+    generations = ".".join(str(_generation(cache, model._meta.label_lower)) for model in models)
+    # Responses embed absolute URLs, so the host is part of the key, and the
+    # renderer is negotiated from Accept
+    query = (
+        f"{request.scheme}://{request.get_host()}{request.path}?{normalized_query(request)}"
+        f"|{request.META.get('HTTP_ACCEPT', '')}"
+    )
+    return RESPONSE_CACHE_KEY.format(
+        view=view, generations=generations, query=hashlib.sha256(query.encode()).hexdigest(),
+    )
+
+
+def is_cacheable(request):
+    # Only anonymous reads: responses to tokens may depend on the user
+    return request.method in ("GET", "HEAD") and "HTTP_AUTHORIZATION" not in request.META
+
+
+def _replay(request, entry):
+    last_modified = entry["headers"].get("Last-Modified")
+    response = get_conditional_response(
+        request,
+        etag=entry["headers"].get("ETag"),
+        last_modified=parse_http_date_safe(last_modified) if last_modified else None,
+    )
+    if response is None:
+        response = HttpResponse(entry["content"], status=entry["status"])
+    for header, value in entry["headers"].items():
+        response[header] = value
+    return response
+
+
+def serve(request, view, models, get_response, on_hit=None):
+    """
+    Return the cached response for an anonymous GET, or build it with
+    ``get_response`` and store it. Entries are keyed on the normalized query
+    string and the current generation of every model in ``models``; saving
+    or deleting one of those models bumps its generation, so stale entries
+    are never read again and age out of the LRU.
+
+    ``on_hit(request, ids)`` runs on hits with the ids of the rows in the
+    cached page, for side effects such as view counting.
+    """
+    cache = get_cache()
+    if cache is None or not is_cacheable(request):
+        return get_response()
+
+    key = cache_key(cache, request, view, models)
+    entry = cache.get(key)
+    if entry is not None:
+        stats.record(view, "hits")
+        if on_hit is not None:
+            on_hit(request, entry["ids"])
+        response = _replay(request, entry)
+        response["X-Cache"] = "HIT"
+        return response
+
+    stats.record(view, "misses")
+    response = get_response()
+    if hasattr(response, "render") and not response.is_rendered:
+        response.render()
+    if response.status_code == 200 and not response.streaming:
+        data = getattr(response, "data", None)
+        results = data.get("results") if isinstance(data, dict) else None
+        cache.set(key, {
+            "status": response.status_code,
+            "content": response.content,
+            "headers": {header: response[header] for header in CACHED_HEADERS if response.has_header(header)},
+            "ids": [row["id"] for row in results if "id" in row] if isinstance(results, list) else [],
+        })
+        stats.record(view, "stores")
+    response["X-Cache"] = "MISS"
+    return response
+
+
+class CachedListMixin:
+    """
+    Serves the ``list`` action from the response cache for anonymous
+    clients. ``response_cache_models`` lists every model the response is
+    built from; their signals invalidate it.
+    """
+
+    response_cache_models = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.action_map.get(request.method.lower()) != "list":
+            return super().dispatch(request, *args, **kwargs)
+        return serve(
+            request,
+            f"{self.basename}-list",
+            self.response_cache_models,
+            lambda: super(CachedListMixin, self).dispatch(request, *args, **kwargs),
+        )
+
+
+def cache_anonymous_response(view, models, on_hit=None):
+    """Function view counterpart of :class:`CachedListMixin`; apply above ``@api_view``."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(request, *args, **kwargs):
+            return serve(request, view, models, lambda: func(request, *args, **kwargs), on_hit)
+        return wrapper
+    return decorator
@@ -30,6 +30,8 @@ class MentorProfileSerializer(serializers.ModelSerializer):
             'current_mentees_count', 'can_accept_mentees', 'created_at'
         ]
     
+    # Both read the denormalized MentorProfile.active_mentees counter, so
+    # serializing a mentor needs no extra query
     def get_current_mentees_count(self, obj):
         return obj.get_current_mentees_count()
     
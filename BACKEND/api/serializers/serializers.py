@@ -1,11 +1,14 @@
 from rest_framework import serializers  # type: ignore
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.files.base import ContentFile
 import base64
 import io
 
+from authorization.caching import get_user_profile
 from authorization.models import UserInfo
 from authorization.serializer import UserInfoSerializer
+from cms.search import HighlightedSerializerMixin
 
 from cms.models import (
     # User,
@@ -25,13 +28,28 @@ from cms.models import (
     RegistrationRequest
 )
 
+BASE64_UPLOAD_MAX_SIZE = 5 * 1024 * 1024
+
 
 class Base64ImageField(serializers.ImageField):
+    """
+    Accepts a multipart upload or, for older clients, a base64 data URI.
+    Base64 payloads are decoded in memory, so they are capped at
+    ``BASE64_UPLOAD_MAX_SIZE``; larger files must be sent as multipart.
+    """
+    default_error_messages = {
+        'base64_too_large': 'Base64 images are limited to {max_size} bytes; upload larger files as multipart/form-data.',
+    }
+
     def to_internal_value(self, data):
         if isinstance(data, str) and data.startswith('data:image'):
             # Decode base64 image
             format, imgstr = data.split(';base64,')
             ext = format.split('/')[-1]
+            max_size = getattr(settings, 'BASE64_UPLOAD_MAX_SIZE', BASE64_UPLOAD_MAX_SIZE)
+            # Check the encoded length first, so an oversized upload is never decoded
+            if len(imgstr) * 3 // 4 > max_size:
+                self.fail('base64_too_large', max_size=max_size)
             img_data = base64.b64decode(imgstr)
             file = ContentFile(img_data, name=f'temp.{ext}')
             return super().to_internal_value(file)
@@ -51,10 +69,10 @@ class UserShortSerializer(serializers.ModelSerializer):
         # role = UserRoleSerializer(read_only=True)
         fields = ['id', 'first_name', 'last_name', 'email', 'username']
 
-class JobSerializer(serializers.ModelSerializer):
+class JobSerializer(HighlightedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Job
-        fields = "__all__"
+        exclude = list(Job.normalized_fields)
 
 
 
@@ -64,18 +82,48 @@ class UserRoleSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class NewsFeedSerializer(serializers.ModelSerializer):
+class NewsFeedSerializer(HighlightedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = NewsFeed
-        fields = "__all__"
+        exclude = list(NewsFeed.normalized_fields)
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(HighlightedSerializerMixin, serializers.ModelSerializer):
     image = Base64ImageField(required=False, allow_null=True)
 
     class Meta:
         model = Event
-        fields = "__all__"
+        exclude = list(Event.normalized_fields)
+
+
+def build_user_info_map(user_ids):
+    """Resolve the UserInfo (with role and user) of many users in a single query.
+
+    Returns a dict keyed by user id that list views hand to the post and
+    comment serializers through the ``user_infos`` context entry.
+    """
+    user_infos = {}
+    queryset = (
+        UserInfo.objects.filter(user_id__in=set(user_ids))
+        .select_related("role", "user")
+        .order_by("id")
+    )
+    for user_info in queryset:
+        user_infos.setdefault(user_info.user_id, user_info)
+    return user_infos
+
+
+def serialize_user_info(user_id, context):
+    """Serialize a user's UserInfo from the prefetched map, else the profile cache."""
+    user_infos = context.get("user_infos")
+    if user_infos is not None:
+        # Authors recur across posts and comments: build each one's data once
+        serialized = context.setdefault("serialized_user_infos", {})
+        if user_id not in serialized:
+            user_info = user_infos.get(user_id)
+            serialized[user_id] = UserInfoSerializer(user_info).data if user_info else None
+        return serialized[user_id]
+    return get_user_profile(user_id).data
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -88,31 +136,27 @@ class CommentSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'user', 'created_at', 'updated_at']
 
     def get_user(self, obj):
-        try:
-            user_info = UserInfo.objects.get(user=obj.user)
-            return UserInfoSerializer(user_info).data
-        except UserInfo.DoesNotExist:
-            return None
+        return serialize_user_info(obj.user_id, self.context)
 
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(HighlightedSerializerMixin, serializers.ModelSerializer):
     created_by = serializers.SerializerMethodField()
     comments = serializers.SerializerMethodField()
 
     def get_created_by(self, obj):
-        try:
-            user_info = UserInfo.objects.get(user=obj.created_by)
-            return UserInfoSerializer(user_info).data
-        except UserInfo.DoesNotExist:
-            return None
+        return serialize_user_info(obj.created_by_id, self.context)
 
     class Meta:
         model = Post
         fields = ('id', 'post', 'created_at', 'updated_at', 'created_by', 'comments')
 
     def get_comments(self, obj):
-        comments_qs = Comment.objects.filter(post_id=obj.id).order_by('-created_at')
-        return CommentSerializer(comments_qs, many=True).data
+        if "comments" in getattr(obj, "_prefetched_objects_cache", {}):
+            # PostViewSet.list prefetches comments already ordered by -created_at
+            comments_qs = obj.comments.all()
+        else:
+            comments_qs = Comment.objects.filter(post_id=obj.id).order_by('-created_at')
+        return CommentSerializer(comments_qs, many=True, context=self.context).data
 
     def validate_post(self, value):
         if len(value) < 10:
@@ -0,0 +1,36 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from authorization.models import UserInfo
+from cms.models import Event, GalleryCategory, GalleryComment, GalleryImage, GalleryLike, GalleryTag, Job, NewsFeed, Post
+from .counting import bump_count_generation
+from .response_cache import bump_generation
+
+# Every model a cached list response is built from (see api/response_cache.py)
+RESPONSE_CACHE_MODELS = [Job, Event, NewsFeed, GalleryImage, GalleryCategory, GalleryTag, GalleryLike, GalleryComment]
+# Every model a cached pagination count is taken over (see api/counting.py)
+COUNTED_MODELS = [Job, Event, NewsFeed, Post, UserInfo]
+
+
+def invalidate_cached_responses(sender, **kwargs):
+    bump_generation(sender._meta.label_lower)
+
+
+for model in RESPONSE_CACHE_MODELS:
+    post_save.connect(invalidate_cached_responses, sender=model, dispatch_uid=f"response_cache_save_{model._meta.label_lower}")
+    post_delete.connect(invalidate_cached_responses, sender=model, dispatch_uid=f"response_cache_delete_{model._meta.label_lower}")
+
+
+def invalidate_cached_counts(sender, **kwargs):
+    bump_count_generation(sender._meta.label_lower)
+
+
+for model in COUNTED_MODELS:
+    post_save.connect(invalidate_cached_counts, sender=model, dispatch_uid=f"count_cache_save_{model._meta.label_lower}")
+    post_delete.connect(invalidate_cached_counts, sender=model, dispatch_uid=f"count_cache_delete_{model._meta.label_lower}")
+
+
+@receiver(m2m_changed, sender=GalleryImage.tags.through)
+def invalidate_gallery_image_tags(sender, action, **kwargs):
+    if action.startswith("post_"):
+        bump_generation(GalleryImage._meta.label_lower)
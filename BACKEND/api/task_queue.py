@@ -0,0 +1,156 @@
+import logging
+import threading
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from importlib import import_module
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+# Registered task functions by dotted name; only these can be run from a row
+TASKS = {}
+
+
+def task_name(func):
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def background_task(max_attempts=3):
+    """Register ``func`` so that :func:`defer` can queue it."""
+    def decorator(func):
+        func.max_attempts = max_attempts
+        TASKS[task_name(func)] = func
+        return func
+    return decorator
+
+
+def resolve(name):
+    if name not in TASKS:
+        # Registration happens on import; the worker may not have loaded the module yet
+        import_module(name.rsplit(".", 1)[0])
+    return TASKS[name]
+
+
+def _run_eagerly(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed", task_name(func))
+
+
+def defer(func, *args, **kwargs):
+    """
+    Queue ``func(*args, **kwargs)`` for ``manage.py run_worker``.
+
+    The row is written in the caller's transaction, so the task exists
+    exactly when the data it refers to does. Arguments are stored as JSON:
+    pass ids, not model instances, and make the task safe to run twice.
+    With ``BACKGROUND_TASKS_EAGER`` the task runs inline on commit instead.
+    """
+    name = task_name(func)
+    if TASKS.get(name) is not func:
+        raise ValueError(f"{name} is not registered with @background_task")
+    if getattr(settings, "BACKGROUND_TASKS_EAGER", False):
+        transaction.on_commit(lambda: _run_eagerly(func, args, kwargs))
+        return None
+    return Task.objects.create(name=name, args=list(args), kwargs=kwargs, max_attempts=func.max_attempts)
+
+
+def claim(worker_id, limit, visibility_timeout):
+    """
+    Lease up to ``limit`` due tasks to ``worker_id`` for ``visibility_timeout``
+    seconds. Tasks whose lease ran out (the worker died) are due again.
+
+    The UPDATE repeats the readiness condition, so when two workers select
+    the same rows only one of them wins each row; no row locks are needed,
+    which keeps this working on SQLite.
+    """
+    now = timezone.now()
+    due = Q(status=Task.QUEUED, run_after__lte=now) | Q(status=Task.RUNNING, locked_until__lt=now)
+    with transaction.atomic():
+        ids = list(Task.objects.filter(due).order_by("run_after", "id").values_list("id", flat=True)[:limit])
+        if not ids:
+            return []
+        Task.objects.filter(due, id__in=ids).update(
+            status=Task.RUNNING,
+            locked_by=worker_id,
+            locked_until=now + timedelta(seconds=visibility_timeout),
+            attempts=F("attempts") + 1,
+        )
+    return list(Task.objects.filter(id__in=ids, status=Task.RUNNING, locked_by=worker_id).order_by("id"))
+
+
+def run_task(task, worker_id):
+    """Run a claimed task and record the outcome, scheduling a retry on failure."""
+    # Only the current lease holder may record a result
+    leased = Task.objects.filter(id=task.id, status=Task.RUNNING, locked_by=worker_id)
+    try:
+        if task.attempts > task.max_attempts:
+            raise RuntimeError(f"Lease expired {task.max_attempts} times")
+        resolve(task.name)(*task.args, **task.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        now = timezone.now()
+        if task.attempts >= task.max_attempts:
+            leased.update(status=Task.FAILED, last_error=error, locked_until=None, finished_at=now)
+            logger.error("Task %s (%s) failed after %d attempts", task.id, task.name, task.attempts)
+        else:
+            retry_delay = getattr(settings, "BACKGROUND_TASK_RETRY_DELAY", 30)
+            leased.update(
+                status=Task.QUEUED, last_error=error, locked_until=None,
+                run_after=now + timedelta(seconds=retry_delay * 2 ** (task.attempts - 1)),
+            )
+            logger.warning("Task %s (%s) failed, attempt %d of %d", task.id, task.name,
+                           task.attempts, task.max_attempts)
+        return False
+    leased.update(status=Task.DONE, locked_until=None, finished_at=timezone.now())
+    return True
+
+
+class Worker:
+    """Claims due tasks in batches and runs them on a thread pool."""
+
+    def __init__(self, concurrency=4, visibility_timeout=300, poll_interval=1.0):
+        self.concurrency = concurrency
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self.worker_id = uuid.uuid4().hex
+        self.stopping = threading.Event()
+
+    def _run(self, task):
+        try:
+            return run_task(task, self.worker_id)
+        finally:
+            # Pool threads keep their own connections; do not leak them
+            close_old_connections()
+
+    def run(self, once=False):
+        """
+        Process tasks until :meth:`stop` is called, or with ``once`` until
+        nothing is due. Returns the number of tasks run.
+        """
+        processed = 0
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="task-worker") as pool:
+            while not self.stopping.is_set():
+                tasks = claim(self.worker_id, self.concurrency, self.visibility_timeout)
+                if not tasks:
+                    if once:
+                        break
+                    self.stopping.wait(self.poll_interval)
+                    continue
+                # Wait for the whole batch, so a lease is never taken
+                # before there is a thread free to run it
+                list(pool.map(self._run, tasks))
+                processed += len(tasks)
+        return processed
+
+    def stop(self):
+        self.stopping.set()
@@ -0,0 +1,73 @@
+import io
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.mail import send_mail
+from PIL import Image, ImageOps
+
+from authorization.caching import invalidate_user_profile
+from authorization.models import UserInfo
+from cms.image_variants import process_gallery_image
+from cms.models import GalleryImage
+from .response_cache import bump_generation
+from .task_queue import background_task
+
+AVATAR_MAX_SIZE = (512, 512)
+
+@background_task(max_attempts=5)
+def send_registration_email(email, first_name, verification_status):
+    if verification_status in ("auto_approved", "approved"):
+        subject = "Your VIPS-TC alumni registration is approved"
+        body = (
+            f"Hi {first_name},\n\nYour alumni registration has been approved. "
+            "You can now log in to the alumni portal with this email address."
+        )
+    else:
+        subject = "We received your VIPS-TC alumni registration"
+        body = (
+            f"Hi {first_name},\n\nYour alumni registration has been submitted for review. "
+            "Our team will get back to you within 3-5 business days."
+        )
+    send_mail(subject, body, settings.DEFAULT_FROM_EMAIL, [email])
+
+
+def _open_image(field_file):
+    with field_file.open("rb") as f:
+        image = Image.open(f)
+        image.load()
+    return image
+
+
+@background_task()
+def shrink_avatar(user_info_id):
+    """Downscale an uploaded avatar in place, applying and dropping its EXIF orientation."""
+    user_info = UserInfo.objects.filter(id=user_info_id).only("avatar", "user_id").first()
+    if not user_info or not user_info.avatar:
+        return
+    avatar = user_info.avatar
+    image = _open_image(avatar)
+    if image.width <= AVATAR_MAX_SIZE[0] and image.height <= AVATAR_MAX_SIZE[1]:
+        return
+
+    image_format = image.format or "PNG"
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail(AVATAR_MAX_SIZE)
+    if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    output = io.BytesIO()
+    image.save(output, format=image_format)
+
+    name = avatar.name
+    avatar.storage.delete(name)
+    stored = avatar.storage.save(name, ContentFile(output.getvalue()))
+    if stored != name:
+        # update() sends no post_save, so drop the cached profile here
+        UserInfo.objects.filter(id=user_info_id).update(avatar=stored)
+        invalidate_user_profile(user_info.user_id)
+
+
+@background_task()
+def generate_gallery_derivatives(image_id):
+    # Derivatives are saved with update(), which sends no signals
+    if process_gallery_image(image_id):
+        bump_generation(GalleryImage._meta.label_lower)
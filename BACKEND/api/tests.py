@@ -1,3 +1,1095 @@
-from django.test import TestCase
-
-# Create your tests here.
+import base64
+import io
+import json
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache, caches
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.db.models import F
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APIClient
+
+from api.models import Task
+from api.pagination import KeysetPagination, ViewSetKeysetPagination
+from api.profiling import registry as profile_registry
+from api.response_cache import stats as response_cache_stats
+from api.serializers.serializers import JobSerializer
+from api.tasks import shrink_avatar
+from api.task_queue import Worker, background_task, claim, defer, run_task
+from authorization.caching import get_user_profile
+from authorization.models import UserInfo
+from authorization.serializer import UserInfoSerializer
+from cms.view_counts import gallery_view_counter
+from cms.models import (
+    AlumniVerificationScore, Comment, GalleryCategory, GalleryComment, GalleryImage,
+    Event, GalleryLike, GalleryTag, Job, MentorProfile, MentorshipRequest, NewsFeed, Post, RegistrationRequest, Role,
+)
+
+
+class PostListQueryCountTest(TestCase):
+    """The posts feed must not issue per-post or per-comment queries."""
+
+    @classmethod
+    def setUpTestData(cls):
+        role = Role.objects.create(role_name="Alumni", description="Alumni")
+        cls.users = []
+        for i in range(5):
+            user = User.objects.create(username=f"user{i}", email=f"user{i}@vipstc.edu.in")
+            UserInfo.objects.create(
+                user=user, role=role, first_name=f"User{i}", last_name="Test", email=user.email
+            )
+            cls.users.append(user)
+
+        for i in range(30):
+            post = Post.objects.create(
+                post=f"Post number {i} from the feed", created_by=cls.users[i % 5]
+            )
+            for j in range(3):
+                Comment.objects.create(
+                    post=post, user=cls.users[(i + j) % 5], content=f"Comment {j}"
+                )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.users[0])
+
+    def _count_queries(self, limit):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/v1/posts/", {"limit": limit})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), limit)
+        return len(ctx.captured_queries)
+
+    def test_query_count_is_constant_across_page_sizes(self):
+        self.assertEqual(self._count_queries(5), self._count_queries(25))
+
+    def test_nested_authors_are_serialized(self):
+        response = self.client.get("/api/v1/posts/", {"limit": 1})
+        post = response.data["results"][0]
+        self.assertEqual(post["created_by"]["role"]["role_name"], "Alumni")
+        self.assertEqual(len(post["comments"]), 3)
+        self.assertIsNotNone(post["comments"][0]["user"])
+
+    def test_each_author_is_serialized_once(self):
+        with patch.object(UserInfoSerializer, "to_representation", autospec=True,
+                          side_effect=UserInfoSerializer.to_representation) as to_representation:
+            response = self.client.get("/api/v1/posts/", {"limit": 20})
+        self.assertEqual(len(response.data["results"]), 20)
+        self.assertEqual(to_representation.call_count, len(self.users))
+
+
+class GalleryImagesPaginationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="photographer")
+        other = User.objects.create(username="visitor")
+        category = GalleryCategory.objects.create(name="Festivals", category_type="festivals")
+        diwali = GalleryTag.objects.create(name="Diwali", tag_type="festival")
+        holi = GalleryTag.objects.create(name="Holi", tag_type="festival")
+        for i in range(12):
+            image = GalleryImage.objects.create(
+                title=f"Photo {i}", image=f"gallery/images/{i}.jpg", category=category,
+                event_date=date(2024, 1, 1 + i % 3), priority=["low", "medium", "high"][i % 3],
+                uploaded_by=cls.user,
+            )
+            image.tags.add(diwali, holi)
+            GalleryLike.objects.create(image=image, user=cls.user)
+            GalleryLike.objects.create(image=image, user=other)
+            GalleryComment.objects.create(image=image, user=other, comment="Nice")
+            GalleryComment.objects.create(image=image, user=other, comment="Hidden", is_approved=False)
+
+    def setUp(self):
+        cache.clear()
+        caches["responses"].clear()
+        gallery_view_counter.reset()
+        self.client = APIClient()
+
+    def _get(self, **params):
+        response = self.client.get("/api/v1/gallery/images/", params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_cursor_walks_every_image_once_in_order(self):
+        seen = []
+        data = self._get(page_size=5)
+        while True:
+            seen.extend(image["id"] for image in data["results"])
+            if not data["next_cursor"]:
+                break
+            data = self._get(page_size=5, cursor=data["next_cursor"])
+
+        expected = list(
+            GalleryImage.objects.order_by("-priority", "-event_date", "-created_at", "-id")
+            .values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+        self.assertNotIn("count", data)
+
+    def test_requests_without_paging_params_get_the_first_page(self):
+        with patch.object(KeysetPagination, "page_size", 5):
+            data = self._get()
+        self.assertEqual(len(data["results"]), 5)
+        self.assertIsNotNone(data["next_cursor"])
+        self.assertNotIn("count", data)
+        # Only the served page is counted as viewed
+        gallery_view_counter.flush()
+        self.assertEqual(GalleryImage.objects.filter(view_count=1).count(), 5)
+
+    def test_counts_are_annotated_and_tags_prefetched(self):
+        image = self._get(page_size=1, tag="diwali")["results"][0]
+        self.assertEqual(image["likes"], 2)
+        self.assertEqual(image["comments"], 1)
+        self.assertEqual(sorted(image["tags"]), ["Diwali", "Holi"])
+
+    def test_query_budget_is_independent_of_page_size(self):
+        self._get(page_size=1)  # claims the view counter flush window
+
+        def count_queries(page_size):
+            with CaptureQueriesContext(connection) as ctx:
+                self._get(page_size=page_size, search="photo")
+            return len(ctx.captured_queries)
+
+        self.assertEqual(count_queries(2), count_queries(10))
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get("/api/v1/gallery/images/", {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_malformed_cursor_values_are_rejected(self):
+        for position in (
+            [3, "2024-01-01", "2024-01-01T00:00:00+00:00", "abc"],
+            [3, "notadate", "2024-01-01T00:00:00+00:00", 1],
+            [3, "2024-01-01", {"a": 1}, 1],
+        ):
+            cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+            response = self.client.get("/api/v1/gallery/images/", {"cursor": cursor})
+            self.assertEqual(response.status_code, 404, position)
+
+
+class GalleryCategoriesTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="photographer")
+        cls.festivals = GalleryCategory.objects.create(name="Festivals", category_type="festivals")
+        cls.sports = GalleryCategory.objects.create(name="Sports", category_type="sports", order=1)
+        for category, is_public in [
+            (cls.festivals, True), (cls.festivals, True), (cls.festivals, False), (None, True),
+        ]:
+            cls._create_image(category, is_public)
+
+    @classmethod
+    def _create_image(cls, category, is_public=True):
+        return GalleryImage.objects.create(
+            title="Photo", image="gallery/images/x.jpg", event_date=date(2024, 1, 1),
+            category=category, is_public=is_public, uploaded_by=cls.user,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def _counts(self):
+        response = self.client.get("/api/v1/gallery/categories/")
+        self.assertEqual(response.status_code, 200)
+        return {category["name"]: category["count"] for category in response.data["results"]}
+
+    def test_counts_come_from_one_aggregate_and_are_cached(self):
+        with self.assertNumQueries(2):
+            counts = self._counts()
+        self.assertEqual(counts, {"All Photos": 3, "Festivals": 2, "Sports": 0})
+
+        with self.assertNumQueries(0):
+            self._counts()
+
+    def test_image_changes_invalidate_the_cache(self):
+        self._counts()
+        image = self._create_image(self.sports)
+        self.assertEqual(self._counts()["Sports"], 1)
+
+        image.delete()
+        self.assertEqual(self._counts(), {"All Photos": 3, "Festivals": 2, "Sports": 0})
+
+
+@override_settings(RESPONSE_CACHE=None)
+class ConditionalListTest(TestCase):
+    """Polling clients get 304s until the collection changes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.jobs = [
+            Job.objects.create(job_title=title, company="TCS", location=city)
+            for title, city in [("Analyst", "Pune"), ("Developer", "Noida")]
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def revalidate(self, path, response):
+        return self.client.get(path, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_unchanged_list_is_not_re_serialized(self):
+        first = self.client.get("/api/v1/jobs/")
+        self.assertEqual(first.status_code, 200)
+        self.assertRegex(first["ETag"], r'^"[0-9a-f]{32}"$')
+        self.assertIn("Last-Modified", first)
+
+        with patch.object(JobSerializer, "to_representation") as serialize:
+            with CaptureQueriesContext(connection) as queries:
+                second = self.revalidate("/api/v1/jobs/", first)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.content, b"")
+        self.assertEqual(second["ETag"], first["ETag"])
+        serialize.assert_not_called()
+        # Only the version aggregate ran, never the page query
+        self.assertEqual(len(queries), 1)
+        self.assertIn("MAX(", queries[0]["sql"])
+
+        filtered = self.client.get("/api/v1/jobs/", {"location__iexact": "Pune"})
+        self.assertNotEqual(filtered["ETag"], first["ETag"])
+
+    def test_edits_and_deletes_change_the_etag(self):
+        first = self.client.get("/api/v1/jobs/")
+        Job.objects.filter(pk=self.jobs[0].pk).update(updated_at=timezone.now())
+        edited = self.revalidate("/api/v1/jobs/", first)
+        self.assertEqual(edited.status_code, 200)
+
+        self.jobs[1].delete()
+        deleted = self.revalidate("/api/v1/jobs/", edited)
+        self.assertEqual(deleted.status_code, 200)
+        self.assertEqual(len(deleted.data["results"]), 1)
+
+    def test_cached_gallery_categories_revalidate_without_queries(self):
+        first = self.client.get("/api/v1/gallery/categories/")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.revalidate("/api/v1/gallery/categories/", first).status_code, 304)
+
+        GalleryCategory.objects.create(name="Sports", category_type="sports")
+        self.assertEqual(self.revalidate("/api/v1/gallery/categories/", first).status_code, 200)
+
+    def test_gallery_tags_revalidate(self):
+        GalleryTag.objects.create(name="Holi", tag_type="festival", is_featured=True)
+        first = self.client.get("/api/v1/gallery/tags/")
+        self.assertEqual(self.revalidate("/api/v1/gallery/tags/", first).status_code, 304)
+
+
+def create_mentor(username, capacity=3):
+    user = User.objects.create(username=username, first_name=username.title())
+    return MentorProfile.objects.create(
+        user=user, years_experience=5, current_company="Infosys",
+        current_position="Engineer", mentoring_capacity=capacity, bio="Mentor",
+        is_approved=True,
+    )
+
+
+class ResponseCacheTest(TestCase):
+    """Anonymous list responses are served from the cache until the data changes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.job = Job.objects.create(job_title="Analyst", company="TCS", location="Pune")
+        category = GalleryCategory.objects.create(name="Events", category_type="events")
+        cls.image = GalleryImage.objects.create(
+            title="Photo", image="gallery/images/x.jpg", category=category, event_date=date(2024, 1, 1),
+            uploaded_by=User.objects.create(username="photographer"),
+        )
+
+    def setUp(self):
+        cache.clear()
+        caches["responses"].clear()
+        response_cache_stats.reset()
+        self.client = APIClient()
+
+    def test_hits_skip_the_database_until_a_save(self):
+        first = self.client.get("/api/v1/jobs/", {"search": "", "limit": 10, "offset": 0})
+        self.assertEqual(first["X-Cache"], "MISS")
+
+        # Parameter order and empty values do not split the cache
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/v1/jobs/?offset=0&limit=10")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+        with self.assertNumQueries(0):
+            not_modified = self.client.get("/api/v1/jobs/?offset=0&limit=10", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+
+        self.job.job_title = "Senior Analyst"
+        self.job.save()
+        third = self.client.get("/api/v1/jobs/?offset=0&limit=10")
+        self.assertEqual(third["X-Cache"], "MISS")
+        self.assertEqual(third.json()["results"][0]["job_title"], "Senior Analyst")
+
+        self.assertEqual(
+            response_cache_stats.snapshot()["jobs-list"],
+            {"hits": 2, "misses": 2, "stores": 2, "hit_rate": 0.5},
+        )
+
+    def test_authenticated_requests_bypass_the_cache(self):
+        self.client.get("/api/v1/jobs/")
+        user = User.objects.create_user("member", "member@example.com", "pw")
+        self.client.force_authenticate(user)
+        response = self.client.get("/api/v1/jobs/", HTTP_AUTHORIZATION="Bearer token")
+        self.assertNotIn("X-Cache", response)
+
+    def test_gallery_hits_count_views_and_follow_related_models(self):
+        self.client.get("/api/v1/gallery/images/")
+        hit = self.client.get("/api/v1/gallery/images/")
+        self.assertEqual(hit["X-Cache"], "HIT")
+        persisted = GalleryImage.objects.get(pk=self.image.pk).view_count
+        pending = gallery_view_counter.pending_counts([self.image.pk]).get(self.image.pk, 0)
+        self.assertEqual(persisted + pending, 2)
+
+        tag = GalleryTag.objects.create(name="Convocation")
+        self.image.tags.add(tag)
+        response = self.client.get("/api/v1/gallery/images/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["results"][0]["tags"], ["Convocation"])
+
+        GalleryLike.objects.create(image=self.image, user=User.objects.create_user("fan", "fan@example.com", "pw"))
+        self.assertEqual(self.client.get("/api/v1/gallery/images/").json()["results"][0]["likes"], 1)
+
+    def test_metrics_endpoint_is_admin_only(self):
+        self.client.get("/api/v1/events/")
+        self.assertEqual(self.client.get("/api/v1/response-cache/").status_code, 401)
+
+        admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_authenticate(admin)
+        response = self.client.get("/api/v1/response-cache/")
+        self.assertEqual(response.json()["results"]["events-list"]["misses"], 1)
+        self.assertEqual(self.client.delete("/api/v1/response-cache/").status_code, 204)
+        self.assertEqual(response_cache_stats.snapshot(), {})
+
+
+@skipUnless(connection.vendor == "sqlite", "reads SQLite's EXPLAIN QUERY PLAN output")
+@override_settings(RESPONSE_CACHE=None)
+class ListQueryPlanTest(TestCase):
+    """The list endpoints' filters and default orderings are served by indexes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(username="photographer")
+        category = GalleryCategory.objects.create(name="Events", category_type="events")
+        for i in range(40):
+            Job.objects.create(
+                job_title=f"Job {i}", company=f"Company {i % 10}", location=f"City {i % 10}",
+                jobType=[Job.FULL_TIME, Job.PART_TIME, Job.REMOTE, Job.INTERN][i % 4], salary=i,
+            )
+            Event.objects.create(
+                event_name=f"Event {i}", date=timezone.now(), event_type=f"Type {i % 10}",
+                location=f"City {i % 10}", description="",
+            )
+            NewsFeed.objects.create(title=f"News {i}", content="", type=f"Type {i % 10}")
+            GalleryImage.objects.create(
+                title=f"Photo {i}", image=f"gallery/images/{i}.jpg", category=category,
+                event_date=date(2024, 1, 1), uploaded_by=user, is_public=i % 2 == 0,
+            )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def query_plans(self, path, params, table, ordered_only=False, versions=False):
+        """EXPLAIN every query the view runs against ``table``, or only its version aggregate."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200)
+        plans = []
+        with connection.cursor() as cursor:
+            for query in queries:
+                sql = query["sql"]
+                if not sql.startswith("SELECT") or f'FROM "{table}"' not in sql:
+                    continue
+                if ordered_only and "ORDER BY" not in sql:
+                    continue
+                if ("MAX(" in sql) != versions:
+                    # Only the conditional-list version aggregates, or everything else
+                    continue
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+                plans.append("\n".join(row[3] for row in cursor.fetchall()))
+        self.assertTrue(plans)
+        return plans
+
+    def assertPlansUse(self, index, plans):
+        for plan in plans:
+            self.assertIn(f"INDEX {index}", plan)
+            self.assertNotIn("TEMP B-TREE FOR ORDER BY", plan)
+
+    def test_iexact_filters_use_lower_indexes(self):
+        for path, params, table, index in [
+            ("/api/v1/jobs/", {"jobType__iexact": "remote"}, "cms_job", "cms_job_type_posted_idx"),
+            ("/api/v1/jobs/", {"location__iexact": "CITY 3", "limit": 10}, "cms_job", "cms_job_location_posted_idx"),
+            ("/api/v1/jobs/", {"company__iexact": "company 3"}, "cms_job", "cms_job_company_posted_idx"),
+            ("/api/v1/events/", {"event_type__iexact": "type 3", "limit": 10}, "cms_event", "cms_event_type_idx"),
+            ("/api/v1/events/", {"location__iexact": "city 3"}, "cms_event", "cms_event_location_idx"),
+            ("/api/v1/newsfeeds/", {"type__iexact": "TYPE 3", "limit": 10}, "cms_newsfeed", "cms_newsfeed_type_posted_idx"),
+        ]:
+            with self.subTest(path=path, params=params):
+                self.assertPlansUse(index, self.query_plans(path, params, table))
+
+        response = self.client.get("/api/v1/jobs/", {"jobType__iexact": "REMOTE"})
+        self.assertEqual(len(response.json()["results"]), 10)
+
+    def test_orderings_read_the_index_in_order(self):
+        for path, params, table, index in [
+            ("/api/v1/jobs/", {"limit": 10}, "cms_job", "cms_job_posted_idx"),
+            ("/api/v1/jobs/", {"ordering": "salary", "limit": 10}, "cms_job", "cms_job_salary_idx"),
+            ("/api/v1/newsfeeds/", {"limit": 10}, "cms_newsfeed", "cms_newsfeed_posted_idx"),
+        ]:
+            with self.subTest(path=path, params=params):
+                self.assertPlansUse(index, self.query_plans(path, params, table, ordered_only=True))
+
+    def test_list_versions_scan_an_index(self):
+        for path, table, index in [
+            ("/api/v1/jobs/", "cms_job", "cms_job_updated_idx"),
+            ("/api/v1/events/", "cms_event", "cms_event_updated_idx"),
+            ("/api/v1/newsfeeds/", "cms_newsfeed", "cms_newsfeed_updated_idx"),
+        ]:
+            with self.subTest(path=path):
+                # One narrow scan, however expensive the filters are
+                plans = self.query_plans(path, {"search": "zzz", "limit": 10}, table, versions=True)
+                self.assertEqual(len(plans), 1)
+                self.assertIn(f"COVERING INDEX {index}", plans[0])
+
+    def test_public_gallery_queries_use_partial_indexes(self):
+        plans = self.query_plans("/api/v1/gallery/images/", {"page_size": 5}, "cms_galleryimage")
+        self.assertPlansUse("cms_gallery_public_order_idx", plans)
+
+        plans = self.query_plans("/api/v1/gallery/categories/", {}, "cms_galleryimage")
+        self.assertIn("INDEX cms_gallery_public_cat_idx", plans[0])
+
+
+class ListSearchTest(TestCase):
+    """SearchFilter on the list endpoints is served by the full-text indexes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Job.objects.create(
+            job_title="Backend Developer", company="Zoho", location="Chennai",
+            description="Build <b>Django</b> APIs for developer tools",
+        )
+        Job.objects.create(job_title="Analyst", company="TCS", location="Pune", description="Reporting for a developer team")
+        Job.objects.create(job_title="Designer", company="Infosys", location="Noida", description="Figma")
+
+    def setUp(self):
+        cache.clear()
+        caches["responses"].clear()
+        gallery_view_counter.reset()
+        self.client = APIClient()
+
+    def test_matches_are_ranked_and_highlighted(self):
+        results = self.client.get("/api/v1/jobs/", {"search": "develop"}).json()["results"]
+        self.assertEqual([job["job_title"] for job in results], ["Backend Developer", "Analyst"])
+        # Stored text is escaped, only the match markers become tags
+        self.assertIn("&lt;b&gt;Django&lt;/b&gt;", results[0]["highlight"])
+        self.assertIn("<mark>developer</mark>", results[0]["highlight"])
+
+        results = self.client.get("/api/v1/jobs/", {"search": "develop", "ordering": "job_title"}).json()["results"]
+        self.assertEqual([job["job_title"] for job in results], ["Analyst", "Backend Developer"])
+
+        results = self.client.get("/api/v1/jobs/").json()["results"]
+        self.assertNotIn("highlight", results[0])
+
+    def test_event_matches_keep_their_rank(self):
+        for name, description in [("Alumni Meet", "Alumni dinner for alumni"), ("Sports Day", "Alumni welcome")]:
+            Event.objects.create(
+                event_name=name, date=timezone.now(), event_type="Reunion", location="Delhi", description=description,
+            )
+        results = self.client.get("/api/v1/events/", {"search": "alumni"}).json()["results"]
+        self.assertEqual([event["event_name"] for event in results], ["Alumni Meet", "Sports Day"])
+
+        results = self.client.get("/api/v1/events/").json()["results"]
+        self.assertEqual([event["event_name"] for event in results], ["Sports Day", "Alumni Meet"])
+
+    def test_index_follows_saves_across_viewsets(self):
+        job = Job.objects.get(job_title="Designer")
+        job.description = "Figma and Sketch"
+        job.save()
+        results = self.client.get("/api/v1/jobs/", {"search": "sketch"}).json()["results"]
+        self.assertEqual([job["job_title"] for job in results], ["Designer"])
+
+        NewsFeed.objects.create(title="Convocation", content="Convocation photos are up", type="Update")
+        results = self.client.get("/api/v1/newsfeeds/", {"search": "photo"}).json()["results"]
+        self.assertEqual(results[0]["highlight"], "Convocation <mark>photos</mark> are up")
+
+        user = User.objects.create(username="priya")
+        UserInfo.objects.create(user=user, first_name="Priya", last_name="Sharma", email="priya@gmail.com")
+        self.client.force_authenticate(user)
+        results = self.client.get("/api/v1/auth/users/", {"search": "shar"}).json()["results"]
+        self.assertEqual([info["first_name"] for info in results], ["Priya"])
+
+
+@override_settings(RESPONSE_CACHE=None)
+class ViewSetKeysetPaginationTest(TestCase):
+    """List endpoints page by cursor unless the client passes an offset."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.jobs = [
+            Job.objects.create(job_title=f"Job {i}", company="TCS", salary=[300, 100, 200][i % 3])
+            for i in range(7)
+        ]
+        # Undated rows sort after every dated one
+        Job.objects.filter(pk__in=[cls.jobs[1].pk, cls.jobs[4].pk]).update(posted_date=None)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def walk(self, params):
+        titles = []
+        cursor = None
+        while True:
+            page_params = dict(params, **({"cursor": cursor} if cursor else {}))
+            with CaptureQueriesContext(connection) as queries:
+                page = self.client.get("/api/v1/jobs/", page_params).json()
+            self.assertFalse([q for q in queries if 'COUNT(*) AS "__count"' in q["sql"]])
+            self.assertLessEqual(len(page["results"]), int(params["limit"]))
+            titles += [job["job_title"] for job in page["results"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return titles
+
+    def test_cursor_pages_follow_the_view_ordering(self):
+        expected = list(
+            Job.objects.order_by(F("posted_date").desc(nulls_last=True), "-id").values_list("job_title", flat=True)
+        )
+        self.assertEqual(expected[-2:], ["Job 4", "Job 1"])
+        # A limit of 3 puts a cursor on the first undated row
+        for limit in (2, 3):
+            self.assertEqual(self.walk({"limit": limit}), expected)
+
+        expected = list(Job.objects.order_by("salary", "id").values_list("job_title", flat=True))
+        self.assertEqual(self.walk({"limit": 3, "ordering": "salary"}), expected)
+
+    def test_offset_flag_keeps_limit_offset_pages(self):
+        page = self.client.get("/api/v1/jobs/", {"limit": 2, "offset": 2}).json()
+        self.assertEqual(page["count"], 7)
+        self.assertIn("offset=4", page["next"])
+        self.assertIn("previous", page)
+
+    def test_requests_without_paging_params_get_a_cursor_page(self):
+        for path in ("/api/v1/jobs/", "/api/v1/events/", "/api/v1/newsfeeds/"):
+            page = self.client.get(path).json()
+            self.assertIn("next_cursor", page, path)
+            self.assertNotIn("count", page, path)
+
+        with patch.object(ViewSetKeysetPagination, "page_size", 3):
+            page = self.client.get("/api/v1/jobs/").json()
+        self.assertEqual(len(page["results"]), 3)
+        self.assertIsNotNone(page["next_cursor"])
+
+    def test_offset_pages_are_bounded_without_a_limit(self):
+        with patch.object(ViewSetKeysetPagination, "page_size", 3), \
+                patch.object(ViewSetKeysetPagination, "max_page_size", 5):
+            page = self.client.get("/api/v1/jobs/", {"offset": 0}).json()
+            self.assertEqual((page["count"], len(page["results"])), (7, 3))
+            page = self.client.get("/api/v1/jobs/", {"offset": 0, "limit": 500}).json()
+            self.assertEqual(len(page["results"]), 5)
+
+    def test_invalid_cursor_is_a_404(self):
+        self.assertEqual(self.client.get("/api/v1/jobs/", {"cursor": "bm90LWEtbGlzdA"}).status_code, 404)
+
+    def test_malformed_cursor_values_are_a_404(self):
+        for position in (["2020-01-01", "abc"], ["notadate", 1], [{"a": 1}, 1], [True, 1]):
+            cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+            self.assertEqual(self.client.get("/api/v1/jobs/", {"cursor": cursor}).status_code, 404, position)
+
+
+@override_settings(RESPONSE_CACHE=None)
+class PaginationCountTest(TestCase):
+    """Limit/offset totals are exact when small, cached, and estimated when large."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            Job.objects.create(job_title=f"Job {i}", company="TCS")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def count_queries(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            page = self.client.get("/api/v1/jobs/", params).json()
+        return page, [q for q in queries if "COUNT(*)" in q["sql"]]
+
+    def test_small_results_are_counted_exactly_once(self):
+        page, counts = self.count_queries({"limit": 2, "offset": 0})
+        self.assertEqual((page["count"], page["count_exact"]), (5, True))
+        self.assertEqual(len(counts), 1)
+
+        page, counts = self.count_queries({"limit": 2, "offset": 2})
+        self.assertEqual((page["count"], page["count_exact"]), (5, True))
+        self.assertEqual(counts, [])
+
+        # A different filter is a different count
+        page, counts = self.count_queries({"limit": 2, "offset": 0, "search": "zzz"})
+        self.assertEqual(page["count"], 0)
+
+    def test_saves_invalidate_cached_counts(self):
+        self.count_queries({"limit": 2, "offset": 0})
+        Job.objects.create(job_title="Job 5", company="TCS")
+        page, counts = self.count_queries({"limit": 2, "offset": 0})
+        self.assertEqual(page["count"], 6)
+        self.assertEqual(len(counts), 1)
+
+    @skipUnless(connection.vendor == "sqlite", "reads SQLite's ANALYZE statistics")
+    @override_settings(COUNT_EXACT_THRESHOLD=2)
+    def test_large_results_use_the_estimate(self):
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        Job.objects.filter(job_title="Job 0").delete()
+        page, _ = self.count_queries({"limit": 2, "offset": 2})
+        # The statistics predate the delete
+        self.assertEqual((page["count"], page["count_exact"]), (5, False))
+        self.assertIn("offset=4", page["next"])
+
+        # A short page ends the list whatever the estimate says
+        page, _ = self.count_queries({"limit": 2, "offset": 4})
+        self.assertEqual(len(page["results"]), 0)
+        self.assertIsNone(page["next"])
+
+        # Filtered results have no estimate and are counted in full
+        page, _ = self.count_queries({"limit": 2, "offset": 0, "company__iexact": "tcs"})
+        self.assertEqual((page["count"], page["count_exact"]), (4, True))
+
+
+class MentorListingTest(TestCase):
+    def test_listing_costs_one_query(self):
+        for i in range(6):
+            create_mentor(f"mentor{i}")
+        with self.assertNumQueries(1):
+            response = APIClient().get("/api/v1/mentorship/mentors/")
+        self.assertEqual(len(response.data), 6)
+        self.assertTrue(all(mentor["can_accept_mentees"] for mentor in response.data))
+
+
+class MentorshipStatusTransitionTest(TestCase):
+    def setUp(self):
+        self.profile = create_mentor("mentor", capacity=1)
+        self.client = APIClient()
+        self.client.force_authenticate(user=User.objects.create(username="mentee"))
+        response = self.client.post(
+            "/api/v1/mentorship/mentorship-requests/",
+            {"mentor_id": self.profile.user_id, "goals": "Placement prep"}, format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.request_id = response.data["id"]
+        self.client.force_authenticate(user=self.profile.user)
+
+    def _set_status(self, new_status, expected_status=200):
+        response = self.client.put(
+            f"/api/v1/mentorship/mentorship-requests/{self.request_id}/",
+            {"status": new_status}, format="json",
+        )
+        self.assertEqual(response.status_code, expected_status)
+        self.profile.refresh_from_db()
+        return response.data
+
+    def test_counters_follow_status_transitions(self):
+        self.profile.refresh_from_db()
+        # Pending requests do not use capacity
+        self.assertEqual(self.profile.active_mentees, 0)
+        self.assertTrue(self.profile.can_accept_more_mentees())
+
+        self._set_status("accepted")
+        self.assertEqual(self.profile.active_mentees, 1)
+        self.assertFalse(self.profile.can_accept_more_mentees())
+
+        self._set_status("accepted")  # no transition, no double count
+        self.assertEqual(self.profile.active_mentees, 1)
+
+        self._set_status("completed")
+        self.assertEqual(self.profile.active_mentees, 0)
+        self.assertEqual(self.profile.count_active_mentees(), 0)
+
+    def test_accepting_needs_a_free_slot(self):
+        other = APIClient()
+        other.force_authenticate(user=User.objects.create(username="second"))
+        response = other.post(
+            "/api/v1/mentorship/mentorship-requests/",
+            {"mentor_id": self.profile.user_id, "goals": "Interview prep"}, format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        second_id = response.data["id"]
+
+        self._set_status("accepted")
+        response = self.client.put(
+            f"/api/v1/mentorship/mentorship-requests/{second_id}/", {"status": "accepted"}, format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.active_mentees, 1)
+        self.assertEqual(MentorshipRequest.objects.get(pk=second_id).status, "pending")
+
+        # A full mentor takes no new requests either
+        response = APIClient()
+        response.force_authenticate(user=User.objects.create(username="third"))
+        response = response.post(
+            "/api/v1/mentorship/mentorship-requests/",
+            {"mentor_id": self.profile.user_id, "goals": "Resume review"}, format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_mentor_cannot_be_changed(self):
+        other = create_mentor("other-mentor", capacity=1)
+        response = self.client.put(
+            f"/api/v1/mentorship/mentorship-requests/{self.request_id}/",
+            {"mentor_id": other.user_id, "status": "accepted"}, format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(MentorshipRequest.objects.get(pk=self.request_id).mentor_id, self.profile.user_id)
+        self.profile.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual((self.profile.active_mentees, other.active_mentees), (0, 0))
+
+
+class MentorshipCapacityConcurrencyTest(TransactionTestCase):
+    """Concurrent accepts must never push a mentor past mentoring_capacity."""
+
+    capacity = 5
+    students = 40
+
+    def test_capacity_is_never_exceeded(self):
+        profile = create_mentor("busy-mentor", capacity=self.capacity)
+        requests = [
+            MentorshipRequest.objects.create(
+                mentee=User.objects.create(username=f"student{i}"), mentor=profile.user,
+                goals="Placement season",
+            )
+            for i in range(self.students)
+        ]
+        start = threading.Barrier(len(requests))
+
+        def accept(mentorship_request):
+            client = APIClient()
+            client.force_authenticate(user=profile.user)
+            try:
+                if connection.vendor == "sqlite":
+                    # The shared-cache test database locks whole tables against
+                    # readers; a file database lets them read during a write
+                    connection.cursor().execute("PRAGMA read_uncommitted = 1")
+                start.wait()
+                return client.put(
+                    f"/api/v1/mentorship/mentorship-requests/{mentorship_request.pk}/",
+                    {"status": "accepted"}, format="json",
+                ).status_code
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+            codes = list(pool.map(accept, requests))
+        elapsed = time.perf_counter() - started
+
+        profile.refresh_from_db()
+        self.assertEqual(codes.count(200), self.capacity)
+        self.assertEqual(codes.count(400), self.students - self.capacity)
+        self.assertEqual(profile.active_mentees, self.capacity)
+        self.assertEqual(profile.count_active_mentees(), self.capacity)
+        self.assertLess(elapsed, 10)
+
+
+@override_settings(REQUEST_PROFILING=True, REQUEST_PROFILING_QUERY_THRESHOLD=0)
+class QueryProfilingMiddlewareTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create(username="admin", is_staff=True)
+        for i in range(4):
+            create_mentor(f"mentor{i}")
+
+    def setUp(self):
+        profile_registry.reset()
+        self.client = APIClient()
+
+    def test_timings_are_reported_and_aggregated(self):
+        with self.assertLogs("api.profiling", level="WARNING") as logs:
+            response = self.client.get("/api/v1/mentorship/mentors/")
+
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="1 queries", serialize;dur=[\d.]+, total;dur=[\d.]+$',
+        )
+        self.assertEqual(len(logs.records), 1)
+        self.assertTrue(logs.records[0].getMessage().startswith("GET /api/v1/mentorship/mentors/ ran 1 queries"))
+
+        self.client.force_authenticate(user=self.admin)
+        results = self.client.get("/api/v1/profiling/").data["results"]
+        mentors = results["GET /api/v1/mentorship/mentors/"]
+        self.assertEqual((mentors["requests"], mentors["max_queries"]), (1, 1))
+        self.assertEqual(mentors["query_histogram"]["<=1"], 1)
+        self.assertGreater(mentors["mean_bytes"], 0)
+
+    def test_aggregates_are_admin_only(self):
+        self.assertEqual(self.client.get("/api/v1/profiling/").status_code, 401)
+
+
+def image_bytes(size, image_format="PNG"):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "navy").save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def image_data_uri(size, image_format="PNG"):
+    encoded = base64.b64encode(image_bytes(size, image_format)).decode()
+    return f"data:image/{image_format.lower()};base64,{encoded}"
+
+
+@override_settings(BACKGROUND_TASKS_EAGER=True)
+class AlumniRegistrationTest(TestCase):
+    """Signup writes everything in one transaction and defers the follow-ups."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def register(self, **overrides):
+        data = {
+            "firstName": "Arjun", "lastName": "Mehta", "email": "arjun.mehta@gmail.com",
+            "phone": "+91 9876543210", "address": "12 MG Road, Delhi",
+            "graduationYear": date.today().year - 2, "batch": "2020", "department": "BCA",
+            "studentId": "VIPS/TC/2020/042", "experience": 2,
+            "linkedin": "https://linkedin.com/in/arjun-vips",
+            "cv": image_data_uri((10, 10)),
+        }
+        data.update(overrides)
+        with self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as ctx:
+                response = APIClient().post("/api/v1/registration-requests/", data, format="json")
+        self.queries = [q["sql"] for q in ctx.captured_queries]
+        return response
+
+    def test_auto_approval_writes_the_score_once(self):
+        response = self.register(avatar=image_data_uri((1200, 900), "JPEG"))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["status"], "auto_approved")
+        score = AlumniVerificationScore.objects.get()
+        self.assertEqual((score.verification_status, score.total_score), ("auto_approved", 7))
+        self.assertFalse([q for q in self.queries if q.startswith('UPDATE "cms_alumniverificationscore"')])
+        self.assertFalse(RegistrationRequest.objects.exists())
+
+        user_info = UserInfo.objects.select_related("user").get(user__email="arjun.mehta@gmail.com")
+        self.assertTrue(user_info.user.check_password("temp_password_123"))
+        self.assertEqual(Image.open(user_info.avatar.path).size, (512, 384))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("approved", mail.outbox[0].subject)
+
+    def test_shrunk_avatar_reaches_the_cached_profile(self):
+        user = User.objects.create(username="kavya")
+        user_info = UserInfo.objects.create(
+            user=user, first_name="Kavya", last_name="Iyer", email="kavya@gmail.com",
+            avatar=ContentFile(image_bytes((1200, 900), "JPEG"), name="kavya.jpg"),
+        )
+        original = get_user_profile(user.pk).data["avatar"]
+
+        shrink_avatar(user_info.id)
+
+        user_info.refresh_from_db()
+        self.assertNotEqual(user_info.avatar.url, original)
+        self.assertEqual(get_user_profile(user.pk).data["avatar"], user_info.avatar.url)
+
+    def test_low_score_is_queued_for_review(self):
+        response = self.register(studentId="42", linkedin="", cv=None, graduationYear=1990)
+
+        self.assertEqual(response.data["status"], "manual_review")
+        self.assertEqual(AlumniVerificationScore.objects.get().verification_status, "manual_review")
+        self.assertTrue(RegistrationRequest.objects.filter(email="arjun.mehta@gmail.com").exists())
+        self.assertFalse(User.objects.exists())
+        self.assertIn("submitted for review", mail.outbox[0].body)
+
+    def test_failure_rolls_back_everything(self):
+        # The username is taken even though no account has this email
+        User.objects.create(username="arjun.mehta@gmail.com", email="arjun@old-mail.com")
+
+        response = self.register()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(AlumniVerificationScore.objects.exists())
+        self.assertFalse(UserInfo.objects.exists())
+        self.assertEqual(mail.outbox, [])
+
+
+@override_settings(BACKGROUND_TASKS_EAGER=True)
+class UploadLimitsTest(TestCase):
+    """Files stream in as multipart; base64 and JSON bodies are capped."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.form = {
+            "firstName": "Rohan", "lastName": "Das", "email": "rohan.das@gmail.com",
+            "phone": "+91 9811122233", "address": "Kolkata", "graduationYear": 2012,
+            "batch": "2008", "department": "BCA", "studentId": "42", "experience": 9,
+            "skills": ["Python", "Django"],
+        }
+
+    def post(self, data, format):
+        return APIClient().post("/api/v1/registration-requests/", data, format=format)
+
+    def test_multipart_upload_is_written_to_media(self):
+        cv = SimpleUploadedFile("cv.png", image_bytes((300, 400)), content_type="image/png")
+
+        response = self.post({**self.form, "cv": cv}, "multipart")
+
+        self.assertEqual(response.status_code, 201)
+        registration = RegistrationRequest.objects.get()
+        self.assertEqual(registration.skills, ["Python", "Django"])
+        self.assertTrue(registration.cv.path.startswith(self.media_root))
+        self.assertEqual(Image.open(registration.cv.path).size, (300, 400))
+
+    @override_settings(UPLOAD_MAX_SIZE=1024)
+    def test_oversized_multipart_upload_is_rejected(self):
+        cv = SimpleUploadedFile("cv.png", image_bytes((300, 400)) + b"\0" * 2048, content_type="image/png")
+
+        response = self.post({**self.form, "cv": cv}, "multipart")
+
+        self.assertEqual(response.status_code, 413)
+        self.assertIn("cv is larger than", response.data["detail"])
+        self.assertFalse(RegistrationRequest.objects.exists())
+
+    @override_settings(UPLOAD_MAX_SIZE=1024)
+    def test_oversized_admin_upload_is_a_bad_request(self):
+        admin_user = User.objects.create(username="admin", is_staff=True, is_superuser=True)
+        self.client.force_login(admin_user)
+        image = SimpleUploadedFile("holi.png", image_bytes((300, 400)) + b"\0" * 2048, content_type="image/png")
+
+        with self.assertLogs("django.security", level="ERROR"):
+            response = self.client.post("/admin/cms/galleryimage/add/", {"title": "Holi", "image": image})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(GalleryImage.objects.exists())
+
+    @override_settings(BASE64_UPLOAD_MAX_SIZE=1024)
+    def test_base64_images_are_capped(self):
+        small = image_data_uri((4, 4))
+        large = image_data_uri((200, 200), "BMP")
+
+        self.assertEqual(self.post({**self.form, "cv": small}, "json").status_code, 201)
+        response = self.post({**self.form, "email": "rohan@das.in", "cv": large}, "json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("multipart/form-data", str(response.data["cv"][0]))
+
+    @override_settings(JSON_BODY_MAX_SIZE=1024)
+    def test_json_body_is_capped(self):
+        response = self.post({**self.form, "address": "x" * 2048}, "json")
+        self.assertEqual(response.status_code, 413)
+
+
+CALLS = []
+
+
+@background_task(max_attempts=2)
+def record_call(value):
+    CALLS.append(value)
+
+
+@background_task(max_attempts=2)
+def always_fail():
+    raise ValueError("SMTP unavailable")
+
+
+@override_settings(BACKGROUND_TASKS_EAGER=False, BACKGROUND_TASK_RETRY_DELAY=0)
+class TaskQueueTest(TransactionTestCase):
+    """Tasks are stored with the request's data and run by the worker."""
+
+    def setUp(self):
+        CALLS.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def run_worker(self):
+        return Worker(concurrency=2).run(once=True)
+
+    def test_tasks_commit_and_roll_back_with_the_caller(self):
+        defer(record_call, "kept")
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            defer(record_call, "rolled back")
+            raise RuntimeError
+
+        self.assertEqual(self.run_worker(), 1)
+        self.assertEqual(CALLS, ["kept"])
+        self.assertEqual(Task.objects.get().status, Task.DONE)
+
+    def test_failures_are_retried_then_marked_failed(self):
+        task = defer(always_fail)
+
+        with self.assertLogs("api.task_queue", level="WARNING"):
+            self.assertEqual(self.run_worker(), 2)
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.attempts), (Task.FAILED, 2))
+        self.assertIn("SMTP unavailable", task.last_error)
+
+    def test_expired_lease_is_claimed_again(self):
+        defer(record_call, "once")
+        crashed = claim("crashed-worker", 10, visibility_timeout=60)
+        self.assertEqual(claim("other-worker", 10, visibility_timeout=60), [])
+
+        Task.objects.update(locked_until=timezone.now())
+        self.assertEqual(self.run_worker(), 1)
+        # The stale lease holder can no longer record a result
+        run_task(crashed[0], "crashed-worker")
+        task = Task.objects.get()
+        self.assertEqual((task.status, task.attempts, CALLS), (Task.DONE, 2, ["once", "once"]))
+        self.assertNotEqual(task.locked_by, "crashed-worker")
+
+    def test_approval_sets_the_password_and_defers_the_email(self):
+        Role.objects.create(id=2, role_name="Alumni")
+        staff = User.objects.create(username="admin", is_staff=True)
+        registration = RegistrationRequest.objects.create(
+            firstName="Kavya", lastName="Iyer", email="kavya.iyer@gmail.com", phone="+91 9876501234",
+            address="Chennai", graduationYear=2019, batch="2015", department="BBA",
+            studentId="VIPS/TC/2015/007", experience=4,
+        )
+        client = APIClient()
+        client.force_authenticate(user=staff)
+
+        response = client.put(f"/api/v1/registration-requests/{registration.pk}/approve/")
+
+        self.assertEqual(response.status_code, 200)
+        user = User.objects.get(email="kavya.iyer@gmail.com")
+        # The account can log in before any worker has run
+        self.assertTrue(user.check_password("12345678"))
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(self.run_worker(), 1)
+        self.assertEqual(mail.outbox[0].to, ["kavya.iyer@gmail.com"])
+
+    def test_gallery_upload_queues_its_variants(self):
+        owner = User.objects.create(username="photographer")
+        image = GalleryImage(title="Holi 2024", event_date=date(2024, 3, 25), uploaded_by=owner)
+        image.image.save("holi.jpg", ContentFile(image_bytes((1600, 1200), "JPEG")), save=False)
+        image.save()
+        image.increment_view_count()
+
+        self.assertEqual(Task.objects.filter(name="api.tasks.generate_gallery_derivatives").count(), 1)
+        self.assertEqual(self.run_worker(), 1)
+        image.refresh_from_db()
+        self.assertEqual(Image.open(image.thumbnail.path).size, (400, 300))
+        self.assertEqual([size["width"] for size in image.variants["sizes"]], [480, 960])
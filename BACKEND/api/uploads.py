@@ -0,0 +1,84 @@
+from django.conf import settings
+from django.core.exceptions import RequestDataTooBig
+from django.core.files.uploadhandler import FileUploadHandler
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.parsers import JSONParser, MultiPartParser
+
+UPLOAD_MAX_SIZE = 10 * 1024 * 1024
+JSON_BODY_MAX_SIZE = 20 * 1024 * 1024
+
+
+class RequestEntityTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "Request entity too large."
+    default_code = "too_large"
+
+
+class UploadTooLarge(RequestDataTooBig):
+    """A multipart file passed ``UPLOAD_MAX_SIZE``; Django answers it with a 400."""
+
+
+def _human_size(size):
+    return f"{size / (1024 * 1024):g} MB"
+
+
+class UploadSizeLimitHandler(FileUploadHandler):
+    """
+    Rejects a multipart file as soon as it grows past ``UPLOAD_MAX_SIZE``.
+
+    Listed before ``TemporaryFileUploadHandler`` in ``FILE_UPLOAD_HANDLERS``:
+    chunks are counted here and passed on to be written to a temporary file,
+    so neither an oversized nor a valid upload is ever held in memory whole.
+
+    It runs for every view, so it raises a Django exception: plain views
+    (the admin) answer 400, and :class:`BoundedMultiPartParser` turns it
+    into a 413 for the API.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.max_size = getattr(settings, "UPLOAD_MAX_SIZE", UPLOAD_MAX_SIZE)
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > self.max_size:
+            raise UploadTooLarge(
+                f"{self.field_name} is larger than the {_human_size(self.max_size)} upload limit."
+            )
+        return raw_data
+
+    def file_complete(self, file_size):
+        return None
+
+
+class BoundedMultiPartParser(MultiPartParser):
+    """``MultiPartParser`` answering uploads over ``UPLOAD_MAX_SIZE`` with a 413."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return super().parse(stream, media_type, parser_context)
+        except UploadTooLarge as exc:
+            raise RequestEntityTooLarge(str(exc))
+
+
+class BoundedJSONParser(JSONParser):
+    """
+    JSON parser that refuses bodies over ``JSON_BODY_MAX_SIZE`` before reading
+    them. Base64 images are only accepted in JSON for older clients; large
+    files should be sent as multipart, which streams to disk.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        max_size = getattr(settings, "JSON_BODY_MAX_SIZE", JSON_BODY_MAX_SIZE)
+        request = (parser_context or {}).get("request")
+        try:
+            length = int(request.META.get("CONTENT_LENGTH") or 0) if request is not None else 0
+        except ValueError:
+            length = 0
+        if length > max_size:
+            raise RequestEntityTooLarge(
+                f"JSON body is larger than {_human_size(max_size)}; send files as multipart/form-data."
+            )
+        return super().parse(stream, media_type, parser_context)
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework import routers  # type: ignore
-from .views import JobViewSet, EventViewSet, NewsFeedViewSet,PostViewSet, CommentListGetCreateView, RegistrationRequestView, gallery_images, gallery_categories, gallery_tags
+from .views import JobViewSet, EventViewSet, NewsFeedViewSet,PostViewSet, CommentListGetCreateView, RegistrationRequestView, gallery_images, gallery_categories, gallery_tags, request_profiles, response_cache_metrics
 
 router = routers.DefaultRouter()
 
@@ -25,4 +25,9 @@ urlpatterns = [
     
     # Mentorship System URLs
     path('mentorship/', include('api.mentorship_urls')),
+
+    # Request profiling aggregates (admin only)
+    path('profiling/', request_profiles, name='request-profiles'),
+    # Anonymous response cache hit/miss counters (admin only)
+    path('response-cache/', response_cache_metrics, name='response-cache-metrics'),
 ]
@@ -1,24 +1,40 @@
 from rest_framework import viewsets, permissions, filters, generics, status
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes, action
-from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
+from rest_framework.exceptions import NotFound
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet
 from django_filters import CharFilter, NumberFilter
 
+from .conditional import CollectionVersion, ConditionalListMixin, collection_state, conditional_collection
+from .pagination import KeysetPagination, ViewSetKeysetPagination
+from .profiling import registry as profile_registry
+from .response_cache import CachedListMixin, cache_anonymous_response, stats as response_cache_stats
 from .serializers import serializers
 from .serializers.serializers import RegistrationRequestSerializer
+from .task_queue import defer
+from .tasks import send_registration_email, shrink_avatar
 from cms.models import (
     Job, Event, NewsFeed, Post, Comment, RegistrationRequest, 
     AlumniVerificationScore, Role, GalleryImage, GalleryCategory, 
-    GalleryTag, GalleryAlbum
+    GalleryTag, GalleryAlbum, GalleryComment, GalleryLike
 )
+from cms.normalization import normalize
+from cms.caching import GALLERY_CATEGORIES_CACHE_KEY, GALLERY_CATEGORIES_CACHE_TIMEOUT
+from cms.search import IndexedSearchFilter, event_index, gallery_image_index, job_index, newsfeed_index, post_index
+from cms.view_counts import gallery_view_counter
+from authorization.authentication import get_user_by_email, role_id_of
 from authorization.models import UserInfo
 from authorization.serializer import UserInfoSerializer
 from authorization.views import AlumniVerificationService
 
+import hashlib
 import json
 
 class RegistrationRequestFilter(FilterSet):
@@ -33,6 +49,47 @@ class RegistrationRequestFilter(FilterSet):
         fields = ["first_name", "last_name", "email"]
 
 
+class NormalizedExactFilter(CharFilter):
+    """
+    Case-insensitive exact match as plain equality on a normalized shadow
+    column (see cms/normalization.py), which a B-tree index can serve. The
+    built-in ``iexact`` compiles to ``LIKE`` on SQLite and ``UPPER()`` on
+    Postgres, and neither uses one.
+    """
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+        return qs.filter(**{self.field_name: normalize(value)})
+
+
+class JobListFilter(FilterSet):
+    jobType__iexact = NormalizedExactFilter(field_name="job_type_norm")
+    location__iexact = NormalizedExactFilter(field_name="location_norm")
+    company__iexact = NormalizedExactFilter(field_name="company_norm")
+
+    class Meta:
+        model = Job
+        fields = []
+
+
+class EventListFilter(FilterSet):
+    event_type__iexact = NormalizedExactFilter(field_name="event_type_norm")
+    location__iexact = NormalizedExactFilter(field_name="location_norm")
+
+    class Meta:
+        model = Event
+        fields = []
+
+
+class NewsFeedListFilter(FilterSet):
+    type__iexact = NormalizedExactFilter(field_name="type_norm")
+
+    class Meta:
+        model = NewsFeed
+        fields = []
+
+
 # Create your views here.
 
 
@@ -53,29 +110,28 @@ class JobFilter(FilterSet):
         }
 
 
-class JobViewSet(viewsets.GenericViewSet):
+class JobViewSet(CachedListMixin, ConditionalListMixin, viewsets.GenericViewSet):
     """
     ViewSet for managing job postings.
     """
 
     queryset = Job.objects.all().order_by("-posted_date")
-    pagination_class = LimitOffsetPagination
+    response_cache_models = [Job]
+    pagination_class = ViewSetKeysetPagination
     serializer_class = serializers.JobSerializer
     permission_classes = [permissions.AllowAny]
     lookup_field = "id"
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        IndexedSearchFilter,
     ]
 
     search_fields = ["job_title", "company", "description", "location"]
+    search_index = job_index
+    search_highlight_field = "description"
     # filterset_class = JobFilter
-    filterset_fields = {
-        "jobType": ["iexact"],
-        "location": ["iexact"],
-        "company": ["iexact"],
-    }
+    filterset_class = JobListFilter
     ordering_fields = ["posted_date", "salary", "experience", "job_title"]
     ordering = ["-posted_date"]  # Default ordering by posted date, descending
 
@@ -108,11 +164,8 @@ class JobViewSet(viewsets.GenericViewSet):
         """
         if request.user.is_authenticated:
 
-          
-            user = request.user
-            user_info = UserInfo.objects.get(user=user)
-
-            if user_info.role.id == 1:
+            # Token claims or the cached profile, so the role check costs no queries
+            if role_id_of(request) in (None, 1):
                 return Response(
                     {
                         "status": status.HTTP_401_UNAUTHORIZED,
@@ -180,30 +233,30 @@ class JobViewSet(viewsets.GenericViewSet):
             )
 
 
-class EventViewSet(viewsets.GenericViewSet):
+class EventViewSet(CachedListMixin, ConditionalListMixin, viewsets.GenericViewSet):
     """
     ViewSet for managing events.
     """
 
     queryset = Event.objects.all().order_by("-date")  # Default ordering by event date
-    pagination_class = LimitOffsetPagination
+    response_cache_models = [Event]
+    pagination_class = ViewSetKeysetPagination
     serializer_class = serializers.EventSerializer
     permission_classes = [permissions.AllowAny]
     lookup_field = "id"
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        IndexedSearchFilter,
     ]
 
     # Searchable fields
     search_fields = ["event_name", "description", "location", "event_type"]
+    search_index = event_index
+    search_highlight_field = "description"
 
     # Filterable fields
-    filterset_fields = {
-        "event_type": ["iexact"],  # Case-insensitive exact match for event type
-        "location": ["iexact"],  # Case-insensitive exact match for location
-    }
+    filterset_class = EventListFilter  # Case-insensitive event type and location
 
     # Fields allowed for ordering
     ordering_fields = ["date", "event_name", "event_type", "location"]
@@ -211,9 +264,11 @@ class EventViewSet(viewsets.GenericViewSet):
 
     def list(self, request, *args, **kwargs):
         """
-        List all events.
+        List all events, newest first unless a search ranks them.
         """
-        queryset = self.filter_queryset(self.get_queryset()).order_by("-id")
+        queryset = self.filter_queryset(self.get_queryset())
+        if not request.query_params.get(IndexedSearchFilter.search_param, "").strip():
+            queryset = queryset.order_by("-id")
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
@@ -289,7 +344,7 @@ class EventViewSet(viewsets.GenericViewSet):
             )
 
 
-class NewsFeedViewSet(viewsets.GenericViewSet):
+class NewsFeedViewSet(CachedListMixin, ConditionalListMixin, viewsets.GenericViewSet):
     """
     ViewSet for managing NewsFeed.
     """
@@ -297,23 +352,24 @@ class NewsFeedViewSet(viewsets.GenericViewSet):
     queryset = NewsFeed.objects.all().order_by(
         "-date_posted"
     )  # Default ordering by date_posted
-    pagination_class = LimitOffsetPagination
+    response_cache_models = [NewsFeed]
+    pagination_class = ViewSetKeysetPagination
     serializer_class = serializers.NewsFeedSerializer
     permission_classes = [permissions.AllowAny]
     lookup_field = "id"
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        IndexedSearchFilter,
     ]
 
     # Searchable fields
     search_fields = ["title", "content", "type"]
+    search_index = newsfeed_index
+    search_highlight_field = "content"
 
     # Filterable fields
-    filterset_fields = {
-        "type": ["iexact"],  # Case-insensitive exact match for type
-    }
+    filterset_class = NewsFeedListFilter  # Case-insensitive type
 
     # Fields allowed for ordering
     ordering_fields = ["date_posted", "title", "type"]
@@ -410,17 +466,19 @@ class PostViewSet(viewsets.GenericViewSet):
     queryset = Post.objects.all().order_by(
         "-created_at"
     )  # Default ordering by date_posted
-    pagination_class = LimitOffsetPagination
+    pagination_class = ViewSetKeysetPagination
     serializer_class = serializers.PostSerializer
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = "id"
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        IndexedSearchFilter,
     ]
 
     search_fields = ["post"]
+    search_index = post_index
+    search_highlight_field = "post"
 
     # filterset_fields = {
     #     "post": ["iexact"],  
@@ -433,18 +491,34 @@ class PostViewSet(viewsets.GenericViewSet):
         """
         List all posts.
         """
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(
+            Prefetch("comments", queryset=Comment.objects.order_by("-created_at"))
+        )
 
-        
-        
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
+            serializer = self.get_post_list_serializer(page)
             return self.get_paginated_response(serializer.data)
 
-        serializer = self.get_serializer(queryset, many=True)
+        serializer = self.get_post_list_serializer(list(queryset))
         return Response({"status": status.HTTP_200_OK, "results": serializer.data})
 
+    def get_post_list_serializer(self, posts):
+        """
+        Build the list serializer with every post author and commenter
+        resolved up front, so a page costs the same number of queries
+        regardless of its size.
+        """
+        user_ids = set()
+        for post in posts:
+            user_ids.add(post.created_by_id)
+            user_ids.update(comment.user_id for comment in post.comments.all())
+        user_ids.discard(None)
+
+        context = self.get_serializer_context()
+        context["user_infos"] = serializers.build_user_info_map(user_ids)
+        return self.get_serializer(posts, many=True, context=context)
+
     def create(self, request, *args, **kwargs):
         """
         Create a new post.
@@ -500,93 +574,91 @@ class RegistrationRequestView(viewsets.GenericViewSet):
 
     def create(self, request):
         """Enhanced alumni registration with auto-approval scoring"""
-        serializer = self.get_serializer(data=request.data)
-        if serializer.is_valid():
-            try:
-                # Check if user already exists
-                existing_user = User.objects.filter(email=serializer.validated_data['email']).first()
-                if existing_user:
-                    return Response({
-                        "message": "User with this email already exists"
-                    }, status=status.HTTP_400_BAD_REQUEST)
-                
-                # Calculate alumni verification score
-                verification_scores = AlumniVerificationService.calculate_alumni_score(serializer.validated_data)
-                
-                # Create verification score record
-                alumni_verification = AlumniVerificationScore.objects.create(
-                    email=serializer.validated_data['email'],
-                    student_id=serializer.validated_data.get('studentId', ''),
-                    graduation_year=serializer.validated_data.get('graduationYear', 0),
-                    department=serializer.validated_data.get('department', ''),
-                    linkedin_profile=serializer.validated_data.get('linkedin', ''),
-                    student_id_score=verification_scores['student_id_score'],
-                    graduation_year_score=verification_scores['graduation_year_score'],
-                    linkedin_score=verification_scores['linkedin_score'],
-                    document_score=verification_scores['document_score'],
-                    total_score=verification_scores['total_score']
-                )
-                
-                # Check if auto-approval criteria is met
-                if alumni_verification.is_auto_approvable():
-                    # Auto-approve and create user account
-                    user = User.objects.create_user(
-                        username=serializer.validated_data['email'],
-                        email=serializer.validated_data['email'],
-                        first_name=serializer.validated_data['firstName'],
-                        last_name=serializer.validated_data['lastName'],
-                        password='temp_password_123'  # User will reset via email
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+
+        if get_user_by_email(data['email']):
+            return Response({
+                "message": "User with this email already exists"
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        # Score once, in memory; the row is written with its final status
+        verification_scores = AlumniVerificationService.calculate_alumni_score(data)
+        alumni_verification = AlumniVerificationScore(
+            email=data['email'],
+            student_id=data.get('studentId', ''),
+            graduation_year=data.get('graduationYear', 0),
+            department=data.get('department', ''),
+            linkedin_profile=data.get('linkedin', ''),
+            student_id_score=verification_scores['student_id_score'],
+            graduation_year_score=verification_scores['graduation_year_score'],
+            linkedin_score=verification_scores['linkedin_score'],
+            document_score=verification_scores['document_score'],
+        )
+        auto_approved = alumni_verification.is_auto_approvable()
+        alumni_verification.verification_status = 'auto_approved' if auto_approved else 'manual_review'
+
+        try:
+            with transaction.atomic():
+                if auto_approved:
+                    user = User(
+                        username=data['email'],
+                        email=data['email'],
+                        first_name=data['firstName'],
+                        last_name=data['lastName'],
                     )
-                    
-                    # Create UserInfo profile
-                    UserInfo.objects.create(
+                    # Set in this transaction so the account can log in as soon
+                    # as it exists, whether or not a worker is running
+                    user.set_password('temp_password_123')  # User will reset via email
+                    user.save()
+                    user_info = UserInfo.objects.create(
                         user=user,
-                        first_name=serializer.validated_data['firstName'],
-                        last_name=serializer.validated_data['lastName'],
-                        email=serializer.validated_data['email'],
-                        phone=serializer.validated_data.get('phone', ''),
-                        address=serializer.validated_data.get('address', ''),
-                        graduation_year=serializer.validated_data.get('graduationYear'),
-                        batch=serializer.validated_data.get('batch'),
-                        current_company=serializer.validated_data.get('currentCompany', ''),
-                        current_position=serializer.validated_data.get('currentPosition', ''),
-                        experience=str(serializer.validated_data.get('experience', '')),
-                        skills=serializer.validated_data.get('skills', []),
-                        interests=serializer.validated_data.get('interests', []),
-                        achievements=serializer.validated_data.get('achievements', ''),
-                        linkedin=serializer.validated_data.get('linkedin', ''),
+                        first_name=data['firstName'],
+                        last_name=data['lastName'],
+                        email=data['email'],
+                        avatar=data.get('avatar'),
+                        phone=data.get('phone', ''),
+                        address=data.get('address', ''),
+                        graduation_year=data.get('graduationYear'),
+                        batch=data.get('batch'),
+                        current_company=data.get('currentCompany', ''),
+                        current_position=data.get('currentPosition', ''),
+                        experience=str(data.get('experience', '')),
+                        skills=data.get('skills', []),
+                        interests=data.get('interests', []),
+                        achievements=data.get('achievements', ''),
+                        linkedin=data.get('linkedin', ''),
                     )
-                    
-                    alumni_verification.verification_status = 'auto_approved'
-                    alumni_verification.save()
-                    
-                    return Response({
-                        "message": "Congratulations! Your alumni registration has been automatically approved.",
-                        "status": "auto_approved",
-                        "verification_score": verification_scores['total_score'],
-                        "next_steps": "Please check your email for login instructions."
-                    }, status=status.HTTP_201_CREATED)
-                
+                    if user_info.avatar:
+                        defer(shrink_avatar, user_info.id)
                 else:
-                    # Create registration request for manual review
-                    registration_request = serializer.save()
-                    alumni_verification.verification_status = 'manual_review'
-                    alumni_verification.save()
-                    
-                    return Response({
-                        "message": "Your alumni registration has been submitted for review.",
-                        "status": "manual_review",
-                        "verification_score": verification_scores['total_score'],
-                        "required_score": alumni_verification.auto_approval_threshold,
-                        "next_steps": "Our team will review your application within 3-5 business days."
-                    }, status=status.HTTP_201_CREATED)
-                    
-            except Exception as e:
-                return Response({
-                    "message": f"Registration failed: {str(e)}"
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+                    serializer.save()
+                alumni_verification.save()
+                defer(send_registration_email, data['email'], data['firstName'],
+                      alumni_verification.verification_status)
+        except IntegrityError:
+            # Another signup with the same email committed in between
+            return Response({
+                "message": "User with this email already exists"
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if auto_approved:
+            return Response({
+                "message": "Congratulations! Your alumni registration has been automatically approved.",
+                "status": "auto_approved",
+                "verification_score": alumni_verification.total_score,
+                "next_steps": "Please check your email for login instructions."
+            }, status=status.HTTP_201_CREATED)
+
+        return Response({
+            "message": "Your alumni registration has been submitted for review.",
+            "status": "manual_review",
+            "verification_score": alumni_verification.total_score,
+            "required_score": alumni_verification.auto_approval_threshold,
+            "next_steps": "Our team will review your application within 3-5 business days."
+        }, status=status.HTTP_201_CREATED)
 
     def list(self, request):
         
@@ -640,21 +712,29 @@ class RegistrationRequestView(viewsets.GenericViewSet):
         # instance.save()
 
         # Create user if not already exists
-        user = User.objects.filter(email=instance.email).first()
-      
-        if not user:
-            user = User.objects.create_user(
+        user = get_user_by_email(instance.email)
+        if user:
+            return Response({
+                "status": status.HTTP_200_OK,
+                "message": "User already exists.",
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        # Assign default role (id=2) for alumni
+        role = Role.objects.filter(id=2).first()
+        if not role:
+            return Response({"message": "Role does not exist"}, status=400)
+
+        with transaction.atomic():
+            user = User(
                 username=instance.email,
                 email=instance.email,
                 first_name=instance.firstName,
                 last_name=instance.lastName,
-                password='12345678'
             )
-            # Assign default role (id=2) for alumni
-            role = Role.objects.filter(id=2).first()
-            if not role:
-                user.delete()
-                return Response({"message": "Role does not exist"}, status=400)
+            # Set in this transaction so the account can log in as soon as
+            # it exists, whether or not a worker is running
+            user.set_password('12345678')
+            user.save()
 
             user_info = UserInfo.objects.create(
                 user=user,
@@ -679,15 +759,13 @@ class RegistrationRequestView(viewsets.GenericViewSet):
                 linkedin=instance.linkedin,
                 instagram=instance.instagram
             )
-            user_info.save()
 
             instance.isApproved = True
             instance.save()
-        else:   
-            return Response({
-                "status": status.HTTP_200_OK,
-                "message": "User already exists.",
-            }, status=status.HTTP_400_BAD_REQUEST)
+
+            defer(send_registration_email, instance.email, instance.firstName, 'approved')
+            if user_info.avatar:
+                defer(shrink_avatar, user_info.id)
 
         # Optionally, serialize and return user_info if you want
         return Response({
@@ -715,72 +793,111 @@ class RegistrationRequestView(viewsets.GenericViewSet):
 
 # Gallery API Views
 
+GALLERY_IMAGE_ORDERING = ['-priority', '-event_date', '-created_at', '-id']
+
+
+def count_related(queryset):
+    """Per-image row count of ``queryset`` as a correlated subquery."""
+    counts = queryset.filter(image=OuterRef('pk')).order_by().values('image').annotate(count=Count('id'))
+    return Coalesce(Subquery(counts.values('count')), 0)
+
+
+def count_cached_gallery_views(request, image_ids):
+    gallery_view_counter.record(image_ids)
+
+
+@cache_anonymous_response(
+    'gallery-images',
+    [GalleryImage, GalleryCategory, GalleryTag, GalleryLike, GalleryComment],
+    on_hit=count_cached_gallery_views,
+)
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def gallery_images(request):
-    """Get all public gallery images with filtering"""
+    """
+    Get public gallery images with filtering, one cursor page at a time.
+
+    Images come in (priority, event_date, created_at, id) order, or by
+    relevance when `search` is given. Each response holds one page of
+    `page_size` images (24 by default, max 100); pass the `cursor` returned
+    as `next_cursor` to fetch the next page.
+    """
     try:
         # Get query parameters
         category = request.GET.get('category', None)
         tag = request.GET.get('tag', None)
         search = request.GET.get('search', None)
         
-        # Base queryset - only public images
-        queryset = GalleryImage.objects.filter(is_public=True).select_related('category', 'album', 'uploaded_by').prefetch_related('tags')
+        # Base queryset - only public images, with like/comment counts
+        # computed in the same query. Correlated subqueries rather than joins
+        # keep it free of GROUP BY, so the page is read in index order
+        queryset = GalleryImage.objects.filter(is_public=True).select_related('category').prefetch_related('tags').annotate(
+            likes_count=count_related(GalleryLike.objects.all()),
+            approved_comments_count=count_related(GalleryComment.objects.filter(is_approved=True)),
+        )
         
         # Apply filters
         if category and category != 'all':
             queryset = queryset.filter(category__category_type=category)
         
         if tag and tag != 'all':
-            queryset = queryset.filter(tags__name__icontains=tag)
-        
-        if search:
+            # A semi-join, so images with several matching tags appear once
             queryset = queryset.filter(
-                title__icontains=search
-            ).union(
-                queryset.filter(description__icontains=search)
-            ).union(
-                queryset.filter(people_tagged__icontains=search)
-            ).union(
-                queryset.filter(special_guests__icontains=search)
+                id__in=GalleryImage.tags.through.objects.filter(gallerytag__name__icontains=tag).values('galleryimage_id')
             )
         
-        # Order by priority and date
-        queryset = queryset.order_by('-priority', '-event_date', '-created_at')
+        ordering = GALLERY_IMAGE_ORDERING
+        if search:
+            # Ranked lookup in the full-text index instead of LIKE scans
+            queryset = gallery_image_index.search(queryset, search)
+            ordering = ['-search_rank', '-id']
         
+        paginator = KeysetPagination(ordering)
+        images = paginator.paginate_queryset(queryset, request)
+
+        # Buffer view counts instead of issuing one UPDATE per image
+        pending_views = gallery_view_counter.record([image.id for image in images])
+
         # Serialize data
+        storage = GalleryImage._meta.get_field('image').storage
         images_data = []
-        for image in queryset:
-            # Increment view count
-            image.increment_view_count()
-            
+        for image in images:
             images_data.append({
                 'id': image.id,
                 'title': image.title,
                 'description': image.description,
                 'image': request.build_absolute_uri(image.image.url) if image.image else None,
                 'thumbnail': request.build_absolute_uri(image.thumbnail.url) if image.thumbnail else None,
+                'width': image.width,
+                'height': image.height,
+                # Resized copies for srcset, narrowest first
+                'variants': [
+                    {
+                        'width': variant['width'],
+                        'height': variant['height'],
+                        'webp': request.build_absolute_uri(storage.url(variant['webp'])),
+                        'jpeg': request.build_absolute_uri(storage.url(variant['jpeg'])),
+                    }
+                    for variant in image.variants.get('sizes', [])
+                ],
                 'category': image.category.category_type if image.category else None,
                 'tags': [tag.name for tag in image.tags.all()],
                 'event_date': image.event_date.isoformat(),
                 'event_location': image.event_location,
                 'people_tagged': image.people_tagged,
                 'special_guests': image.special_guests,
-                'view_count': image.view_count,
-                'likes': image.likes.count(),
-                'comments': image.comments.filter(is_approved=True).count(),
+                'view_count': image.view_count + pending_views.get(image.id, 0),
+                'likes': image.likes_count,
+                'comments': image.approved_comments_count,
                 'photographer': image.photographer,
                 'priority': image.priority,
                 'is_featured': image.is_featured,
             })
         
-        return Response({
-            'status': status.HTTP_200_OK,
-            'count': len(images_data),
-            'results': images_data
-        })
+        return paginator.get_paginated_response(images_data)
         
+    except NotFound:
+        raise
     except Exception as e:
         return Response({
             'status': status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -793,33 +910,23 @@ def gallery_images(request):
 def gallery_categories(request):
     """Get all active gallery categories with image counts"""
     try:
-        categories = GalleryCategory.objects.filter(is_active=True).order_by('order', 'name')
-        
-        categories_data = []
-        for category in categories:
-            image_count = GalleryImage.objects.filter(category=category, is_public=True).count()
-            categories_data.append({
-                'id': category.id,
-                'name': category.name,
-                'category_type': category.category_type,
-                'color_code': category.color_code,
-                'count': image_count
-            })
-        
-        # Add "All Photos" option
-        total_count = GalleryImage.objects.filter(is_public=True).count()
-        all_photos = {
-            'id': 'all',
-            'name': 'All Photos',
-            'category_type': 'all',
-            'color_code': '#dc2626',
-            'count': total_count
-        }
-        
-        return Response({
+        entry = cache.get(GALLERY_CATEGORIES_CACHE_KEY)
+        if entry is None:
+            results = build_gallery_categories()
+            # Validate on the payload itself: cached hits then cost no queries,
+            # and rebuilds or other processes give equal data the same ETag
+            digest = hashlib.sha256(json.dumps(results, sort_keys=True).encode()).hexdigest()
+            entry = {'results': results, 'digest': digest}
+            cache.set(GALLERY_CATEGORIES_CACHE_KEY, entry, GALLERY_CATEGORIES_CACHE_TIMEOUT)
+
+        version = CollectionVersion(f"{request.build_absolute_uri()}|{entry['digest']}")
+        not_modified = version.not_modified(request)
+        if not_modified is not None:
+            return not_modified
+        return version.add_headers(Response({
             'status': status.HTTP_200_OK,
-            'results': [all_photos] + categories_data
-        })
+            'results': entry['results']
+        }))
         
     except Exception as e:
         return Response({
@@ -828,8 +935,43 @@ def gallery_categories(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def build_gallery_categories():
+    """
+    Count public images per category with a single GROUP BY; the "All Photos"
+    total is the sum over every group, including uncategorized images.
+    """
+    counts = dict(
+        GalleryImage.objects.filter(is_public=True)
+        .order_by()
+        .values_list('category_id')
+        .annotate(count=Count('id'))
+    )
+    categories = GalleryCategory.objects.filter(is_active=True).order_by('order', 'name')
+
+    categories_data = []
+    for category in categories:
+        categories_data.append({
+            'id': category.id,
+            'name': category.name,
+            'category_type': category.category_type,
+            'color_code': category.color_code,
+            'count': counts.get(category.id, 0)
+        })
+
+    # Add "All Photos" option
+    all_photos = {
+        'id': 'all',
+        'name': 'All Photos',
+        'category_type': 'all',
+        'color_code': '#dc2626',
+        'count': sum(counts.values())
+    }
+    return [all_photos] + categories_data
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
+@conditional_collection(lambda request: [collection_state(GalleryTag.objects.all(), 'updated_at')])
 def gallery_tags(request):
     """Get featured gallery tags"""
     try:
@@ -846,4 +988,38 @@ def gallery_tags(request):
         return Response({
             'status': status.HTTP_500_INTERNAL_SERVER_ERROR,
             'message': f'Error fetching tags: {str(e)}'
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAdminUser])
+def request_profiles(request):
+    """
+    GET: Per-view query count and latency histograms from the profiling middleware
+    DELETE: Reset the histograms
+    """
+    if request.method == 'DELETE':
+        profile_registry.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    return Response({
+        'status': status.HTTP_200_OK,
+        'results': profile_registry.snapshot()
+    })
+
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAdminUser])
+def response_cache_metrics(request):
+    """
+    GET: Per-view hit/miss counters of the anonymous response cache
+    DELETE: Reset the counters
+    """
+    if request.method == 'DELETE':
+        response_cache_stats.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    return Response({
+        'status': status.HTTP_200_OK,
+        'results': response_cache_stats.snapshot()
+    })
@@ -0,0 +1,88 @@
+from django.contrib.auth.models import User
+from django.db.models.functions import Lower
+from django.utils.functional import SimpleLazyObject
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from .caching import get_user_profile
+
+
+class ClaimsUser(SimpleLazyObject):
+    """
+    The authenticated user as described by the token claims. ``id``, ``pk``,
+    ``role_id`` and ``is_superuser`` are read from the token; anything else
+    (or using it as a foreign key) loads the ``User`` row on first use.
+    """
+
+    def __init__(self, token):
+        user_id = token[api_settings.USER_ID_CLAIM]
+        super().__init__(lambda: User.objects.get(pk=user_id))
+        self.__dict__.update(
+            id=user_id,
+            pk=user_id,
+            role_id=token["role_id"],
+            is_superuser=token["is_superuser"],
+            is_active=True,
+            is_authenticated=True,
+            is_anonymous=False,
+        )
+
+    def __bool__(self):
+        # Permission checks test ``request.user`` for truth; that alone must
+        # not load the row
+        return True
+
+
+class RoleClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that trusts the role claims of RoleRefreshToken tokens.
+
+    The token's ``profile_version`` is checked against the cached user
+    profile, so a warm cache authenticates without database queries and a
+    token issued before a role, superuser or active change is rejected.
+    Tokens without role claims are authenticated the usual way.
+    """
+
+    def get_user(self, validated_token):
+        if "profile_version" not in validated_token:
+            return super().get_user(validated_token)
+
+        profile = get_user_profile(validated_token[api_settings.USER_ID_CLAIM])
+        if not profile.is_active or profile.version != validated_token["profile_version"]:
+            raise AuthenticationFailed("Token is stale, please log in again", code="token_stale")
+        return ClaimsUser(validated_token)
+
+
+def role_id_of(request):
+    """The role of the requesting user, from token claims when present."""
+    role_id = getattr(request.user, "role_id", None)
+    if role_id is not None:
+        return role_id
+    return request.user_info.role_id
+
+
+def get_user_by_email(email):
+    """
+    Case-insensitive user lookup by email, served by the LOWER(email) index
+    on auth_user, so its cost does not grow with the table.
+    """
+    return (
+        User.objects.alias(email_lower=Lower("email"))
+        .filter(email_lower=email.strip().lower())
+        .order_by("id")
+        .first()
+    )
+
+
+def authenticate_by_email(email, password):
+    """
+    Return the user if the password matches, else None. Unknown emails run
+    the password hasher too, so every failed login costs the same and the
+    response time does not reveal which emails are registered.
+    """
+    user = get_user_by_email(email)
+    if user is None:
+        User().set_password(password)
+        return None
+    return user if user.check_password(password) else None
@@ -0,0 +1,105 @@
+import time
+import zlib
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+
+from .models import UserInfo
+from .serializer import UserInfoSerializer
+
+
+USER_PROFILE_CACHE_KEY = "user_profile:{generation}:{user_id}"
+# Bumped on every Role change, which retires all cached profiles at once
+USER_PROFILE_GENERATION_KEY = "user_profile:generation"
+# Safety net for writes that bypass signals (bulk_create, update()); with a
+# per-process cache this is also how long other workers may serve stale roles
+USER_PROFILE_CACHE_TIMEOUT = 300
+
+
+class UserProfile:
+    """
+    The cached authorization profile of a user: role and the serialized
+    ``UserInfo``. Available on every request as ``request.user_info``.
+    """
+
+    def __init__(self, user_id=None, user_info_id=None, role_id=None, role_name=None,
+                 is_superuser=False, is_active=False, data=None):
+        self.user_id = user_id
+        self.user_info_id = user_info_id
+        self.role_id = role_id
+        self.role_name = role_name
+        self.is_superuser = is_superuser
+        self.is_active = is_active
+        self.data = data
+
+    def __bool__(self):
+        return self.user_info_id is not None
+
+    @property
+    def version(self):
+        """
+        Fingerprint of everything a token's role claims depend on. It changes
+        whenever the role, superuser or active flag does, which is what makes
+        older tokens stale.
+        """
+        state = f"{self.role_id}:{self.is_superuser}:{self.is_active}"
+        return zlib.crc32(state.encode())
+
+    def __repr__(self):
+        return f"<UserProfile user={self.user_id} role={self.role_name}>"
+
+    @classmethod
+    def from_user_info(cls, user_info):
+        return cls(
+            user_id=user_info.user_id,
+            user_info_id=user_info.id,
+            role_id=user_info.role_id,
+            role_name=user_info.role.role_name if user_info.role else None,
+            is_superuser=user_info.user.is_superuser,
+            is_active=user_info.user.is_active,
+            data=dict(UserInfoSerializer(user_info).data),
+        )
+
+
+ANONYMOUS_PROFILE = UserProfile()
+
+
+def _profile_key(user_id):
+    # Start from the clock, so an evicted generation never comes back to a
+    # value that older entries were cached under
+    generation = cache.get_or_set(USER_PROFILE_GENERATION_KEY, time.time_ns, None)
+    return USER_PROFILE_CACHE_KEY.format(generation=generation, user_id=user_id)
+
+
+def get_user_profile(user_id):
+    """Return the user's profile, loading and caching it on a miss."""
+    if user_id is None:
+        return ANONYMOUS_PROFILE
+    key = _profile_key(user_id)
+    cached = cache.get(key)
+    if cached is not None:
+        return UserProfile(**cached)
+
+    user_info = (
+        UserInfo.objects.filter(user_id=user_id).select_related("role", "user").order_by("id").first()
+    )
+    if user_info:
+        profile = UserProfile.from_user_info(user_info)
+    else:
+        # Users without a UserInfo are cached too, so they do not query every time
+        flags = User.objects.filter(pk=user_id).values("is_superuser", "is_active").first()
+        profile = UserProfile(user_id=user_id, **(flags or {}))
+    cache.set(key, vars(profile), USER_PROFILE_CACHE_TIMEOUT)
+    return profile
+
+
+def invalidate_user_profile(user_id):
+    cache.delete(_profile_key(user_id))
+
+
+def invalidate_all_user_profiles():
+    try:
+        cache.incr(USER_PROFILE_GENERATION_KEY)
+    except ValueError:
+        # No generation stored yet, so nothing has been cached under one either
+        pass
@@ -0,0 +1,82 @@
+import statistics
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIClient
+
+from authorization.authentication import get_user_by_email
+from cms.models import Role
+from cms.seeding import chunked
+
+
+PASSWORD = 'password123'
+
+
+class Command(BaseCommand):
+    help = 'Show login cost against the number of users, for known and unknown emails'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000, 100000, 1000000])
+        parser.add_argument('--repeat', type=int, default=200, help='Lookups per measurement')
+        parser.add_argument('--logins', type=int, default=5, help='Full login requests per measurement')
+
+    def handle(self, *args, **options):
+        password_hash = make_password(PASSWORD)
+        client = APIClient()
+        rows = []
+
+        # Everything is rolled back, so the benchmark never touches real data
+        with transaction.atomic():
+            # Login gives users without a UserInfo the default role
+            Role.objects.get_or_create(id=1, defaults={'role_name': 'Student'})
+            seeded = 0
+            for size in sorted(options['sizes']):
+                self.seed(seeded, size, password_hash)
+                seeded = size
+                # Probe the middle of the table, in mixed case
+                known = f'Benchmark.User{size // 2}@VIPSTC.edu.in'
+                unknown = f'nobody{size}@vipstc.edu.in'
+                rows.append((
+                    size,
+                    self.measure(lambda: get_user_by_email(known), options['repeat']),
+                    self.measure(lambda: User.objects.filter(email=known.lower()).first(), options['repeat']),
+                    self.measure(lambda: self.login(client, known), options['logins']),
+                    self.measure(lambda: self.login(client, unknown), options['logins']),
+                ))
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('📊 Login cost by table size (p50 in ms)'))
+        self.stdout.write(
+            f'   {"users":>10}{"indexed lookup":>16}{"unindexed":>12}{"login ok":>12}{"login unknown":>16}'
+        )
+        for size, indexed, scanned, known, unknown in rows:
+            self.stdout.write(
+                f'   {size:>10,}{indexed:>16.3f}{scanned:>12.3f}{known:>12.1f}{unknown:>16.1f}'
+            )
+
+    def seed(self, start, end, password_hash):
+        users = (
+            User(
+                username=f'benchmark.user{i}', email=f'benchmark.user{i}@vipstc.edu.in',
+                password=password_hash,
+            )
+            for i in range(start, end)
+        )
+        for chunk in chunked(users, 5000):
+            User.objects.bulk_create(chunk)
+
+    @staticmethod
+    def login(client, email):
+        return client.post('/api/v1/auth/login/', {'email': email, 'password': PASSWORD}, format='json')
+
+    @staticmethod
+    def measure(call, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
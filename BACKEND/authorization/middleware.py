@@ -0,0 +1,26 @@
+from django.utils.functional import SimpleLazyObject
+
+from .caching import get_user_profile
+
+
+class UserProfileMiddleware:
+    """
+    Expose the cached role and UserInfo of the current user as
+    ``request.user_info``.
+
+    The profile is resolved on first access, which inside a DRF view is after
+    JWT authentication has replaced ``request.user``; a warm cache costs no
+    queries.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.user_info = SimpleLazyObject(lambda: get_user_profile(self.user_id(request)))
+        return self.get_response(request)
+
+    @staticmethod
+    def user_id(request):
+        user = getattr(request, "user", None)
+        return user.pk if user is not None and user.is_authenticated else None
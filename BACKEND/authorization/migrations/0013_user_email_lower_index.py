@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Index auth_user on LOWER(email) so login and registration look users up
+    by case-normalized email without scanning the table. The expression is
+    the same on SQLite and Postgres; queries must filter on Lower("email")
+    (see authorization.authentication.get_user_by_email) to use it.
+    """
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('authorization', '0012_prepare_jsonfields'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS auth_user_email_lower_idx ON auth_user (LOWER(email))',
+            'DROP INDEX IF EXISTS auth_user_email_lower_idx',
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from cms.models import Role
+from .caching import invalidate_all_user_profiles, invalidate_user_profile
+from .models import UserInfo
+
+
+@receiver(post_save, sender=UserInfo)
+@receiver(post_delete, sender=UserInfo)
+def reset_user_info_profile(sender, instance, **kwargs):
+    invalidate_user_profile(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def reset_user_profile(sender, instance, **kwargs):
+    invalidate_user_profile(instance.pk)
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+def reset_role_profiles(sender, **kwargs):
+    invalidate_all_user_profiles()
@@ -1,3 +1,148 @@
-from django.test import TestCase
-
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.functions import Lower
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from cms.models import Job, Role
+from .authentication import get_user_by_email
+from .caching import get_user_profile
+from .models import UserInfo
+
+
+JOB = {
+    "job_title": "Backend Developer", "company": "Zoho", "location": "Chennai",
+    "description": "APIs", "jobType": "Full-Time", "salary": "900000.00",
+}
+
+
+class UserProfileCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student_role = Role.objects.create(id=1, role_name="Student", description="Student")
+        cls.alumni_role = Role.objects.create(id=2, role_name="Alumni", description="Alumni")
+        cls.user = User.objects.create_user(
+            username="priya", email="priya@gmail.com", password="password123"
+        )
+        cls.user_info = UserInfo.objects.create(
+            user=cls.user, role=cls.alumni_role, first_name="Priya", last_name="Sharma",
+            email=cls.user.email,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_role_check_on_job_create_is_free_when_cached(self):
+        self.assertEqual(self.client.post("/api/v1/jobs/", JOB, format="json").status_code, 200)
+        with self.assertNumQueries(2):  # the INSERT and its search index row
+            self.assertEqual(self.client.post("/api/v1/jobs/", JOB, format="json").status_code, 200)
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_profile_follows_user_info_and_role_changes(self):
+        self.assertEqual(get_user_profile(self.user.id).role_name, "Alumni")
+
+        self.user_info.role = self.student_role
+        self.user_info.save()
+        self.assertEqual(self.client.post("/api/v1/jobs/", JOB, format="json").status_code, 401)
+
+        self.student_role.role_name = "Current student"
+        self.student_role.save()
+        profile = get_user_profile(self.user.id)
+        self.assertEqual((profile.role_id, profile.data["role"]["role_name"]), (1, "Current student"))
+
+    def test_users_without_user_info_get_an_empty_profile(self):
+        user = User.objects.create(username="ghost")
+        self.assertFalse(get_user_profile(user.id))
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_user_profile(user.id).data)
+
+    def test_repeat_login_reads_the_cached_profile(self):
+        credentials = {"email": "priya@gmail.com", "password": "password123"}
+        first = APIClient().post("/api/v1/auth/login/", credentials, format="json")
+        with self.assertNumQueries(1):  # the user lookup
+            second = APIClient().post("/api/v1/auth/login/", credentials, format="json")
+        self.assertEqual(second.data["data"]["user_info"], first.data["data"]["user_info"])
+        self.assertEqual(second.data["data"]["role"]["role_name"], "Alumni")
+
+
+class RoleClaimsTokenTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student_role = Role.objects.create(id=1, role_name="Student", description="Student")
+        cls.alumni_role = Role.objects.create(id=2, role_name="Alumni", description="Alumni")
+        cls.user = User.objects.create_user(
+            username="arjun", email="arjun@gmail.com", password="password123"
+        )
+        cls.user_info = UserInfo.objects.create(
+            user=cls.user, role=cls.alumni_role, first_name="Arjun", last_name="Rao",
+            email=cls.user.email,
+        )
+
+    def setUp(self):
+        cache.clear()
+        response = APIClient().post(
+            "/api/v1/auth/login/", {"email": "arjun@gmail.com", "password": "password123"},
+            format="json",
+        )
+        self.access = response.data["data"]["access"]
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access}")
+
+    def test_access_token_carries_role_claims(self):
+        token = AccessToken(self.access)
+        self.assertEqual((token["role_id"], token["is_superuser"]), (2, False))
+        self.assertEqual(token["profile_version"], get_user_profile(self.user.id).version)
+
+    def test_role_gated_endpoint_is_authorized_from_claims(self):
+        with self.assertNumQueries(2):  # the INSERT and its search index row
+            response = self.client.post("/api/v1/jobs/", JOB, format="json")
+        self.assertEqual(response.status_code, 200)
+
+    def test_tokens_go_stale_when_the_role_changes(self):
+        self.user_info.role = self.student_role
+        self.user_info.save()
+        response = self.client.post("/api/v1/jobs/", JOB, format="json")
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.data["code"], "token_stale")
+
+    def test_deactivated_users_are_rejected(self):
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.post("/api/v1/jobs/", JOB, format="json").status_code, 401)
+
+
+class EmailLoginTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.role = Role.objects.create(id=1, role_name="Student", description="Student")
+        cls.user = User.objects.create_user(
+            username="neha", email="Neha.Verma@vipstc.edu.in", password="password123"
+        )
+
+    def _login(self, email, password="password123"):
+        return APIClient().post(
+            "/api/v1/auth/login/", {"email": email, "password": password}, format="json"
+        )
+
+    def test_email_lookup_is_case_insensitive_and_indexed(self):
+        self.assertEqual(get_user_by_email(" neha.verma@VIPSTC.edu.in "), self.user)
+        self.assertEqual(self._login("NEHA.VERMA@vipstc.edu.in").status_code, 200)
+        if connection.vendor == "sqlite":
+            plan = User.objects.alias(email_lower=Lower("email")).filter(email_lower="x").explain()
+            self.assertIn("auth_user_email_lower_idx", plan)
+
+    def test_unknown_email_and_wrong_password_fail_alike(self):
+        unknown = self._login("nobody@vipstc.edu.in")
+        wrong = self._login("neha.verma@vipstc.edu.in", password="letmein")
+        self.assertEqual((unknown.status_code, unknown.data), (wrong.status_code, wrong.data))
+
+    def test_registration_rejects_an_email_in_another_case(self):
+        response = APIClient().post("/api/v1/auth/signup/", {
+            "email": "NEHA.verma@vipstc.edu.in", "first_name": "Neha", "last_name": "Verma",
+            "password": "password123", "confirm_password": "password123",
+        }, format="json")
+        self.assertEqual(response.data["message"], "User already exists")
@@ -0,0 +1,21 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .caching import get_user_profile
+
+
+class RoleRefreshToken(RefreshToken):
+    """
+    Refresh token whose access tokens carry the user's role claims, so that
+    RoleClaimsJWTAuthentication can authorize without loading the user.
+    Refreshing re-uses the claims; a role change makes them stale, which
+    forces a new login.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        profile = get_user_profile(user.id)
+        token["role_id"] = profile.role_id
+        token["is_superuser"] = user.is_superuser
+        token["profile_version"] = profile.version
+        return token
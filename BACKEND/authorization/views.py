@@ -5,13 +5,16 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 # from rest_framework.authentication import TokenAuthentication
-from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.models import User
 from .serializer import UserInfoSerializer, LoginSerializer,  UserRegisterSerializer, RoleSerializer
 from .models import UserInfo
+from .authentication import authenticate_by_email, get_user_by_email
+from .caching import get_user_profile
+from .tokens import RoleRefreshToken
 from cms.models import Role, RegistrationRequest, AlumniVerificationScore
+from cms.search import IndexedSearchFilter, user_info_index
+from api.pagination import ViewSetKeysetPagination
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.pagination import LimitOffsetPagination
 import re
 from datetime import datetime
 
@@ -30,7 +33,7 @@ class RegisterView(viewsets.GenericViewSet):
             try:
 
                 # check if user already exists
-                user = User.objects.filter(email=serializer.validated_data['email']).first()
+                user = get_user_by_email(serializer.validated_data['email'])
 
                 # print(f"user = {user}")
 
@@ -124,7 +127,7 @@ class RegisterView(viewsets.GenericViewSet):
             
                 user_info.save()
 
-                token = RefreshToken.for_user(user)
+                token = RoleRefreshToken.for_user(user)
                 access = str(token.access_token)
                 refresh = str(token)
 
@@ -167,41 +170,39 @@ class LoginView(viewsets.GenericViewSet):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
 
-            # find the user
-            user = User.objects.filter(email=serializer.validated_data['email']).first()
+            # find the user and check the password, at the same cost whether
+            # or not the email is registered
+            user = authenticate_by_email(
+                serializer.validated_data['email'], serializer.validated_data['password']
+            )
 
             if user is None:
-                return Response({"error": "User does not exist"}, status=400)
-
-            # check password
-            if not user.check_password(serializer.validated_data['password']):
                 return Response({"error": "Email or Password wrong"}, status=400)
 
-            # create token
-            token = RefreshToken.for_user(user)
-            access = str(token.access_token)
-            refresh = str(token)
-
-            user_info = UserInfo.objects.filter(user=user).first()
+            # Repeat logins are served from the profile cache
+            profile = get_user_profile(user.id)
 
-            if user_info is None:
-                user_info = UserInfo.objects.create(
+            if not profile:
+                UserInfo.objects.create(
                     user=user,
                     first_name='',
                     last_name='',
                     email=user.email,
                     role= Role.objects.get(id=1)
                 )
+                profile = get_user_profile(user.id)
 
-            user_info_serializer = UserInfoSerializer(user_info)
-            role_serializer = RoleSerializer(user_info.role)
+            # create token, after the profile so it carries the role claims
+            token = RoleRefreshToken.for_user(user)
+            access = str(token.access_token)
+            refresh = str(token)
 
             return Response({
                 "message": "User logged in successfully",
                 "status": status.HTTP_200_OK,
                 "data": {
-                   "user_info": user_info_serializer.data,
-                   "role": role_serializer.data,
+                   "user_info": profile.data,
+                   "role": profile.data["role"],
 
                    
                    "access": access,
@@ -218,14 +219,15 @@ class UserInfoView(viewsets.GenericViewSet):
     queryset = UserInfo.objects.all().order_by('first_name')
     serializer_class = UserInfoSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = LimitOffsetPagination
+    pagination_class = ViewSetKeysetPagination
     lookup_field = 'user'
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        IndexedSearchFilter,
     ]
     search_fields = ["first_name", "last_name", "email"]
+    search_index = user_info_index
     filterset_fields = {
         # "role": ["id"],  
         # "role": ["id"],
@@ -146,7 +146,7 @@ class MentorProfileAdmin(admin.ModelAdmin):
     list_display = ['user', 'current_position', 'current_company', 'is_approved', 'is_active', 'created_at']
     list_filter = ['is_approved', 'is_active', 'created_at']
     search_fields = ['user__first_name', 'user__last_name', 'user__email', 'current_company', 'current_position']
-    readonly_fields = ['created_at', 'updated_at', 'total_mentorships', 'average_rating']
+    readonly_fields = ['created_at', 'updated_at', 'total_mentorships', 'average_rating', 'active_mentees']
     
     fieldsets = (
         ('User Information', {
@@ -162,7 +162,7 @@ class MentorProfileAdmin(admin.ModelAdmin):
             'fields': ('is_approved', 'is_active', 'approval_date', 'rejection_reason')
         }),
         ('Statistics', {
-            'fields': ('average_rating', 'total_mentorships', 'created_at', 'updated_at'),
+            'fields': ('average_rating', 'total_mentorships', 'active_mentees', 'created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
@@ -205,6 +205,20 @@ class MentorshipRequestAdmin(admin.ModelAdmin):
             'fields': ('progress_percentage', 'mentee_rating', 'mentor_rating', 'mentee_feedback', 'mentor_feedback')
         }),
     )
+    
+    def save_model(self, request, obj, form, change):
+        # Keep MentorProfile.active_mentees in step with status/mentor edits
+        previous = None
+        if change:
+            previous = MentorshipRequest.objects.filter(pk=obj.pk).values('mentor_id', 'status').first()
+        super().save_model(request, obj, form, change)
+        if previous and previous['mentor_id'] != obj.mentor_id:
+            MentorProfile.record_status_change(previous['mentor_id'], previous['status'], None)
+            MentorProfile.record_status_change(obj.mentor_id, None, obj.status)
+        else:
+            MentorProfile.record_status_change(
+                obj.mentor_id, previous['status'] if previous else None, obj.status
+            )
 
 
 @admin.register(MentorshipSession)
@@ -272,7 +286,7 @@ class GalleryImageAdmin(admin.ModelAdmin):
     list_display = ['title', 'album', 'category', 'event_date', 'priority', 'is_featured', 'view_count', 'uploaded_by']
     list_filter = ['priority', 'is_featured', 'is_public', 'category', 'event_date', 'created_at']
     search_fields = ['title', 'description', 'people_tagged', 'special_guests', 'event_location']
-    readonly_fields = ['view_count', 'tag_list', 'created_at', 'updated_at']
+    readonly_fields = ['view_count', 'tag_list', 'width', 'height', 'variants', 'created_at', 'updated_at']
     filter_horizontal = ['tags']
     
     actions = ['make_featured', 'make_public', 'make_private']
@@ -0,0 +1,10 @@
+from django.core.cache import cache
+
+
+GALLERY_CATEGORIES_CACHE_KEY = "gallery:categories"
+# Safety net for writes that bypass signals (bulk_create, update())
+GALLERY_CATEGORIES_CACHE_TIMEOUT = 300
+
+
+def invalidate_gallery_categories():
+    cache.delete(GALLERY_CATEGORIES_CACHE_KEY)
@@ -0,0 +1,110 @@
+import io
+import os
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+from .models import GalleryImage
+from .storage import register_references
+
+THUMBNAIL_SIZE = (400, 400)
+VARIANT_WIDTHS = [480, 960, 1600]
+VARIANT_FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+VARIANTS_DIR = "gallery/variants"
+
+
+def _encode(image, image_format, options):
+    output = io.BytesIO()
+    # Pillow only writes EXIF when it is passed explicitly, so this strips it
+    image.save(output, format=image_format, **options)
+    return ContentFile(output.getvalue())
+
+
+def _delete_derivatives(gallery_image):
+    storage = gallery_image.image.storage
+    for variant in gallery_image.variants.get("sizes", []):
+        for ext in VARIANT_FORMATS:
+            if variant.get(ext):
+                storage.delete(variant[ext])
+    if gallery_image.thumbnail:
+        storage.delete(gallery_image.thumbnail.name)
+
+
+def generate_derivatives(gallery_image):
+    """
+    Write a JPEG thumbnail plus WebP and JPEG copies at each of
+    ``VARIANT_WIDTHS`` narrower than the original, and record them with the
+    original's dimensions. Orientation from EXIF is applied, then EXIF is
+    dropped from every derivative. Saved with ``update()``, so the
+    ``post_save`` receivers do not queue the image again.
+    """
+    with gallery_image.image.open("rb") as f:
+        original = Image.open(f)
+        original.load()
+    image = ImageOps.exif_transpose(original).convert("RGB")
+    storage = gallery_image.image.storage
+    stem = os.path.splitext(os.path.basename(gallery_image.image.name))[0]
+
+    _delete_derivatives(gallery_image)
+
+    thumbnail = image.copy()
+    thumbnail.thumbnail(THUMBNAIL_SIZE)
+    thumbnail_name = storage.save(
+        gallery_image.thumbnail.field.generate_filename(gallery_image, f"{stem}.jpg"),
+        _encode(thumbnail, *VARIANT_FORMATS["jpeg"]),
+    )
+
+    sizes = []
+    for width in VARIANT_WIDTHS:
+        if width >= image.width:
+            break
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), Image.Resampling.LANCZOS)
+        variant = {"width": width, "height": height}
+        for ext, (image_format, options) in VARIANT_FORMATS.items():
+            variant[ext] = storage.save(
+                f"{VARIANTS_DIR}/{stem}_{width}.{ext}", _encode(resized, image_format, options)
+            )
+        sizes.append(variant)
+
+    fields = {
+        "thumbnail": thumbnail_name,
+        "width": image.width,
+        "height": image.height,
+        # The source name tells the signal whether the image was replaced since
+        "variants": {"source": gallery_image.image.name, "sizes": sizes},
+    }
+    GalleryImage.objects.filter(id=gallery_image.id).update(**fields)
+    return fields
+
+
+def needs_derivatives(gallery_image):
+    return bool(gallery_image.image) and gallery_image.variants.get("source") != gallery_image.image.name
+
+
+def process_gallery_image(image_id, force=False):
+    """
+    Generate derivatives for one image by id. Module level so the backfill
+    command can hand it to a process pool. Returns whether anything was written.
+    """
+    gallery_image = GalleryImage.objects.filter(id=image_id).first()
+    if gallery_image is None or not (force or needs_derivatives(gallery_image)):
+        return False
+    try:
+        generate_derivatives(gallery_image)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+@register_references
+def variant_names():
+    """Variant files are only referenced from the JSON, so tell the media GC about them."""
+    for variants in GalleryImage.objects.values_list("variants", flat=True).iterator():
+        for variant in (variants or {}).get("sizes", []):
+            for ext in VARIANT_FORMATS:
+                if variant.get(ext):
+                    yield variant[ext]
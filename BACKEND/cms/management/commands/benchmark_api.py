@@ -0,0 +1,210 @@
+import json
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from cms.mentorship_models import MentorshipRequest
+from cms.models import Comment, GalleryCategory, GalleryImage, NewsFeed, Post
+from cms.seeding import BulkLoader
+
+from .populate_indian_data import Command as PopulateCommand
+
+
+API = '/api/v1'
+# Every endpoint is measured with caches emptied before each request, then warm
+MODES = ['uncached', 'cached']
+CAPTION_WORDS = [
+    'diwali', 'holi', 'republic', 'parade', 'cricket', 'annual', 'dinner', 'alumni',
+    'visit', 'hostel', 'ceremony', 'yoga', 'sports', 'prize', 'guest', 'colonel',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed the configured database at the given scale inside a transaction that is '
+        'rolled back afterwards, and report latency, queries and response size for '
+        'the main API endpoints'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=2000, help='Users to seed, see populate_indian_data --scale')
+        parser.add_argument('--requests', type=int, default=50, help='Timed requests per endpoint')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--output', help='Write the results as a JSON baseline to this path')
+        parser.add_argument('--compare', help='Print the change against a JSON baseline written by --output')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 2:
+            raise CommandError('--requests must be at least 2 to compute percentiles')
+
+        # Everything is rolled back, so the benchmark never touches real data
+        with transaction.atomic():
+            started = time.perf_counter()
+            fixtures = self.seed(options['scale'], options['seed'])
+            self.stdout.write(f'🌱 Seeded scale {options["scale"]} in {time.perf_counter() - started:.1f}s')
+            results = {
+                name: {
+                    mode: self.measure(client, method, path, data, options['requests'], cached=mode == 'cached')
+                    for mode in MODES
+                }
+                for name, (client, method, path, data) in self.endpoints(fixtures).items()
+            }
+            transaction.set_rollback(True)
+        self.clear_caches()
+
+        baseline = None
+        if options['compare']:
+            with open(options['compare']) as f:
+                baseline = json.load(f)['endpoints']
+        self.report(results, baseline)
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump({
+                    'scale': options['scale'],
+                    'seed': options['seed'],
+                    'requests': options['requests'],
+                    'database': connection.vendor,
+                    'endpoints': results,
+                }, f, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS(f'✅ Wrote baseline to {options["output"]}'))
+
+    def seed(self, scale, seed):
+        loader = BulkLoader(PopulateCommand(), seed=seed)
+        loader.run(scale)
+        rng = loader.rng
+
+        users = list(User.objects.filter(userinfo__isnull=False).values_list('id', flat=True))
+        post_ids = loader.bulk_create(Post, (
+            Post(post=f'Update {i} from the hostel', created_by_id=rng.choice(users))
+            for i in range(max(scale // 4, 1))
+        ))
+        loader.bulk_create(Comment, (
+            Comment(post_id=post_id, user_id=rng.choice(users), content='Congratulations!')
+            for post_id in post_ids for _ in range(3)
+        ))
+        loader.bulk_create(NewsFeed, (
+            NewsFeed(title=f'Campus news {i}', content='Hostel announcement', type='Achievement')
+            for i in range(max(scale // 10, 1))
+        ))
+
+        categories = loader.bulk_create(GalleryCategory, (
+            GalleryCategory(name=label, category_type=key)
+            for key, label in GalleryCategory.CATEGORY_TYPES
+        ))
+        loader.bulk_create(GalleryImage, (
+            GalleryImage(
+                title=' '.join(rng.sample(CAPTION_WORDS, 3)),
+                description=' '.join(rng.choices(CAPTION_WORDS, k=15)),
+                image=f'gallery/images/bench_{i}.jpg',
+                category_id=rng.choice(categories),
+                event_date=date(2015, 1, 1) + timedelta(days=i % 3650),
+                priority=rng.choice(['low', 'medium', 'high']),
+                uploaded_by_id=rng.choice(users),
+            )
+            for i in range(max(scale // 4, 1))
+        ))
+        # The posts, news and gallery images above were inserted past the index receivers too
+        loader.rebuild_search_indexes()
+
+        busy_mentor = (
+            MentorshipRequest.objects.values_list('mentor_id', flat=True).order_by('mentor_id').first()
+        )
+        return {
+            'user': User.objects.filter(userinfo__role__role_name='Student').first(),
+            'mentor': User.objects.get(pk=busy_mentor) if busy_mentor else None,
+            'post_id': post_ids[0],
+        }
+
+    def endpoints(self, fixtures):
+        anonymous = APIClient()
+        member = APIClient()
+        member.force_authenticate(user=fixtures['user'])
+        mentor = APIClient()
+        mentor.force_authenticate(user=fixtures['mentor'] or fixtures['user'])
+        login = {'email': fixtures['user'].email, 'password': BulkLoader.PASSWORD}
+        return {
+            'jobs': (anonymous, 'get', f'{API}/jobs/', {'limit': 20}),
+            'events': (anonymous, 'get', f'{API}/events/', {'limit': 20}),
+            'newsfeeds': (anonymous, 'get', f'{API}/newsfeeds/', {'limit': 20}),
+            'posts': (member, 'get', f'{API}/posts/', {'limit': 20}),
+            'post_comments': (member, 'get', f'{API}/posts/{fixtures["post_id"]}/comments/', {}),
+            'gallery_images': (anonymous, 'get', f'{API}/gallery/images/', {'page_size': 20}),
+            'gallery_search': (anonymous, 'get', f'{API}/gallery/images/', {'search': 'diwali parade'}),
+            'gallery_categories': (anonymous, 'get', f'{API}/gallery/categories/', {}),
+            'mentors': (anonymous, 'get', f'{API}/mentorship/mentors/', {}),
+            'mentorship_requests': (mentor, 'get', f'{API}/mentorship/mentorship-requests/', {}),
+            'users': (member, 'get', f'{API}/auth/users/', {'limit': 20}),
+            'login': (anonymous, 'post', f'{API}/auth/login/', login),
+        }
+
+    @staticmethod
+    def clear_caches():
+        for backend in caches.all():
+            backend.clear()
+
+    def measure(self, client, method, path, data, repeat, cached):
+        """
+        Time ``repeat`` requests. Uncached requests start from empty caches,
+        so they measure the view itself rather than the response cache;
+        cached requests follow an untimed warm-up, as repeat visitors do.
+        """
+        send = getattr(client, method)
+        kwargs = {'format': 'json'} if method == 'post' else {}
+        self.clear_caches()
+        send(path, data, **kwargs)  # warm-up, untimed
+
+        timings, queries, sizes, statuses = [], [], [], set()
+        for _ in range(repeat):
+            if not cached:
+                self.clear_caches()
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                response = send(path, data, **kwargs)
+                timings.append((time.perf_counter() - started) * 1000)
+            queries.append(len(ctx.captured_queries))
+            sizes.append(len(response.content))
+            statuses.add(response.status_code)
+
+        cuts = statistics.quantiles(timings, n=100, method='inclusive')
+        return {
+            'p50_ms': round(statistics.median(timings), 2),
+            'p95_ms': round(cuts[94], 2),
+            'p99_ms': round(cuts[98], 2),
+            'queries': round(statistics.mean(queries), 1),
+            'bytes': round(statistics.mean(sizes)),
+            'status': sorted(statuses),
+        }
+
+    def report(self, results, baseline):
+        self.stdout.write(self.style.SUCCESS('📊 p50 / p95 / p99 in ms, mean queries and bytes per request'))
+        self.stdout.write(
+            f'   {"endpoint":<22}{"caches":<10}{"p50":>9}{"p95":>9}{"p99":>9}{"queries":>9}{"bytes":>10}  status'
+        )
+        for name, rows in results.items():
+            for mode, row in rows.items():
+                line = (
+                    f'   {name:<22}{mode:<10}{row["p50_ms"]:>9.2f}{row["p95_ms"]:>9.2f}{row["p99_ms"]:>9.2f}'
+                    f'{row["queries"]:>9}{row["bytes"]:>10}  {",".join(map(str, row["status"]))}'
+                )
+                previous = (baseline or {}).get(name, {}).get(mode)
+                if previous:
+                    line += (
+                        f'   p50 {self.change(previous["p50_ms"], row["p50_ms"])}'
+                        f' p95 {self.change(previous["p95_ms"], row["p95_ms"])}'
+                        f' queries {row["queries"] - previous["queries"]:+g}'
+                    )
+                self.stdout.write(line)
+
+    @staticmethod
+    def change(before, after):
+        if not before:
+            return 'n/a'
+        return f'{(after - before) / before * 100:+.0f}%'
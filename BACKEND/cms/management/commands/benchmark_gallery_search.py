@@ -0,0 +1,103 @@
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from cms.models import GalleryImage
+from cms.search import gallery_image_index
+
+
+WORDS = [
+    'diwali', 'holi', 'republic', 'independence', 'parade', 'colonel', 'general',
+    'cricket', 'football', 'mess', 'dinner', 'annual', 'function', 'alumni', 'visit',
+    'hostel', 'lawn', 'ceremony', 'yoga', 'sports', 'prize', 'distribution', 'guest',
+    'brigadier', 'major', 'captain', 'lohri', 'pongal', 'onam', 'navratri', 'garba',
+]
+SURNAMES = [
+    'sharma', 'verma', 'singh', 'rathore', 'chauhan', 'yadav', 'thapa', 'negi', 'rawat',
+    'bisht', 'gurung', 'iyer', 'nair', 'menon', 'pillai', 'reddy', 'rao', 'das', 'bose',
+    'ghosh', 'mukherjee', 'patil', 'kulkarni', 'deshmukh', 'joshi', 'mehta', 'shah',
+]
+RANKS = ['colonel', 'major', 'brigadier', 'captain']
+QUERIES = ['diwali', 'colonel parade', 'annual dinner', 'cric', 'rathore 2011', 'major negi']
+
+
+class Command(BaseCommand):
+    help = 'Compare gallery search latency of the full-text index against icontains scans'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[10000, 100000])
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per query')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        for size in options['sizes']:
+            # Everything is rolled back, so the benchmark never touches real data
+            with transaction.atomic():
+                self.seed(size, random.Random(options['seed']))
+                indexed = self.measure(self.indexed_search, options['repeat'])
+                scanned = self.measure(self.icontains_search, options['repeat'])
+                transaction.set_rollback(True)
+
+            self.stdout.write(self.style.SUCCESS(f'📊 {size:,} images (p50 / max in ms)'))
+            self.stdout.write(f'   {"query":<16}{"fts index":>22}{"icontains":>22}')
+            for query in QUERIES:
+                self.stdout.write(
+                    f'   {query:<16}{self.summary(indexed[query]):>22}'
+                    f'{self.summary(scanned[query]):>22}'
+                )
+
+    @staticmethod
+    def summary(timings):
+        return f'{statistics.median(timings):8.2f} / {max(timings):8.2f}'
+
+    def seed(self, size, rng):
+        user, _ = User.objects.get_or_create(username='gallery-benchmark')
+
+        def text(count):
+            return ' '.join(rng.choice(WORDS) for _ in range(count))
+
+        def people(count):
+            # Names plus batch years make selective terms, as in real captions
+            return ', '.join(
+                f'{rng.choice(SURNAMES)} {rng.randint(1990, 2024)}' for _ in range(count)
+            )
+
+        images = [
+            GalleryImage(
+                title=text(3), description=text(20), people_tagged=people(4),
+                special_guests=f'{rng.choice(RANKS)} {people(1)}',
+                image=f'gallery/images/bench_{i}.jpg',
+                event_date=date(2015, 1, 1) + timedelta(days=i % 3650), uploaded_by=user,
+            )
+            for i in range(size)
+        ]
+        GalleryImage.objects.bulk_create(images, batch_size=2000)
+        # bulk_create bypasses the post_save receivers that maintain the index
+        gallery_image_index.rebuild()
+
+    def measure(self, search, repeat):
+        timings = {}
+        for query in QUERIES:
+            timings[query] = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                list(search(query)[:24].values_list('id', flat=True))
+                timings[query].append((time.perf_counter() - started) * 1000)
+        return timings
+
+    def indexed_search(self, query):
+        queryset = GalleryImage.objects.filter(is_public=True)
+        return gallery_image_index.search(queryset, query).order_by('-search_rank', '-id')
+
+    def icontains_search(self, query):
+        queryset = GalleryImage.objects.filter(is_public=True)
+        return queryset.filter(
+            Q(title__icontains=query) | Q(description__icontains=query)
+            | Q(people_tagged__icontains=query) | Q(special_guests__icontains=query)
+        ).order_by('-priority', '-event_date', '-created_at')
@@ -0,0 +1,57 @@
+import os
+import time
+
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models
+
+from cms.storage import BLOB_DIR, ContentAddressedStorage, extra_references
+
+
+class Command(BaseCommand):
+    help = 'Delete the media blobs no row references'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--grace-hours', type=float, default=24,
+            help='Keep unreferenced blobs younger than this; their rows may not be committed yet',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Report what would be deleted')
+
+    def handle(self, *args, **options):
+        if not isinstance(default_storage, ContentAddressedStorage):
+            raise CommandError('The default storage is not cms.storage.ContentAddressedStorage')
+
+        references = set(self.referenced_names())
+
+        cutoff = time.time() - options['grace_hours'] * 3600
+        root = default_storage.path(BLOB_DIR)
+        removed, freed = [], 0
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                name = os.path.relpath(path, default_storage.location).replace(os.sep, '/')
+                if name in references or os.path.getmtime(path) > cutoff:
+                    continue
+                freed += os.path.getsize(path)
+                removed.append(name)
+                if not options['dry_run']:
+                    default_storage.remove_blob(name)
+
+        verb = 'Would delete' if options['dry_run'] else 'Deleted'
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {verb} {len(removed)} unreferenced blobs ({freed / (1024 * 1024):.1f} MB)'
+        ))
+
+    @staticmethod
+    def referenced_names():
+        for model in apps.get_models():
+            for field in model._meta.concrete_fields:
+                if not isinstance(field, models.FileField) or not isinstance(field.storage, ContentAddressedStorage):
+                    continue
+                yield from (
+                    model._default_manager.filter(**{f'{field.attname}__startswith': f'{BLOB_DIR}/'})
+                    .values_list(field.attname, flat=True).iterator()
+                )
+        yield from extra_references()
@@ -0,0 +1,63 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from cms.image_variants import needs_derivatives, process_gallery_image
+from cms.models import GalleryImage
+
+
+def _init_process():
+    # Spawned processes start without Django; forked ones already have it
+    django.setup()
+
+
+class Command(BaseCommand):
+    help = 'Generate thumbnails and resized WebP/JPEG variants for gallery images that lack them'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help='Processes decoding images in parallel; 1 runs in this process',
+        )
+        parser.add_argument('--force', action='store_true', help='Regenerate variants for every image')
+
+    def handle(self, *args, **options):
+        queryset = GalleryImage.objects.exclude(image='').only('id', 'image', 'variants')
+        image_ids = [image.id for image in queryset.iterator() if options['force'] or needs_derivatives(image)]
+        if not image_ids:
+            self.stdout.write(self.style.SUCCESS('✅ Every gallery image already has its variants'))
+            return
+
+        self.stdout.write(f'🖼️  Processing {len(image_ids)} images with {options["workers"]} workers')
+        started = time.perf_counter()
+        processed = failed = 0
+        if options['workers'] == 1:
+            for image_id in image_ids:
+                try:
+                    processed += process_gallery_image(image_id, options['force'])
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f'❌ Image {image_id}: {e}')
+        else:
+            # Children must open their own connections, never share the parent's
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=options['workers'], initializer=_init_process) as pool:
+                futures = {
+                    pool.submit(process_gallery_image, image_id, options['force']): image_id
+                    for image_id in image_ids
+                }
+                for future in as_completed(futures):
+                    try:
+                        processed += future.result()
+                    except Exception as e:
+                        failed += 1
+                        self.stderr.write(f'❌ Image {futures[future]}: {e}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Generated variants for {processed} images in {time.perf_counter() - started:.1f}s'
+            f' ({len(image_ids) - processed - failed} skipped, {failed} failed)'
+        ))
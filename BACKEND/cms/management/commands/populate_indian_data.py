@@ -7,9 +7,10 @@ from django.db import transaction
 from cms.models import *
 from cms.mentorship_models import *
 from authorization.models import UserInfo
+from cms.seeding import ScaledPopulateMixin
 
 
-class Command(BaseCommand):
+class Command(ScaledPopulateMixin, BaseCommand):
     help = 'Populate database with Indian-specific fake data'
 
     def add_arguments(self, parser):
@@ -18,6 +19,7 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing data before populating',
         )
+        self.add_scale_arguments(parser)
         parser.add_argument(
             '--debug',
             action='store_true',
@@ -31,6 +33,10 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING('Clearing existing data...'))
             self.clear_data()
         
+        if options['scale']:
+            self.populate_scaled(options)
+            return
+
         self.stdout.write(self.style.SUCCESS('Starting data population...'))
         
         try:
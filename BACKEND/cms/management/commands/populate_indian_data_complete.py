@@ -6,9 +6,10 @@ from django.utils import timezone
 from cms.models import *
 from cms.mentorship_models import *
 from authorization.models import UserInfo
+from cms.seeding import ScaledPopulateMixin
 
 
-class Command(BaseCommand):
+class Command(ScaledPopulateMixin, BaseCommand):
     help = 'Populate database with Indian-specific fake data'
 
     def add_arguments(self, parser):
@@ -17,12 +18,17 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing data before populating',
         )
+        self.add_scale_arguments(parser)
 
     def handle(self, *args, **options):
         if options['clear']:
             self.stdout.write('Clearing existing data...')
             self.clear_data()
         
+        if options['scale']:
+            self.populate_scaled(options)
+            return
+
         self.stdout.write('Starting data population...')
         
         # Populate in order due to dependencies
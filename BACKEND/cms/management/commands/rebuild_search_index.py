@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from cms.search import SEARCH_INDEXES
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search indexes from the source tables'
+
+    def handle(self, *args, **options):
+        for index in SEARCH_INDEXES:
+            index.rebuild()
+            self.stdout.write(self.style.SUCCESS(f'✅ Rebuilt search index for {index.model_label}'))
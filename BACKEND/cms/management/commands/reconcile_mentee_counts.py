@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from cms.mentorship_models import MentorProfile, MentorshipRequest
+
+
+class Command(BaseCommand):
+    help = 'Repair drift between MentorProfile.active_mentees and accepted mentorship requests'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted mentors without fixing them',
+        )
+
+    def handle(self, *args, **options):
+        with MentorProfile.capacity_guard():
+            accepted = dict(
+                MentorshipRequest.objects.filter(status='accepted')
+                .order_by()
+                .values_list('mentor_id')
+                .annotate(count=Count('id'))
+            )
+            drifted = []
+            for profile in MentorProfile.objects.select_for_update().select_related('user'):
+                actual = accepted.get(profile.user_id, 0)
+                if profile.active_mentees != actual:
+                    self.stdout.write(
+                        f'   {profile.user.username}: {profile.active_mentees} → {actual}'
+                    )
+                    profile.active_mentees = actual
+                    drifted.append(profile)
+
+            if drifted and not options['dry_run']:
+                MentorProfile.objects.bulk_update(drifted, ['active_mentees'], batch_size=500)
+
+        verb = 'Found' if options['dry_run'] else 'Repaired'
+        self.stdout.write(self.style.SUCCESS(f'✅ {verb} {len(drifted)} drifted mentor profiles'))
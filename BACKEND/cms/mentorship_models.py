@@ -1,8 +1,17 @@
-from django.db import models
+import threading
+from contextlib import contextmanager
+
+from django.db import connection, models, transaction
+from django.db.models import F
 from django.contrib.auth.models import User
 from django.db.models import JSONField
 
 
+# SQLite has no row locks; serialize capacity changes within the process so
+# concurrent requests queue here instead of failing with "database is locked"
+_sqlite_capacity_lock = threading.Lock()
+
+
 class MentorProfile(models.Model):
     """Model for alumni who want to become mentors"""
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='mentor_profile')
@@ -11,6 +20,7 @@ class MentorProfile(models.Model):
     current_company = models.CharField(max_length=255)
     current_position = models.CharField(max_length=255)
     mentoring_capacity = models.IntegerField(default=3, help_text="Maximum number of mentees at one time")
+    active_mentees = models.IntegerField(default=0, help_text="Accepted mentorships, maintained on status changes")
     availability = models.JSONField(default=dict, help_text="Available time slots for mentoring")
     bio = models.TextField(help_text="Detailed bio and mentoring philosophy")
     linkedin_url = models.URLField(blank=True, null=True)
@@ -39,13 +49,50 @@ class MentorProfile(models.Model):
     
     def get_current_mentees_count(self):
         """Get current number of active mentees"""
-        from cms.mentorship_models import MentorshipRequest
-        return MentorshipRequest.objects.filter(mentor=self.user, status='accepted').count()
+        return self.active_mentees
 
     def can_accept_more_mentees(self):
         """Check if mentor can accept more mentees"""
         return self.get_current_mentees_count() < self.mentoring_capacity
 
+    def count_active_mentees(self):
+        """Count accepted mentorships, the source of truth for active_mentees"""
+        return MentorshipRequest.objects.filter(mentor=self.user, status='accepted').count()
+
+    @classmethod
+    @contextmanager
+    def capacity_guard(cls):
+        """Transaction for capacity changes, serialized per process on SQLite."""
+        if connection.vendor == 'sqlite':
+            with _sqlite_capacity_lock, transaction.atomic():
+                yield
+        else:
+            with transaction.atomic():
+                yield
+
+    @classmethod
+    def record_status_change(cls, mentor_id, old_status, new_status):
+        """
+        Move the mentor's active_mentees counter when a request enters or
+        leaves 'accepted'. Call it in the capacity_guard() transaction that
+        saves the status. Returns False, changing nothing, if the request is
+        being accepted and the mentor is full.
+
+        Accepting checks capacity and takes the slot in one conditional
+        UPDATE, which holds the row lock on Postgres and the write lock on
+        SQLite, so concurrent accepts can never oversubscribe the mentor.
+        """
+        delta = (new_status == 'accepted') - (old_status == 'accepted')
+        if not delta:
+            return True
+        profiles = cls.objects.filter(user_id=mentor_id)
+        if delta > 0:
+            return profiles.filter(active_mentees__lt=F('mentoring_capacity')).update(
+                active_mentees=F('active_mentees') + 1
+            ) == 1
+        profiles.update(active_mentees=F('active_mentees') - 1)
+        return True
+
 
 class MentorshipRequest(models.Model):
     """Model for mentorship requests from students to mentors"""
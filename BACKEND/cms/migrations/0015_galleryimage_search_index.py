@@ -0,0 +1,54 @@
+from django.db import migrations
+
+
+# Frozen copy of the index definitions: cms.search may change after this
+# migration, but the schema it creates may not. Model name -> indexed columns.
+APP_LABEL = "cms"
+INDEXED_FIELDS = {
+    "GalleryImage": ["title", "description", "people_tagged", "special_guests"],
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for model_name, fields in INDEXED_FIELDS.items():
+        model = apps.get_model(APP_LABEL, model_name)
+        table = model._meta.db_table
+        columns = ", ".join(fields)
+        if vendor == "sqlite":
+            # FTS5 table holding a copy of the columns, rowid = primary key
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts "
+                f"USING fts5({columns}, tokenize='unicode61 remove_diacritics 2', prefix='2 3 4')"
+            )
+            schema_editor.execute(
+                f"INSERT INTO {table}_fts (rowid, {columns}) "
+                f"SELECT {model._meta.pk.column}, {columns} FROM {table}"
+            )
+        elif vendor == "postgresql":
+            vector = " || ' ' || ".join(f"coalesce(\"{field}\", '')" for field in fields)
+            schema_editor.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_fts_gin "
+                f"ON {table} USING gin (to_tsvector('simple', {vector}))"
+            )
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for model_name in INDEXED_FIELDS:
+        table = apps.get_model(APP_LABEL, model_name)._meta.db_table
+        if vendor == "sqlite":
+            schema_editor.execute(f"DROP TABLE IF EXISTS {table}_fts")
+        elif vendor == "postgresql":
+            schema_editor.execute(f"DROP INDEX IF EXISTS {table}_fts_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0014_delete_blog_remove_resource_category_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.3 on 2026-10-18 12:40
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_active_mentees(apps, schema_editor):
+    MentorProfile = apps.get_model('cms', 'MentorProfile')
+    MentorshipRequest = apps.get_model('cms', 'MentorshipRequest')
+    counts = (
+        MentorshipRequest.objects.filter(status='accepted')
+        .values('mentor_id')
+        .annotate(count=Count('id'))
+    )
+    for row in counts:
+        MentorProfile.objects.filter(user_id=row['mentor_id']).update(active_mentees=row['count'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0015_galleryimage_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mentorprofile',
+            name='active_mentees',
+            field=models.IntegerField(default=0, help_text='Accepted mentorships, maintained on status changes'),
+        ),
+        migrations.RunPython(backfill_active_mentees, migrations.RunPython.noop),
+    ]
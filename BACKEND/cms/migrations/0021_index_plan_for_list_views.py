@@ -0,0 +1,68 @@
+# Generated by Django 5.1.3 on 2026-10-18 13:20
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0020_updated_at_for_conditional_lists'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['-date'], name='cms_event_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(django.db.models.functions.text.Lower('event_type'), models.OrderBy(models.F('id'), descending=True), name='cms_event_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(django.db.models.functions.text.Lower('location'), models.OrderBy(models.F('id'), descending=True), name='cms_event_location_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(condition=models.Q(('is_public', True)), fields=['-priority', '-event_date', '-created_at', '-id'], name='cms_gallery_public_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(condition=models.Q(('is_public', True)), fields=['category'], name='cms_gallery_public_cat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-posted_date'], name='cms_job_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(django.db.models.functions.text.Lower('jobType'), models.OrderBy(models.F('posted_date'), descending=True), name='cms_job_type_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(django.db.models.functions.text.Lower('location'), models.OrderBy(models.F('posted_date'), descending=True), name='cms_job_location_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(django.db.models.functions.text.Lower('company'), models.OrderBy(models.F('posted_date'), descending=True), name='cms_job_company_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['salary'], name='cms_job_salary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['experience'], name='cms_job_experience_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsfeed',
+            index=models.Index(fields=['-date_posted'], name='cms_newsfeed_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsfeed',
+            index=models.Index(django.db.models.functions.text.Lower('type'), models.OrderBy(models.F('date_posted'), descending=True), name='cms_newsfeed_type_posted_idx'),
+        ),
+    ]
@@ -0,0 +1,119 @@
+# Generated by Django 5.1.3 on 2026-10-18 13:22
+
+from django.db import migrations, models
+
+NORMALIZED_FIELDS = {
+    'Job': {'job_type_norm': 'jobType', 'location_norm': 'location', 'company_norm': 'company'},
+    'Event': {'event_type_norm': 'event_type', 'location_norm': 'location'},
+    'NewsFeed': {'type_norm': 'type'},
+}
+
+
+def normalize(value):
+    # Frozen copy of cms.normalization.normalize as of this migration
+    if value is None:
+        return ""
+    return " ".join(str(value).split()).casefold()
+
+
+def backfill_normalized_fields(apps, schema_editor):
+    for model_name, fields in NORMALIZED_FIELDS.items():
+        model = apps.get_model('cms', model_name)
+        rows = []
+        for row in model.objects.only('id', *fields.values()).iterator(chunk_size=2000):
+            for target, source in fields.items():
+                setattr(row, target, normalize(getattr(row, source)))
+            rows.append(row)
+            if len(rows) == 2000:
+                model.objects.bulk_update(rows, list(fields))
+                rows = []
+        model.objects.bulk_update(rows, list(fields))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0021_index_plan_for_list_views'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='event',
+            name='cms_event_type_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='event',
+            name='cms_event_location_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='job',
+            name='cms_job_type_posted_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='job',
+            name='cms_job_location_posted_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='job',
+            name='cms_job_company_posted_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='newsfeed',
+            name='cms_newsfeed_type_posted_idx',
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='event_type_norm',
+            field=models.CharField(default='', editable=False, max_length=50),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='location_norm',
+            field=models.CharField(default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='company_norm',
+            field=models.CharField(default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='job_type_norm',
+            field=models.CharField(default='', editable=False, max_length=50),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='location_norm',
+            field=models.CharField(default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='newsfeed',
+            name='type_norm',
+            field=models.CharField(default='', editable=False, max_length=50),
+        ),
+        migrations.RunPython(backfill_normalized_fields, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['event_type_norm', '-id'], name='cms_event_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['location_norm', '-id'], name='cms_event_location_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['job_type_norm', '-posted_date'], name='cms_job_type_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['location_norm', '-posted_date'], name='cms_job_location_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['company_norm', '-posted_date'], name='cms_job_company_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsfeed',
+            index=models.Index(fields=['type_norm', '-date_posted'], name='cms_newsfeed_type_posted_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0023_list_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['updated_at'], name='cms_event_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['updated_at'], name='cms_job_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsfeed',
+            index=models.Index(fields=['updated_at'], name='cms_newsfeed_updated_idx'),
+        ),
+    ]
@@ -1,13 +1,15 @@
 from django.db import models
 from django.utils import timezone
 from django.contrib.auth.models import User
-from django.db.models import JSONField
+from django.db.models import JSONField, Q
+
+from .normalization import NormalizedFieldsMixin
 
 
 # Create your models here.
 
 
-class Job(models.Model):
+class Job(NormalizedFieldsMixin, models.Model):
     FULL_TIME = "Full-Time"
     PART_TIME = "Part-Time"
     REMOTE = "Remote"
@@ -31,6 +33,31 @@ class Job(models.Model):
     experience = models.IntegerField(default=0, null=True, blank=True)
     salary = models.DecimalField(max_digits=10, decimal_places=2, default=0.0)
     email = models.EmailField(null=True, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+    # Normalized copies for the case-insensitive filters (see cms/normalization.py)
+    job_type_norm = models.CharField(max_length=50, default="", editable=False)
+    location_norm = models.CharField(max_length=255, default="", editable=False)
+    company_norm = models.CharField(max_length=255, default="", editable=False)
+
+    normalized_fields = {
+        "job_type_norm": "jobType",
+        "location_norm": "location",
+        "company_norm": "company",
+    }
+
+    class Meta:
+        # Mirrors JobViewSet: each filter with the default ordering, plus
+        # the other orderings it accepts
+        indexes = [
+            models.Index(fields=["-posted_date"], name="cms_job_posted_idx"),
+            models.Index(fields=["job_type_norm", "-posted_date"], name="cms_job_type_posted_idx"),
+            models.Index(fields=["location_norm", "-posted_date"], name="cms_job_location_posted_idx"),
+            models.Index(fields=["company_norm", "-posted_date"], name="cms_job_company_posted_idx"),
+            models.Index(fields=["salary"], name="cms_job_salary_idx"),
+            models.Index(fields=["experience"], name="cms_job_experience_idx"),
+            # MAX(updated_at) versions the list for conditional requests
+            models.Index(fields=["updated_at"], name="cms_job_updated_idx"),
+        ]
 
     def __str__(self):
         return self.job_title
@@ -44,23 +71,51 @@ class Role(models.Model):
         return self.role_name
 
 
-class NewsFeed(models.Model):
+class NewsFeed(NormalizedFieldsMixin, models.Model):
     title = models.CharField(max_length=255)
     content = models.TextField()
     date_posted = models.DateTimeField(auto_now_add=True)
     type = models.CharField(max_length=50)
+    updated_at = models.DateTimeField(auto_now=True)
+    type_norm = models.CharField(max_length=50, default="", editable=False)
+
+    normalized_fields = {"type_norm": "type"}
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-date_posted"], name="cms_newsfeed_posted_idx"),
+            models.Index(fields=["type_norm", "-date_posted"], name="cms_newsfeed_type_posted_idx"),
+            models.Index(fields=["updated_at"], name="cms_newsfeed_updated_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
 
-class Event(models.Model):
+class Event(NormalizedFieldsMixin, models.Model):
     event_name = models.CharField(max_length=255)
     date = models.DateTimeField()
     event_type = models.CharField(max_length=50)
     location = models.CharField(max_length=255)
     description = models.TextField()
     image = models.ImageField(upload_to='event_images/', null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    event_type_norm = models.CharField(max_length=50, default="", editable=False)
+    location_norm = models.CharField(max_length=255, default="", editable=False)
+
+    normalized_fields = {
+        "event_type_norm": "event_type",
+        "location_norm": "location",
+    }
+
+    class Meta:
+        # EventViewSet lists newest first by id and orders on date on request
+        indexes = [
+            models.Index(fields=["-date"], name="cms_event_date_idx"),
+            models.Index(fields=["event_type_norm", "-id"], name="cms_event_type_idx"),
+            models.Index(fields=["location_norm", "-id"], name="cms_event_location_idx"),
+            models.Index(fields=["updated_at"], name="cms_event_updated_idx"),
+        ]
 
     def __str__(self):
         return self.event_name
@@ -347,6 +402,7 @@ class GalleryTag(models.Model):
     is_featured = models.BooleanField(default=False, help_text="Show in featured tags")
     
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['tag_type', 'name']
@@ -393,6 +449,10 @@ class GalleryImage(models.Model):
     description = models.TextField(blank=True, null=True)
     image = models.ImageField(upload_to='gallery/images/')
     thumbnail = models.ImageField(upload_to='gallery/thumbnails/', blank=True, null=True)
+    # Filled in off the request path by cms/image_variants.py
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    variants = JSONField(default=dict, blank=True, help_text="Resized copies of the image, by width and format")
     
     # Organization
     album = models.ForeignKey(GalleryAlbum, on_delete=models.CASCADE, related_name='images', blank=True, null=True)
@@ -425,6 +485,14 @@ class GalleryImage(models.Model):
     
     class Meta:
         ordering = ['-priority', '-event_date', '-created_at']
+        # Only public images are ever listed, so the list indexes skip the rest
+        indexes = [
+            models.Index(
+                fields=['-priority', '-event_date', '-created_at', '-id'],
+                condition=Q(is_public=True), name='cms_gallery_public_order_idx',
+            ),
+            models.Index(fields=['category'], condition=Q(is_public=True), name='cms_gallery_public_cat_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -0,0 +1,39 @@
+def normalize(value):
+    """
+    Comparison form of a filterable string: whitespace runs collapsed and
+    Unicode case folded. Unlike SQL ``LOWER()``, which only folds ASCII on
+    SQLite, this also matches "ZÜRICH" to "Zürich".
+    """
+    if value is None:
+        return ""
+    return " ".join(str(value).split()).casefold()
+
+
+class NormalizedFieldsMixin:
+    """
+    Keeps indexed shadow columns holding ``normalize()`` of other columns, so
+    case-insensitive filters become plain equality on a B-tree index.
+
+    ``normalized_fields`` maps each shadow column to its source column. They
+    are filled on every ``save()``, including saves limited to the source
+    by ``update_fields``. ``bulk_create()`` and ``update()`` skip ``save()``:
+    call ``normalize_fields()`` on the objects first, or write the shadow
+    columns in the same ``update()``.
+    """
+
+    normalized_fields = {}
+
+    def normalize_fields(self):
+        for target, source in self.normalized_fields.items():
+            setattr(self, target, normalize(getattr(self, source)))
+
+    def save(self, *args, **kwargs):
+        self.normalize_fields()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            update_fields |= {
+                target for target, source in self.normalized_fields.items() if source in update_fields
+            }
+            kwargs["update_fields"] = update_fields
+        super().save(*args, **kwargs)
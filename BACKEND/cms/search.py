@@ -0,0 +1,307 @@
+import re
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, CharField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce, Substr
+from django.utils.html import escape
+from rest_framework import filters
+
+# Control characters mark the matches in highlights, so the stored text can
+# be HTML-escaped before they become <mark> tags (see format_highlight)
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+HIGHLIGHT_LENGTH = 200
+
+
+def search_terms(query):
+    """Split free text into the word tokens understood by every backend."""
+    return re.findall(r"\w+", query or "")[:16]
+
+
+def format_highlight(text):
+    """HTML for a ``search_highlight`` annotation: escaped, matches in <mark>."""
+    if text is None:
+        return None
+    return escape(text).replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_STOP, "</mark>")
+
+
+class SearchBackend:
+    """Fallback backend: OR-chained icontains scans, unranked."""
+
+    vendor = None
+
+    def rebuild(self, index):
+        pass
+
+    def update(self, index, instance):
+        pass
+
+    def delete(self, index, pk):
+        pass
+
+    @staticmethod
+    def no_results(queryset, highlight=None):
+        queryset = queryset.annotate(search_rank=RawSQL("0", [], output_field=FloatField()))
+        if highlight:
+            queryset = queryset.annotate(search_highlight=Value("", output_field=CharField()))
+        return queryset.none()
+
+    def highlight(self, index, field, query):
+        """Expression for an excerpt of ``field`` with the matches marked."""
+        # No match positions without an index: just the start of the text
+        return Substr(Coalesce(field, Value("")), 1, HIGHLIGHT_LENGTH)
+
+    def search(self, index, queryset, query, highlight=None):
+        terms = search_terms(query)
+        if not terms:
+            return self.no_results(queryset, highlight)
+        condition = Q()
+        for term in terms:
+            term_condition = Q()
+            for field in index.fields:
+                term_condition |= Q(**{f"{field}__icontains": term})
+            condition &= term_condition
+        queryset = queryset.filter(condition).annotate(
+            search_rank=RawSQL("0", [], output_field=FloatField())
+        )
+        if highlight:
+            queryset = queryset.annotate(search_highlight=self.highlight(index, highlight, query))
+        return queryset
+
+
+class SQLiteFTSBackend(SearchBackend):
+    """
+    SQLite FTS5 virtual table holding a copy of the indexed columns, with the
+    rowid equal to the model's primary key. Rank is ``-bm25`` so that higher
+    is better, like on Postgres. Migrations create the tables.
+    """
+
+    vendor = "sqlite"
+
+    def rebuild(self, index):
+        columns = ", ".join(index.fields)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {index.table}")
+            cursor.execute(
+                f"INSERT INTO {index.table} (rowid, {columns}) "
+                f"SELECT {index.pk_column}, {columns} FROM {index.source_table}"
+            )
+
+    def update(self, index, instance):
+        columns = ", ".join(index.fields)
+        placeholders = ", ".join(["%s"] * (len(index.fields) + 1))
+        values = [getattr(instance, field) or "" for field in index.fields]
+        with connection.cursor() as cursor:
+            # FTS5 honours REPLACE on the rowid, dropping the old row's tokens
+            cursor.execute(
+                f"INSERT OR REPLACE INTO {index.table} (rowid, {columns}) VALUES ({placeholders})",
+                [instance.pk, *values],
+            )
+
+    def delete(self, index, pk):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {index.table} WHERE rowid = %s", [pk])
+
+    @staticmethod
+    def match_expression(query):
+        # Quote every token so user input cannot inject FTS5 syntax, and match
+        # on prefixes so the gallery search box works while typing
+        return " ".join(f'"{term}"*' for term in search_terms(query))
+
+    def highlight(self, index, field, query):
+        # snippet() reads the match positions of the joined FTS row
+        return RawSQL(
+            f'snippet("{index.table}", %s, %s, %s, %s, 24)',
+            [index.fields.index(field), HIGHLIGHT_START, HIGHLIGHT_STOP, "…"],
+            output_field=CharField(),
+        )
+
+    def search(self, index, queryset, query, highlight=None):
+        match = self.match_expression(query)
+        if not match:
+            return self.no_results(queryset, highlight)
+        # Join the FTS table once so bm25 is computed while walking the match
+        # doclist, rather than re-running MATCH in a per-row subquery
+        pk = f'"{index.source_table}"."{index.pk_column}"'
+        queryset = queryset.extra(
+            tables=[index.table],
+            where=[f'"{index.table}".rowid = {pk}', f'"{index.table}" MATCH %s'],
+            params=[match],
+        ).annotate(
+            search_rank=RawSQL(f'-"{index.table}".rank', [], output_field=FloatField())
+        )
+        if highlight:
+            queryset = queryset.annotate(search_highlight=self.highlight(index, highlight, query))
+        return queryset
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Postgres full-text search over an expression GIN index, created by the
+    migrations. Queries repeat the indexed ``to_tsvector`` expression
+    verbatim so the planner can use it.
+    """
+
+    vendor = "postgresql"
+    config = "simple"
+
+    def vector_sql(self, index, table=None):
+        prefix = f'"{table}".' if table else ""
+        columns = " || ' ' || ".join(
+            f"coalesce({prefix}\"{field}\", '')" for field in index.fields
+        )
+        return f"to_tsvector('{self.config}', {columns})"
+
+    @staticmethod
+    def tsquery(query):
+        return " & ".join(f"{term}:*" for term in search_terms(query))
+
+    def highlight(self, index, field, query):
+        return RawSQL(
+            f"ts_headline('{self.config}', coalesce(\"{index.source_table}\".\"{field}\", ''), "
+            f"to_tsquery('{self.config}', %s), %s)",
+            [
+                self.tsquery(query),
+                f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords=24, MinWords=8",
+            ],
+            output_field=CharField(),
+        )
+
+    def search(self, index, queryset, query, highlight=None):
+        tsquery = self.tsquery(query)
+        if not tsquery:
+            return self.no_results(queryset, highlight)
+        vector = self.vector_sql(index, index.source_table)
+        queryset = queryset.filter(
+            RawSQL(
+                f"{vector} @@ to_tsquery('{self.config}', %s)",
+                [tsquery],
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"ts_rank({vector}, to_tsquery('{self.config}', %s))",
+                [tsquery],
+                output_field=FloatField(),
+            )
+        )
+        if highlight:
+            queryset = queryset.annotate(search_highlight=self.highlight(index, highlight, query))
+        return queryset
+
+
+BACKENDS = {
+    backend.vendor: backend for backend in (SQLiteFTSBackend(), PostgresSearchBackend())
+}
+
+
+def get_backend():
+    """Pick the backend for the default database unless SEARCH_BACKEND says otherwise."""
+    choice = getattr(settings, "SEARCH_BACKEND", "auto")
+    if choice == "auto":
+        choice = connection.vendor
+    return BACKENDS.get(choice, SearchBackend())
+
+
+class SearchIndex:
+    """
+    Full-text index over some text fields of a model.
+
+    Results are annotated with ``search_rank`` (higher is better). The FTS
+    table or GIN index is created by a migration, which must repeat the
+    ``fields`` used here. The index is kept in sync by the post_save/post_delete receivers in ``cms.signals``;
+    writes that bypass signals (``bulk_create``, ``update()``) must be
+    followed by ``manage.py rebuild_search_index``.
+    """
+
+    def __init__(self, model_label, fields):
+        self.model_label = model_label
+        self.fields = list(fields)
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    @property
+    def source_table(self):
+        return self.model._meta.db_table
+
+    @property
+    def pk_column(self):
+        return self.model._meta.pk.column
+
+    @property
+    def table(self):
+        return f"{self.source_table}_fts"
+
+    def rebuild(self):
+        get_backend().rebuild(self)
+
+    def update(self, instance):
+        get_backend().update(self, instance)
+
+    def delete(self, pk):
+        get_backend().delete(self, pk)
+
+    def search(self, queryset, query, highlight=None):
+        """
+        Filter ``queryset`` to the matches of ``query``. ``highlight`` names
+        one of the indexed fields to excerpt into ``search_highlight``.
+        """
+        return get_backend().search(self, queryset, query, highlight)
+
+
+gallery_image_index = SearchIndex(
+    "cms.GalleryImage", ["title", "description", "people_tagged", "special_guests"]
+)
+job_index = SearchIndex("cms.Job", ["job_title", "company", "description", "location"])
+event_index = SearchIndex("cms.Event", ["event_name", "description", "location", "event_type"])
+newsfeed_index = SearchIndex("cms.NewsFeed", ["title", "content", "type"])
+post_index = SearchIndex("cms.Post", ["post"])
+user_info_index = SearchIndex("authorization.UserInfo", ["first_name", "last_name", "email"])
+
+SEARCH_INDEXES = [gallery_image_index, job_index, event_index, newsfeed_index, post_index, user_info_index]
+
+
+def index_for_model(model):
+    for index in SEARCH_INDEXES:
+        if index.model_label.lower() == model._meta.label_lower:
+            return index
+    return None
+
+
+class IndexedSearchFilter(filters.SearchFilter):
+    """
+    ``SearchFilter`` served by the view's ``search_index`` instead of
+    ``icontains`` scans over ``search_fields``. Views without an index fall
+    back to ``SearchFilter``. ``search_highlight_field`` adds an excerpt of
+    that field to each match (see :class:`HighlightedSerializerMixin`).
+
+    Matches come best first unless the client asks for an ``ordering``, so
+    list it after ``OrderingFilter`` in ``filter_backends``.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        index = getattr(view, "search_index", None)
+        if index is None:
+            return super().filter_queryset(request, queryset, view)
+        query = request.query_params.get(self.search_param, "").strip()
+        if not query:
+            return queryset
+        queryset = index.search(queryset, query, getattr(view, "search_highlight_field", None))
+        if filters.OrderingFilter.ordering_param not in request.query_params:
+            queryset = queryset.order_by("-search_rank", "-pk")
+        return queryset
+
+
+class HighlightedSerializerMixin:
+    """Adds ``highlight`` (HTML) to instances that come from a highlighted search."""
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if hasattr(instance, "search_highlight"):
+            data["highlight"] = format_highlight(instance.search_highlight)
+        return data
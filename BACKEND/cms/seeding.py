@@ -0,0 +1,297 @@
+import random
+from datetime import timedelta
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from authorization.models import UserInfo
+from .mentorship_models import MentorProfile, MentorshipRequest
+from .models import Event, Job, Role
+from .normalization import NormalizedFieldsMixin
+from .search import SEARCH_INDEXES
+
+
+POSITIONS = [
+    'Software Engineer', 'Senior Software Engineer', 'Tech Lead', 'Engineering Manager',
+    'Product Manager', 'Data Scientist', 'DevOps Engineer', 'Full Stack Developer',
+    'Backend Developer', 'Frontend Developer', 'QA Engineer', 'Business Analyst',
+]
+SKILLS = [
+    'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'Django', 'Docker', 'Kubernetes',
+    'AWS', 'Azure', 'Machine Learning', 'SQL', 'PostgreSQL', 'Git', 'Linux', 'REST APIs',
+]
+INTERESTS = [
+    'Artificial Intelligence', 'Machine Learning', 'Web Development', 'Mobile Development',
+    'Cloud Computing', 'DevOps', 'Data Science', 'Cybersecurity', 'Blockchain', 'Fintech',
+]
+GOALS = [
+    'I want to improve my coding skills and learn industry best practices.',
+    'Looking for guidance on a career path in data science and machine learning.',
+    'Looking for guidance on preparing for technical interviews at top tech companies.',
+    'Need help understanding cloud technologies and DevOps practices.',
+]
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class BulkLoader:
+    """
+    Generates large deterministic datasets for load testing.
+
+    Rows are built lazily and written with ``bulk_create`` one chunk per
+    transaction, so memory stays flat and a failure only loses the current
+    chunk. The password is hashed once and the hash shared by every user,
+    and all randomness comes from one ``random.Random(seed)``, so the same
+    seed on an empty database always produces the same rows.
+
+    ``bulk_create`` skips ``save()`` and signals; the mentor counters are
+    therefore computed here rather than by ``record_status_change``, the
+    normalized filter columns are filled before each insert, and the
+    full-text indexes are rebuilt once the load is done.
+
+    ``names`` is the populate command, which supplies the INDIAN_* name,
+    company and city lists.
+    """
+
+    PASSWORD = 'password123'
+
+    def __init__(self, names, seed=0, chunk_size=2000, stdout=None):
+        self.names = names
+        self.rng = random.Random(seed)
+        self.chunk_size = chunk_size
+        self.stdout = stdout
+        self.password_hash = make_password(self.PASSWORD)
+        self.now = timezone.now()
+
+    def log(self, message):
+        if self.stdout is not None:
+            self.stdout.write(message)
+
+    def bulk_create(self, model, objects):
+        """Insert ``objects`` chunk by chunk and return the primary keys."""
+        pks = []
+        for chunk in chunked(objects, self.chunk_size):
+            if issubclass(model, NormalizedFieldsMixin):
+                for obj in chunk:
+                    obj.normalize_fields()
+            with transaction.atomic():
+                model.objects.bulk_create(chunk, batch_size=self.chunk_size)
+            pks.extend(obj.pk for obj in chunk)
+        return pks
+
+    def run(self, scale):
+        """
+        Create ``scale`` users plus jobs, events, mentors and mentorship
+        requests in the proportions of the hand-written sample data.
+        """
+        alumni_count = scale * 5 // 8
+        alumni_ids = self.populate_users('Alumni', alumni_count, self.alumni_info)
+        student_ids = self.populate_users('Student', scale - alumni_count, self.student_info)
+        self.populate_jobs(scale // 2)
+        self.populate_events(scale // 4)
+        self.populate_mentorships(alumni_ids[: len(alumni_ids) // 2], student_ids)
+        self.rebuild_search_indexes()
+
+    def rebuild_search_indexes(self):
+        """Sync every full-text index with the rows inserted past the signals."""
+        for index in SEARCH_INDEXES:
+            index.rebuild()
+        self.log('✅ Rebuilt the search indexes')
+
+    def populate_users(self, role_name, count, build_info):
+        role, _ = Role.objects.get_or_create(role_name=role_name)
+        # Continue after the highest existing id so reruns never collide on username
+        serial = (User.objects.aggregate(Max('id'))['id__max'] or 0) + 1
+        kind = role_name.lower()
+        user_ids = []
+        for start in range(0, count, self.chunk_size):
+            users, infos = [], []
+            for i in range(start, min(start + self.chunk_size, count)):
+                first_name = self.rng.choice(
+                    self.names.INDIAN_FIRST_NAMES_MALE + self.names.INDIAN_FIRST_NAMES_FEMALE
+                )
+                last_name = self.rng.choice(self.names.INDIAN_LAST_NAMES)
+                username = f'{first_name.lower()}.{last_name.lower()}.{kind}{serial + i}'
+                email = f'{username}@vips-tc.edu.in'
+                users.append(User(
+                    username=username, email=email, first_name=first_name,
+                    last_name=last_name, password=self.password_hash,
+                ))
+                infos.append(UserInfo(
+                    role=role, first_name=first_name, last_name=last_name, email=email,
+                    phone=f'+91 {self.rng.randint(7000000000, 9999999999)}',
+                    **build_info(username),
+                ))
+            with transaction.atomic():
+                User.objects.bulk_create(users, batch_size=self.chunk_size)
+                for user, info in zip(users, infos):
+                    info.user_id = user.pk
+                UserInfo.objects.bulk_create(infos, batch_size=self.chunk_size)
+            user_ids.extend(user.pk for user in users)
+        self.log(f'✅ Created {count} {kind} profiles')
+        return user_ids
+
+    def alumni_info(self, username):
+        graduation_year = self.rng.randint(2015, 2023)
+        company = self.rng.choice(self.names.INDIAN_COMPANIES)
+        position = self.rng.choice(POSITIONS)
+        return {
+            'address': f'{self.rng.randint(1, 999)} MG Road, {self.rng.choice(self.names.INDIAN_CITIES)}',
+            'graduation_year': graduation_year,
+            'batch': graduation_year,
+            'current_company': company,
+            'current_position': position,
+            'skills': self.rng.sample(SKILLS, self.rng.randint(3, 8)),
+            'interests': self.rng.sample(INTERESTS, self.rng.randint(2, 5)),
+            'linkedin': f'https://linkedin.com/in/{username}',
+            'description': f'{position} at {company}.',
+        }
+
+    def student_info(self, username):
+        batch = self.rng.randint(2021, 2025)
+        return {
+            'address': f'Student Hostel, {self.rng.choice(self.names.INDIAN_CITIES)}',
+            'graduation_year': batch + 4,
+            'batch': batch,
+            'skills': self.rng.sample(SKILLS, self.rng.randint(2, 6)),
+            'interests': self.rng.sample(INTERESTS, self.rng.randint(2, 4)),
+            'description': f'Currently pursuing B.Tech at VIPS-TC, batch of {batch}.',
+        }
+
+    def populate_jobs(self, count):
+        job_types = [choice for choice, _ in Job.JOB_TYPE_CHOICES]
+
+        def jobs():
+            for _ in range(count):
+                title = self.rng.choice(POSITIONS)
+                company = self.rng.choice(self.names.INDIAN_COMPANIES)
+                domain = company.lower().replace(' ', '').replace('\'', '')[:10]
+                yield Job(
+                    job_title=title,
+                    company=company,
+                    location=self.rng.choice(self.names.INDIAN_CITIES),
+                    description=f'Exciting opportunity to work as {title} at {company}.',
+                    jobType=self.rng.choice(job_types),
+                    deadline=self.now + timedelta(days=self.rng.randint(30, 90)),
+                    experience=self.rng.randint(0, 8),
+                    salary=self.rng.randint(300000, 2500000),
+                    email=f'careers@{domain}.com',
+                )
+
+        self.bulk_create(Job, jobs())
+        self.log(f'✅ Created {count} job listings')
+
+    def populate_events(self, count):
+        event_types = ['Workshop', 'Seminar', 'Conference', 'Meetup', 'Hackathon', 'Alumni Meet']
+        venues = ['VIPS-TC Auditorium', 'Conference Hall A', 'Seminar Hall B', 'Virtual Event (Online)']
+
+        def events():
+            for i in range(count):
+                event_type = self.rng.choice(event_types)
+                yield Event(
+                    event_name=f'{event_type} #{i + 1}',
+                    date=self.now + timedelta(days=self.rng.randint(1, 180)),
+                    event_type=event_type,
+                    location=self.rng.choice(venues),
+                    description=f'Join us for a {event_type.lower()} with peers and alumni.',
+                )
+
+        self.bulk_create(Event, events())
+        self.log(f'✅ Created {count} events')
+
+    def populate_mentorships(self, mentor_ids, student_ids):
+        """
+        Create mentor profiles and about one request per two students.
+        Accepted requests never exceed a mentor's capacity, and the profiles
+        are written with counters matching the requests.
+        """
+        if not mentor_ids or not student_ids:
+            return
+        capacity = {mentor_id: self.rng.randint(2, 5) for mentor_id in mentor_ids}
+        active = dict.fromkeys(mentor_ids, 0)
+        statuses = ['pending', 'accepted', 'rejected', 'completed']
+
+        requests = []
+        for mentee_id in self.rng.sample(student_ids, len(student_ids) // 2):
+            mentor_id = self.rng.choice(mentor_ids)
+            status = self.rng.choice(statuses)
+            if status == 'accepted':
+                if active[mentor_id] >= capacity[mentor_id]:
+                    status = 'completed'
+                else:
+                    active[mentor_id] += 1
+            responded_at = None if status == 'pending' else self.now
+            requests.append(MentorshipRequest(
+                mentee_id=mentee_id, mentor_id=mentor_id, status=status,
+                goals=self.rng.choice(GOALS),
+                duration_months=self.rng.randint(2, 6),
+                preferred_communication=self.rng.choice(['video_calls', 'messaging', 'mixed']),
+                responded_at=responded_at,
+                started_at=responded_at if status in ('accepted', 'completed') else None,
+                progress_percentage=100 if status == 'completed' else 0,
+            ))
+
+        self.bulk_create(MentorProfile, (
+            MentorProfile(
+                user_id=mentor_id,
+                expertise_areas=self.rng.sample(INTERESTS, self.rng.randint(2, 4)),
+                years_experience=self.rng.randint(1, 10),
+                current_company=self.rng.choice(self.names.INDIAN_COMPANIES),
+                current_position=self.rng.choice(POSITIONS),
+                mentoring_capacity=capacity[mentor_id],
+                active_mentees=active[mentor_id],
+                bio='Happy to help students bridge academics and industry.',
+                is_approved=True,
+                approval_date=self.now,
+                average_rating=round(self.rng.uniform(4.0, 5.0), 1),
+            )
+            for mentor_id in mentor_ids
+        ))
+        self.bulk_create(MentorshipRequest, requests)
+        self.log(f'✅ Created {len(mentor_ids)} mentor profiles and {len(requests)} mentorship requests')
+
+
+class ScaledPopulateMixin:
+    """
+    ``--scale``, ``--seed`` and ``--chunk-size`` for the populate commands.
+    The command itself is passed to :class:`BulkLoader` as ``names``.
+    """
+
+    def add_scale_arguments(self, parser):
+        parser.add_argument(
+            '--scale',
+            type=int,
+            help='Bulk-load N users with proportional jobs, events and mentorships',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for --scale; the same seed gives the same data',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=2000,
+            help='Rows per bulk insert and transaction for --scale',
+        )
+
+    def populate_scaled(self, options):
+        """Bulk-load a large deterministic dataset for load testing"""
+        started = timezone.now()
+        loader = BulkLoader(
+            self, seed=options['seed'], chunk_size=options['chunk_size'], stdout=self.stdout
+        )
+        loader.run(options['scale'])
+        elapsed = (timezone.now() - started).total_seconds()
+        self.stdout.write(
+            self.style.SUCCESS(f'✅ Bulk-loaded scale {options["scale"]} in {elapsed:.1f}s')
+        )
@@ -0,0 +1,43 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.task_queue import defer
+from api.tasks import generate_gallery_derivatives
+from .caching import invalidate_gallery_categories
+from .image_variants import needs_derivatives
+from .models import GalleryCategory, GalleryImage
+from .search import SEARCH_INDEXES, index_for_model
+
+
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    index = index_for_model(sender)
+    # e.g. view count or avatar saves leave the indexed text alone
+    if update_fields and not set(update_fields) & set(index.fields):
+        return
+    index.update(instance)
+
+
+def remove_from_search_index(sender, instance, **kwargs):
+    index_for_model(sender).delete(instance.pk)
+
+
+for index in SEARCH_INDEXES:
+    # Lazy "app_label.ModelName" senders, as UserInfo lives in another app
+    post_save.connect(update_search_index, sender=index.model_label, dispatch_uid=f"search_save_{index.model_label}")
+    post_delete.connect(remove_from_search_index, sender=index.model_label, dispatch_uid=f"search_delete_{index.model_label}")
+
+
+@receiver(post_save, sender=GalleryImage)
+def queue_gallery_derivatives(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields and "image" not in update_fields):
+        return
+    if needs_derivatives(instance):
+        defer(generate_gallery_derivatives, instance.pk)
+
+
+@receiver(post_save, sender=GalleryImage)
+@receiver(post_delete, sender=GalleryImage)
+@receiver(post_save, sender=GalleryCategory)
+@receiver(post_delete, sender=GalleryCategory)
+def reset_gallery_category_counts(sender, **kwargs):
+    invalidate_gallery_categories()
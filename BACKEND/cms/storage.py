@@ -0,0 +1,106 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+
+BLOB_DIR = "blobs"
+INCOMING_DIR = f"{BLOB_DIR}/.incoming"
+
+# Callables yielding storage names kept outside FileFields (e.g. the gallery
+# variants JSON); the GC treats those names as referenced too
+_reference_providers = []
+
+
+def register_references(provider):
+    _reference_providers.append(provider)
+    return provider
+
+
+def extra_references():
+    for provider in _reference_providers:
+        yield from provider()
+
+
+def blob_name(digest, ext):
+    return f"{BLOB_DIR}/{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Stores every upload once, under the SHA-256 of its bytes:
+    ``blobs/ab/cd/abcd….jpg``. Saving identical bytes again, from any
+    field, returns the existing name instead of writing a copy.
+
+    The hash is computed while the upload is streamed into a temporary file
+    next to the blobs, which is then renamed into place; uploads Django has
+    already spooled to disk are hashed and moved without a second copy.
+
+    ``delete()`` never removes a blob, since several rows may point at it;
+    ``manage.py gc_media`` finds the references in the database and removes
+    the blobs nothing points at.
+    Names outside ``blobs/`` (files stored before this backend) behave as
+    before.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # The final name comes from the content, see _save()
+        return name
+
+    def _save(self, name, content):
+        ext = os.path.splitext(name)[1].lower()
+        incoming = self.path(INCOMING_DIR)
+        os.makedirs(incoming, exist_ok=True)
+        digest = hashlib.sha256()
+
+        if hasattr(content, "temporary_file_path"):
+            # Already on disk: hash it in place and move it, no second copy
+            for chunk in content.chunks():
+                digest.update(chunk)
+            temporary_path = content.temporary_file_path()
+            moved = False
+        else:
+            fd, temporary_path = tempfile.mkstemp(dir=incoming)
+            with os.fdopen(fd, "wb") as f:
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    digest.update(chunk)
+                    f.write(chunk)
+            moved = True
+
+        name = blob_name(digest.hexdigest(), ext)
+        full_path = self.path(name)
+        try:
+            # Refresh the mtime so the GC grace period covers this save too
+            os.utime(full_path)
+            stored = True
+        except FileNotFoundError:
+            # New content, or gc_media removed the blob since it was written
+            stored = False
+        if stored:
+            if moved:
+                os.remove(temporary_path)
+        else:
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            if moved:
+                # Atomic on one filesystem; a concurrent identical upload
+                # just replaces the blob with the same bytes
+                os.replace(temporary_path, full_path)
+            else:
+                file_move_safe(temporary_path, full_path, allow_overwrite=True)
+            if self.file_permissions_mode is not None:
+                os.chmod(full_path, self.file_permissions_mode)
+        return name
+
+    def delete(self, name):
+        if not name:
+            raise ValueError("The name must be given to delete().")
+        if not name.startswith(f"{BLOB_DIR}/"):
+            return super().delete(name)
+        # Other rows may share the blob; gc_media removes it once none do
+
+    def remove_blob(self, name):
+        """Delete the file itself; only the GC calls this."""
+        super().delete(name)
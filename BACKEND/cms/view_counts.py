@@ -0,0 +1,82 @@
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db.models import Case, F, Value, When
+
+
+class GalleryViewCounter:
+    """
+    Buffers gallery image view increments in process memory and writes them
+    back to the database in a single aggregated UPDATE.
+
+    The buffer is a plain dict behind a lock, so concurrent requests never
+    lose an increment and nothing is evicted before it is written, however
+    many images are viewed. A flush is triggered at most once per
+    ``GALLERY_VIEW_COUNT_FLUSH_INTERVAL`` seconds from the read path; views
+    recorded since the last flush are lost if the process dies.
+    """
+
+    def __init__(self, flush_interval=None):
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._counts = Counter()
+        self._next_flush = 0
+
+    @property
+    def interval(self):
+        if self.flush_interval is not None:
+            return self.flush_interval
+        return getattr(settings, "GALLERY_VIEW_COUNT_FLUSH_INTERVAL", 60)
+
+    def record(self, image_ids):
+        """Buffer one view for each image id and return the pending counts."""
+        now = time.monotonic()
+        with self._lock:
+            self._counts.update(image_ids)
+            pending = {image_id: self._counts[image_id] for image_id in image_ids}
+            due = now >= self._next_flush
+            if due:
+                self._next_flush = now + self.interval
+
+        if due:
+            self.flush()
+        return pending
+
+    def pending_counts(self, image_ids):
+        """Return the buffered, not yet persisted views for the given images."""
+        with self._lock:
+            return {image_id: self._counts[image_id] for image_id in image_ids if image_id in self._counts}
+
+    def flush(self):
+        """Persist every buffered view in one UPDATE and return the rows touched."""
+        from cms.models import GalleryImage
+
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        if not counts:
+            return 0
+
+        increment = Case(
+            *[When(id=image_id, then=Value(count)) for image_id, count in counts.items()],
+            default=Value(0),
+        )
+        try:
+            return GalleryImage.objects.filter(id__in=counts).update(
+                view_count=F("view_count") + increment
+            )
+        except Exception:
+            # Keep the views for the next flush
+            with self._lock:
+                self._counts.update(counts)
+            raise
+
+    def reset(self):
+        """Drop the buffer without writing it and reopen the flush window."""
+        with self._lock:
+            self._counts.clear()
+            self._next_flush = 0
+
+
+gallery_view_counter = GalleryViewCounter()
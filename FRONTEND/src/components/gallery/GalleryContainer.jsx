@@ -37,6 +37,20 @@ const GalleryContainer = () => {
   const [featuredTags, setFeaturedTags] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  const baseUrl = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8001/api/v1';
+
+  // Build query parameters
+  const buildImageParams = (cursor) => {
+    const params = new URLSearchParams();
+    if (selectedCategory !== 'all') params.append('category', selectedCategory);
+    if (selectedTag !== 'all') params.append('tag', selectedTag);
+    if (searchTerm) params.append('search', searchTerm);
+    if (cursor) params.append('cursor', cursor);
+    return params;
+  };
 
   // API calls
   const fetchGalleryData = async () => {
@@ -44,16 +58,9 @@ const GalleryContainer = () => {
       setLoading(true);
       setError(null);
       
-      // Build query parameters
-      const params = new URLSearchParams();
-      if (selectedCategory !== 'all') params.append('category', selectedCategory);
-      if (selectedTag !== 'all') params.append('tag', selectedTag);
-      if (searchTerm) params.append('search', searchTerm);
-      
-      // Fetch images, categories, and tags in parallel
-      const baseUrl = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8001/api/v1';
+      // Fetch the first page of images, categories, and tags in parallel
       const [imagesRes, categoriesRes, tagsRes] = await Promise.all([
-        fetch(`${baseUrl}/gallery/images/?${params}`),
+        fetch(`${baseUrl}/gallery/images/?${buildImageParams()}`),
         fetch(`${baseUrl}/gallery/categories/`),
         fetch(`${baseUrl}/gallery/tags/`)
       ]);
@@ -69,6 +76,7 @@ const GalleryContainer = () => {
       ]);
       
       setImages(imagesData.results || []);
+      setNextCursor(imagesData.next_cursor || null);
       setCategories(categoriesData.results || []);
       setFeaturedTags(tagsData.results || []);
       
@@ -78,6 +86,7 @@ const GalleryContainer = () => {
       setError(`Failed to load gallery data: ${err.message}`);
       // Fallback to empty arrays
       setImages([]);
+      setNextCursor(null);
       setCategories([]);
       setFeaturedTags([]);
     } finally {
@@ -85,6 +94,26 @@ const GalleryContainer = () => {
     }
   };
 
+  // Append the next page of images
+  const loadMoreImages = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const res = await fetch(`${baseUrl}/gallery/images/?${buildImageParams(nextCursor)}`);
+      if (!res.ok) {
+        throw new Error('Failed to fetch more images');
+      }
+      const data = await res.json();
+      setImages((current) => [...current, ...(data.results || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (err) {
+      console.error('Error fetching more images:', err);
+      setError(`Failed to load more photos: ${err.message}`);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // Fetch data on component mount and when filters change
   useEffect(() => {
     fetchGalleryData();
@@ -429,6 +458,19 @@ const GalleryContainer = () => {
           </motion.div>
         )}
 
+        {/* Load More */}
+        {!loading && !error && nextCursor && (
+          <div className="text-center mt-8">
+            <button
+              onClick={loadMoreImages}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-red-600 text-white rounded-lg hover:bg-red-700 transition-colors disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load More Photos'}
+            </button>
+          </div>
+        )}
+
         {/* Empty State */}
         {!loading && !error && filteredImages.length === 0 && (
           <motion.div
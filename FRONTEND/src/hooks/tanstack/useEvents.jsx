@@ -1,6 +1,7 @@
 "use client";
 import { useMutation, useQueryClient } from "@tanstack/react-query";
 import axiosRequest from "../../lib/axiosRequest";
+import fetchCursorPages from "../../lib/fetchCursorPages";
 import { useSession } from "next-auth/react";
 
 import { useQuery } from "@tanstack/react-query";
@@ -12,9 +13,8 @@ export const useGetEvent = () => {
   return useQuery({
     queryKey: ["events"],
     queryFn: async () =>
-      await axiosRequest({
+      await fetchCursorPages({
         url: `/events/`,
-        method: "GET",
         headers: {
           Authorization: `Bearer ${session?.accessToken}`,
         },
@@ -1,6 +1,7 @@
 "use client";
 
 import axiosRequest from "../../lib/axiosRequest";
+import fetchCursorPages from "../../lib/fetchCursorPages";
 import { useMutation, useQueryClient, useQuery } from "@tanstack/react-query";
 import { useSession } from "next-auth/react";
 
@@ -11,9 +12,8 @@ export const useGetJobs = () => {
   return useQuery({
     queryKey: ["jobs"],
     queryFn: async () =>
-      await axiosRequest({
+      await fetchCursorPages({
         url: `/jobs/`,
-        method: "GET",
         headers: {
           Authorization: `Bearer ${session?.accessToken}`,
         },
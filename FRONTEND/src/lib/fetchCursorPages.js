@@ -0,0 +1,21 @@
+import axiosRequest from "./axiosRequest";
+
+// List endpoints answer one cursor page at a time; follow next_cursor
+// until the last page and return the rows as a single list response.
+const fetchCursorPages = async ({ params, ...options }) => {
+  const results = [];
+  let cursor = null;
+  do {
+    const page = await axiosRequest({
+      ...options,
+      method: "GET",
+      params: cursor ? { ...params, cursor } : params,
+    });
+    results.push(...(page?.results || []));
+    cursor = page?.next_cursor;
+  } while (cursor);
+
+  return { results };
+};
+
+export default fetchCursorPages;